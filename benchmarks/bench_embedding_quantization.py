@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: quantized embedding storage vs float cosine search.
+
+For each storage dtype (float32 / float16 / int8) reports:
+- memory footprint of the stored vectors
+- top-k search latency per query
+- recall@k against exact float64 cosine top-k
+- max absolute cosine error
+
+Vectors are synthetic clustered 768-d embeddings (mpnet-sized) by default,
+or loaded from an existing embedding cache with --from-cache.
+
+Usage:
+    python benchmarks/bench_embedding_quantization.py [--n 50000] [--queries 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from pipeline.transform.embedding_store import EmbeddingStore, STORAGE_DTYPES, normalize
+
+
+def synthetic_vectors(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    """Clustered vectors, so neighbours are close and recall is meaningful."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(n // 50, 1), dim))
+    labels = rng.integers(0, len(centers), size=n)
+    return centers[labels] + 0.35 * rng.normal(size=(n, dim))
+
+
+def exact_topk(base: np.ndarray, queries: np.ndarray, k: int):
+    scores = queries @ base.T
+    top = np.argsort(-scores, axis=1)[:, :k]
+    return top, scores
+
+
+def run(vectors: np.ndarray, n_queries: int, k: int):
+    base = normalize(vectors).astype(np.float64)
+    rng = np.random.default_rng(1)
+    q_idx = rng.choice(len(base), size=n_queries, replace=False)
+    queries = base[q_idx] + 0.05 * rng.normal(size=(n_queries, base.shape[1]))
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+    truth, exact_scores = exact_topk(base, queries, k)
+    keys = [str(i) for i in range(len(base))]
+
+    print(f"[*] {len(base)} vectors × {base.shape[1]} dims, {n_queries} queries, k={k}\n")
+    print(f"{'dtype':<9}{'memory MB':>11}{'ms/query':>10}{'recall@k':>10}{'max |Δcos|':>12}")
+
+    for dtype in STORAGE_DTYPES:
+        store = EmbeddingStore(dtype)
+        store.add(keys, base)
+        store.search(queries[0], k)  # compact + warm up
+
+        hits = 0
+        max_err = 0.0
+        start = time.perf_counter()
+        results = [store.search(q, k) for q in queries]
+        elapsed = time.perf_counter() - start
+
+        for qi, res in enumerate(results):
+            got = [int(key) for key, _ in res]
+            hits += len(set(got) & set(truth[qi]))
+            for key, score in zip(got, (s for _, s in res)):
+                max_err = max(max_err, abs(score - exact_scores[qi, key]))
+
+        print(
+            f"{dtype:<9}"
+            f"{store.nbytes / 1e6:>11.1f}"
+            f"{1000 * elapsed / n_queries:>10.2f}"
+            f"{hits / (n_queries * k):>10.4f}"
+            f"{max_err:>12.5f}"
+        )
+
+    print(f"\n(float64 lists, today's format: {base.nbytes / 1e6:.1f} MB before Python object overhead)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--n", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--from-cache", type=Path, help="embedding cache .npz to use instead of synthetic data")
+    args = parser.parse_args()
+
+    if args.from_cache:
+        store = EmbeddingStore.load(args.from_cache)
+        vectors = np.stack([store.get(k) for k in store.keys()])
+    else:
+        vectors = synthetic_vectors(args.n, args.dim)
+
+    run(vectors, min(args.queries, len(vectors)), args.k)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Load test: the gold LLM stages against the local mock server.
+
+Runs the same generation code the jobs use, over synthetic movies, with
+an OpenAI client pointed at benchmarks/mock_llm_server.py:
+
+- premises            packed requests + retry scheduler
+- character anchors   packed requests + retry scheduler
+- genre axes          one request per movie
+- critic summaries    streamed, early abort + retry scheduler
+- emotional capsules  streamed, early abort + retry scheduler
+- thematic capsules   async fan-out, once per --concurrency level
+
+Reports per stage: wall time, movies/s, requests seen by the server
+(429s, malformed, invalid, cancelled streams) and movies still flagged.
+
+Usage:
+    python benchmarks/bench_llm_pipeline.py [--movies 200] [--latency-ms 50 --jitter-ms 20]
+    python benchmarks/bench_llm_pipeline.py --rate-limit 0.05 --malformed 0.05 --invalid 0.2 --concurrency 1,8,32
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from benchmarks.mock_llm_server import add_fault_args, config_from_args, start_server
+from pipeline.transform.axis_generator import generate_axes
+from pipeline.transform.axis_ontology import GENRE_AXIS_RULES
+from pipeline.transform.character_anchor_extractor import (
+    extract_character_anchors,
+    extract_character_anchors_packed,
+)
+from pipeline.transform.character_anchor_validator import validate_character_anchors
+from pipeline.transform.critic_extractor import StageLatency, agenerate_all
+from pipeline.transform.critic_generator import stream_critic_summary
+from pipeline.transform.critic_validator import validate_critic_summary
+from pipeline.transform.emotional_capsule_generator import stream_emotional_capsules
+from pipeline.transform.emotional_capsule_validator import validate_emotional_capsules
+from pipeline.transform.packing import run_packed
+from pipeline.transform.premise_generator import generate_premise, generate_premises_packed
+from pipeline.transform.premise_validator import validate_premise
+from pipeline.transform.retry_scheduler import Aborted, RetryScheduler
+
+from jobs.transform.build_emotional_capsules import parse_capsules
+
+
+def synthetic_movies(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    genres = sorted(GENRE_AXIS_RULES)
+    movies = []
+    for i in range(n):
+        picked = rng.sample(genres, rng.randint(1, 2))
+        movies.append({
+            "movie_id": i + 1,
+            "title": f"Synthetic Movie {i + 1}",
+            "overview": "A crew faces a threat far from home and must decide who to save.",
+            "genres": [{"name": g} for g in picked],
+            "validated_reviews": [],
+        })
+    return movies
+
+
+class StageRun:
+    """Times a stage and diffs the server counters around it."""
+
+    def __init__(self, server, name: str, movies: int):
+        self.server, self.name, self.movies = server, name, movies
+
+    def __enter__(self):
+        self.before = self.server.stats.snapshot()
+        self.start = time.perf_counter()
+        self.flagged = 0
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        after = self.server.stats.snapshot()
+        d = {k: after.get(k, 0) - self.before.get(k, 0)
+             for k in ("requests", "rate_limited", "malformed", "invalid", "cancelled")}
+        print(
+            f"  {self.name:<24} {elapsed:>7.2f}s {self.movies / elapsed:>8.1f}/s "
+            f"{d['requests']:>6} {d['rate_limited']:>5} {d['malformed']:>5} {d['invalid']:>5} "
+            f"{d['cancelled']:>6} {self.flagged:>7}"
+        )
+
+
+def flagged(scheduler: RetryScheduler) -> int:
+    return sum(not o.valid for o in scheduler.outcomes.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--movies", type=int, default=200)
+    parser.add_argument("--concurrency", default="1,8,32", help="levels for the async thematic stage")
+    parser.add_argument("--max-retries", type=int, default=5, help="OpenAI client retries (429 / 5xx)")
+    add_fault_args(parser)
+    parser.set_defaults(latency_ms=50.0, jitter_ms=20.0)
+    args = parser.parse_args()
+
+    from openai import AsyncOpenAI, OpenAI
+
+    server = start_server(config_from_args(args))
+    client = OpenAI(base_url=server.base_url, api_key="mock", max_retries=args.max_retries)
+    movies = synthetic_movies(args.movies, args.seed)
+
+    print(f"[+] Mock server {server.base_url}: {args.movies} movies, latency {args.latency_ms:.0f}±{args.jitter_ms:.0f}ms, "
+          f"429 {args.rate_limit:.0%}, malformed {args.malformed:.0%}, invalid {args.invalid:.0%}")
+    print(f"  {'stage':<24} {'wall':>8} {'movies/s':>9} {'reqs':>6} {'429':>5} {'bad':>5} {'inv':>5} {'cancel':>6} {'flagged':>7}")
+
+    # ---------- premises ----------
+    with StageRun(server, "premises (packed)", len(movies)) as run:
+        premises = RetryScheduler(
+            generate=lambda m: generate_premise(client, m["title"], m["overview"]),
+            validate=lambda m, p: validate_premise(p, m["genres"]),
+        )
+        run_packed(movies, lambda batch: generate_premises_packed(client, batch), premises)
+        run.flagged = flagged(premises)
+
+    for m in movies:
+        m["premise"] = premises.outcomes[m["movie_id"]].output or ""
+
+    # ---------- anchors ----------
+    with StageRun(server, "anchors (packed)", len(movies)) as run:
+        anchors = RetryScheduler(
+            generate=lambda m: extract_character_anchors(client, m["title"], m["premise"]),
+            validate=lambda m, a: (True, "pass") if validate_character_anchors(a) else (False, "no_valid_anchors"),
+        )
+        run_packed(movies, lambda batch: extract_character_anchors_packed(client, batch), anchors)
+        run.flagged = flagged(anchors)
+
+    # ---------- axes ----------
+    with StageRun(server, "genre axes", len(movies)) as run:
+        for m in movies:
+            axes = generate_axes(client, m["title"], m["premise"], [g["name"] for g in m["genres"]])
+            m["axes"] = axes["primary"] + ([axes["secondary"]] if axes["secondary"] else [])
+            run.flagged += axes["status"] != "pass"
+
+    ready = [m for m in movies if m["premise"] and m["axes"]]
+
+    # ---------- critic summaries ----------
+    with StageRun(server, "critic summaries (stream)", len(ready)) as run:
+        critics = RetryScheduler(
+            generate=lambda m: stream_critic_summary(client, m["title"], m["premise"], m["axes"]),
+            validate=lambda m, text: validate_critic_summary(text),
+        )
+        critics.run(ready)
+        run.flagged = flagged(critics)
+
+    # ---------- emotional capsules ----------
+    def capsules(m):
+        raw = stream_emotional_capsules(client, m["title"], m["premise"], m["axes"])
+        if isinstance(raw, Aborted):
+            return Aborted(raw.reason, parse_capsules(raw.partial, m["axes"]))
+        return parse_capsules(raw, m["axes"])
+
+    with StageRun(server, "capsules (stream)", len(ready)) as run:
+        caps = RetryScheduler(
+            generate=capsules,
+            validate=lambda m, c: validate_emotional_capsules(c, m["axes"]),
+        )
+        caps.run(ready)
+        run.flagged = flagged(caps)
+
+    # ---------- thematic (async) ----------
+    latencies = {}
+    for level in (int(c) for c in args.concurrency.split(",")):
+        async_client = AsyncOpenAI(base_url=server.base_url, api_key="mock", max_retries=args.max_retries)
+        latency = StageLatency()
+        with StageRun(server, f"thematic async ×{level}", len(movies)) as run:
+            results = asyncio.run(agenerate_all(movies, level, latency=latency, client=async_client))
+            run.flagged = sum(r is None for r in results)
+        latencies[level] = latency
+
+    print(f"[+] Peak requests in flight at the server: {server.stats.snapshot()['peak_in_flight']}")
+    for level, latency in latencies.items():
+        print(f"[+] Thematic latency at concurrency {level}:")
+        latency.report()
+
+    for label, scheduler in (("Premises", premises), ("Critic summaries", critics), ("Capsules", caps)):
+        scheduler.report(label)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
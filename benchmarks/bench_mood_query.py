@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark: genre / axis filtering with bitmasks vs joins.
+
+Builds a synthetic catalogue in an in-memory DuckDB — movie_genres and
+movie_axes link tables plus the movie_bitsets masks the gold build emits —
+and times the same filters both ways:
+
+- any genre          EXISTS on movie_genres    vs (genre_mask & m) <> 0
+- all genres         GROUP BY / HAVING count   vs (genre_mask & m) = m
+- axes, not axis     join + anti-join          vs (axis_mask & m) = m AND (axis_mask & x) = 0
+
+Each pair must return the same movie_ids.
+
+Usage:
+    python benchmarks/bench_mood_query.py [--movies 1000000] [--repeat 5] [--threads 4]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import duckdb
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from pipeline.db.mood_query import MoodFilter, build_filter, load_bits, mask_of
+from pipeline.transform.axis_ontology import ONTOLOGY
+
+GENRES = 19    # TMDB movie genres
+
+
+def build(con, n: int, seed: int):
+    con.execute(f"SELECT setseed({seed / 1000});")
+
+    con.execute(f"""
+        CREATE TABLE movie_genres AS
+        SELECT DISTINCT movie_id, genre_id
+        FROM (
+            SELECT m.movie_id, CAST(floor(random() * {GENRES}) AS INTEGER) + 1 AS genre_id
+            FROM range(1, {n} + 1) m(movie_id), range(3) k(slot)
+            WHERE k.slot = 0 OR random() < 0.75
+        );
+
+        CREATE TABLE movie_axes AS
+        SELECT movie_id, axis_id, slot < 2 AS is_primary
+        FROM (
+            SELECT m.movie_id, a.slot,
+                   CAST(floor(random() * {len(ONTOLOGY.names)}) AS INTEGER) AS axis_id
+            FROM range(1, {n} + 1) m(movie_id), range(3) a(slot)
+        )
+        QUALIFY row_number() OVER (PARTITION BY movie_id, axis_id ORDER BY slot) = 1;
+    """)
+
+    con.execute("CREATE TABLE bit_dimensions (kind VARCHAR, key VARCHAR, label VARCHAR, bit INTEGER);")
+    con.executemany(
+        "INSERT INTO bit_dimensions VALUES (?, ?, ?, ?);",
+        [["genre", str(g), f"Genre {g}", g - 1] for g in range(1, GENRES + 1)]
+        + [["axis", name, name, i] for i, name in enumerate(ONTOLOGY.names)],
+    )
+
+    # What transform_movies_gold.movie_bitsets computes from silver
+    con.execute(f"""
+        CREATE TABLE movie_bitsets AS
+        SELECT m.movie_id,
+               coalesce(g.mask, 0) AS genre_mask,
+               0::BIGINT AS category_mask,
+               coalesce(a.mask, 0) AS axis_mask,
+               coalesce(a.primary_mask, 0) AS primary_axis_mask
+        FROM range(1, {n} + 1) m(movie_id)
+        LEFT JOIN (
+            SELECT movie_id, bit_or(1::BIGINT << (genre_id - 1)) AS mask
+            FROM movie_genres GROUP BY movie_id
+        ) g USING (movie_id)
+        LEFT JOIN (
+            SELECT movie_id,
+                   bit_or(1::BIGINT << axis_id) AS mask,
+                   bit_or(CASE WHEN is_primary THEN 1::BIGINT << axis_id ELSE 0 END) AS primary_mask
+            FROM movie_axes GROUP BY movie_id
+        ) a USING (movie_id);
+    """)
+
+
+def timed(con, sql: str, params, repeat: int):
+    times, ids = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ids = con.execute(sql, params).fetchnumpy()["movie_id"]
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--movies", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=0, help="DuckDB threads (0 = default)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    con = duckdb.connect(":memory:")
+    if args.threads:
+        con.execute(f"SET threads = {args.threads};")
+
+    start = time.perf_counter()
+    build(con, args.movies, args.seed)
+    links = con.execute("SELECT (SELECT count(*) FROM movie_genres), (SELECT count(*) FROM movie_axes);").fetchone()
+    print(f"[+] {args.movies} movies, {links[0]} genre links, {links[1]} axis links "
+          f"(built in {time.perf_counter() - start:.1f}s)")
+
+    bits = load_bits(con)
+    axes = list(ONTOLOGY.names)
+    want_genres = ["Genre 3", "Genre 7"]
+    g_ids = [int(bits["genre"][g]) + 1 for g in want_genres]
+    want_axes, not_axis = axes[:2], axes[5]
+    a_ids = [ONTOLOGY.id(a) for a in want_axes]
+
+    cases = [
+        (
+            "any genre",
+            MoodFilter(genres_any=mask_of(bits, "genre", want_genres)),
+            f"""SELECT movie_id FROM range(1, {args.movies} + 1) m(movie_id)
+                WHERE EXISTS (SELECT 1 FROM movie_genres mg
+                              WHERE mg.movie_id = m.movie_id AND mg.genre_id IN ({g_ids[0]}, {g_ids[1]}))
+                ORDER BY movie_id""",
+        ),
+        (
+            "all genres",
+            MoodFilter(genres_all=mask_of(bits, "genre", want_genres)),
+            f"""SELECT movie_id FROM movie_genres
+                WHERE genre_id IN ({g_ids[0]}, {g_ids[1]})
+                GROUP BY movie_id HAVING count(*) = 2
+                ORDER BY movie_id""",
+        ),
+        (
+            "axes, not axis",
+            MoodFilter(axes_all=mask_of(bits, "axis", want_axes), axes_none=mask_of(bits, "axis", [not_axis])),
+            f"""SELECT movie_id FROM movie_axes
+                WHERE axis_id IN ({a_ids[0]}, {a_ids[1]})
+                GROUP BY movie_id HAVING count(*) = 2
+                EXCEPT
+                SELECT movie_id FROM movie_axes WHERE axis_id = {ONTOLOGY.id(not_axis)}
+                ORDER BY movie_id""",
+        ),
+    ]
+
+    print(f"  {'filter':<16} {'rows':>8} {'join':>9} {'bitmask':>9} {'speedup':>8}")
+    for name, f, join_sql in cases:
+        where, params = build_filter(f)
+        bit_sql = f"SELECT movie_id FROM movie_bitsets WHERE {where} ORDER BY movie_id"
+
+        join_t, join_ids = timed(con, join_sql, [], args.repeat)
+        bit_t, bit_ids = timed(con, bit_sql, params, args.repeat)
+
+        if len(join_ids) != len(bit_ids) or (join_ids != bit_ids).any():
+            print(f"[!] {name}: results differ ({len(join_ids)} vs {len(bit_ids)} rows)")
+        print(f"  {name:<16} {len(bit_ids):>8} {join_t * 1000:>7.1f}ms {bit_t * 1000:>7.1f}ms {join_t / bit_t:>7.1f}×")
+
+    con.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized lexicon sentiment vs TextBlob.
+
+Reports, for the same texts:
+- throughput of TextBlob (one object per text) and of the batch scorer
+- agreement of polarity: Pearson r, Spearman rho, mean / max abs error
+- sign agreement and exact-match rate (|Δ| < 1e-6)
+- Spearman rho of |polarity|, the tie-breaker validate_reviews ranks by
+
+Texts come from a silver Parquet file (--from-silver, its `reviews`
+column) or are synthetic review-like sentences built from the lexicon
+with negations, modifiers and filler words.
+
+Usage:
+    python benchmarks/bench_sentiment_calibration.py [--n 20000]
+    python benchmarks/bench_sentiment_calibration.py --from-silver data/silver/movies_silver_enriched.parquet
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from pipeline.transform.sentiment import lexicon_sentiment, load_lexicon
+
+FILLER = [
+    "the", "movie", "film", "plot", "story", "acting", "cast", "was", "is",
+    "a", "and", "but", "it", "this", "ending", "director", "of", "with",
+    "scenes", "i", "felt", "music", "character", "script", "overall",
+]
+PREFIXES = ["not", "never", "no", "don't", "isn't", "very", "really", "so", "not very", "not a"]
+
+
+def synthetic_texts(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    words = load_lexicon()["word"].to_list()
+
+    texts = []
+    for _ in range(n):
+        parts = []
+        for _ in range(rng.randint(2, 6)):
+            chunk = rng.sample(FILLER, rng.randint(1, 4))
+            if rng.random() < 0.3:
+                chunk.append(rng.choice(PREFIXES))
+            chunk.append(rng.choice(words))
+            if rng.random() < 0.1:
+                chunk.append("!")
+            parts.append(" ".join(chunk))
+        texts.append(". ".join(parts).capitalize() + ".")
+    return texts
+
+
+def silver_texts(path: Path, n: int):
+    texts = (
+        pl.scan_parquet(path)
+        .select(pl.col("reviews").explode())
+        .drop_nulls()
+        .head(n)
+        .collect()["reviews"]
+        .to_list()
+    )
+    return texts
+
+
+def spearman(a, b) -> float:
+    ra = pl.Series(a).rank().to_numpy()
+    rb = pl.Series(b).rank().to_numpy()
+    return float(np.corrcoef(ra, rb)[0, 1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--n", type=int, default=20000)
+    parser.add_argument("--from-silver", type=Path, help="silver Parquet with a `reviews` column")
+    args = parser.parse_args()
+
+    from textblob import TextBlob
+
+    if load_lexicon() is None:
+        sys.exit("[!] No sentiment lexicon available (install textblob)")
+
+    texts = silver_texts(args.from_silver, args.n) if args.from_silver else synthetic_texts(args.n)
+    print(f"[*] {len(texts)} texts ({'silver reviews' if args.from_silver else 'synthetic'})\n")
+
+    start = time.perf_counter()
+    tb = np.array([TextBlob(t).sentiment.polarity for t in texts])
+    tb_secs = time.perf_counter() - start
+
+    lexicon_sentiment(texts[:10])  # lexicon load + warm up
+    start = time.perf_counter()
+    lx = np.array([s["polarity"] for s in lexicon_sentiment(texts)])
+    lx_secs = time.perf_counter() - start
+
+    err = np.abs(tb - lx)
+    print(f"{'scorer':<10}{'seconds':>10}{'texts/s':>12}")
+    print(f"{'textblob':<10}{tb_secs:>10.2f}{len(texts) / tb_secs:>12.0f}")
+    print(f"{'lexicon':<10}{lx_secs:>10.2f}{len(texts) / lx_secs:>12.0f}")
+    print(f"\nspeedup: {tb_secs / lx_secs:.1f}×\n")
+
+    print(f"pearson r           {np.corrcoef(tb, lx)[0, 1]:.4f}")
+    print(f"spearman rho        {spearman(tb, lx):.4f}")
+    print(f"spearman rho |pol|  {spearman(np.abs(tb), np.abs(lx)):.4f}")
+    print(f"mean |Δ|            {err.mean():.4f}")
+    print(f"max |Δ|             {err.max():.4f}")
+    print(f"sign agreement      {np.mean(np.sign(tb) == np.sign(lx)):.4f}")
+    print(f"exact (|Δ|<1e-6)    {np.mean(err < 1e-6):.4f}")
+
+
+if __name__ == "__main__":
+    main()
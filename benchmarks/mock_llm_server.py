@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+Deterministic local stand-in for the OpenAI API, for offline runs and load tests.
+
+Serves POST /v1/responses and POST /v1/chat/completions (both also with
+stream=true, as SSE) and GET /stats. The stage behind each request is
+recognized from its static prompt prefix (pipeline.transform.prompt_registry),
+and the output is built for that stage:
+
+- strict json_schema requests get an instance of the schema (enums,
+  packed movie_ids, 5 capsules, 1–3 anchors …)
+- free-text stages (premise, critic summaries, thematic chat prompts) get
+  text that passes the pipeline's validators
+
+Faults are injected per request with fixed probabilities: latency
+(+ jitter, spread over the deltas when streaming), 429s with retry-after,
+malformed JSON, and validator-failing content (banned words). The random
+draws depend only on --seed, the request body and how often that body was
+seen, so a run is reproducible and a retried request can still succeed.
+
+Point the jobs (or any OpenAI client) at it:
+
+    python benchmarks/mock_llm_server.py --port 8765 --latency-ms 200 --rate-limit 0.02
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=mock python -m pipeline run ...
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from pipeline.transform.prompt_registry import load_all
+
+# ---------------------------------------------------------
+# Canned content (passes the pipeline validators)
+# ---------------------------------------------------------
+SUBJECTS = ["pilot", "farmer", "doctor", "teacher", "soldier", "mechanic", "reporter", "nurse"]
+PREMISE = "A {who} leads a mission through space to find a new planet with the power to save every family."
+
+CRITIC_SENTENCES = [
+    "Viewers come away feeling lighter, as if someone finally said the quiet part out loud.",
+    "The audience laughs early and then realizes how much the small moments matter.",
+    "It feels honest in a way that makes people call a friend after the credits.",
+    "You feel the pressure build slowly until every choice seems to cost something real.",
+    "People remember the warmth more than any single scene, and that warmth lingers for days.",
+    "The pacing gives viewers room to breathe, so the quieter beats land with surprising weight.",
+    "It never lectures, which is why the audience trusts it when the stakes finally rise.",
+    "Many people say it stays with them because it treats ordinary worry with real care.",
+]
+CAPSULE_SENTENCES = [
+    "Small promises start to feel heavier than they first looked.",
+    "A quiet home becomes the safest and loneliest place at once.",
+    "Every easy answer falls apart when the stakes get personal.",
+    "Trust grows slowly and breaks in a single afternoon.",
+    "Hope shows up late but stays longer than expected.",
+    "The cost of staying put becomes impossible to ignore.",
+]
+EMOTIONS = ["hopeful", "tense", "wistful", "anxious", "warm", "melancholic", "restless"]
+THEMES = ["Burden of Expectation", "Longing for Belonging", "Cycles of Regret", "Redemption Through Connection"]
+NAMES = ["Cooper", "Ellie", "Marcus", "Nadia", "Theo", "Rosa", "Ivan", "June"]
+DESCRIPTORS = ["stubborn engineer", "retired detective", "young pilot", "small-town doctor", "runaway heir"]
+
+# Validator-failing content, for the --invalid probability
+BAD_PREFIX = "It masterfully delves into "
+BAD_PREMISE = "A {who} goes on a journey of love and identity."
+
+_MOVIE_ID = re.compile(r"movie_id:\s*(\d+)")
+
+# Array lengths by property name (schema-driven outputs)
+ARRAY_SIZES = {"capsules": (5, 5), "anchors": (1, 3), "primary": (2, 2), "primary_axes": (1, 2)}
+
+
+# ---------------------------------------------------------
+# Config / stats
+# ---------------------------------------------------------
+@dataclass
+class MockConfig:
+    seed: int = 0
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_limit: float = 0.0
+    malformed: float = 0.0
+    invalid: float = 0.0
+    retry_after_ms: int = 50
+
+
+class MockStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: Counter = Counter()
+        self.stages: Counter = Counter()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def enter(self, stage: str):
+        with self.lock:
+            self.stages[stage] += 1
+            self.counts["requests"] += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def leave(self, outcome: str):
+        with self.lock:
+            self.in_flight -= 1
+            self.counts[outcome] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                **self.counts,
+                "stages": dict(self.stages),
+                "peak_in_flight": self.peak_in_flight,
+            }
+
+
+# ---------------------------------------------------------
+# Output builders
+# ---------------------------------------------------------
+def _prefix_stages() -> Dict[str, str]:
+    return {p.prefix.strip(): stage for stage, p in load_all().items()}
+
+
+def schema_instance(schema: Dict, rng: random.Random, name: str = "", ctx: Optional[Dict] = None) -> Any:
+    """A value valid for `schema` (the subset structured_output emits)."""
+    ctx = ctx or {}
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+
+    if "enum" in schema:
+        values = [v for v in schema["enum"] if v is not None]
+        return rng.choice(values) if values else None
+
+    if kind == "object":
+        return {
+            key: schema_instance(sub, rng, key, ctx)
+            for key, sub in schema.get("properties", {}).items()
+        }
+
+    if kind == "array":
+        item = schema.get("items", {})
+        if name == "items":
+            # packed response: one item per listed movie
+            out = []
+            for mid in ctx.get("movie_ids", []):
+                value = schema_instance(item, rng, "item", ctx)
+                value["movie_id"] = mid
+                out.append(value)
+            return out
+
+        lo, hi = ARRAY_SIZES.get(name, (1, 3))
+        n = rng.randint(lo, hi)
+        if "enum" in item:
+            values = [v for v in item["enum"] if v is not None]
+            return rng.sample(values, min(n, len(values)))
+        return [schema_instance(item, rng, name, ctx) for _ in range(n)]
+
+    if kind == "integer":
+        return rng.randint(1, 1000)
+    if kind == "number":
+        return round(rng.random(), 3)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    if kind == "null":
+        return None
+    return _string_for(name, rng, ctx)
+
+
+def _string_for(name: str, rng: random.Random, ctx: Dict) -> str:
+    bad = BAD_PREFIX if ctx.get("invalid") else ""
+    if name == "premise":
+        return (BAD_PREMISE if bad else PREMISE).format(who=rng.choice(SUBJECTS))
+    if name == "text":
+        return bad + rng.choice(CAPSULE_SENTENCES)
+    if name == "emotion":
+        return rng.choice(EMOTIONS)
+    if name == "label":
+        return rng.choice(NAMES)
+    if name == "descriptor":
+        return rng.choice(DESCRIPTORS)
+    return " ".join(rng.sample(EMOTIONS, 2))
+
+
+def text_output(stage: str, rng: random.Random, invalid: bool) -> str:
+    """Free-text stages."""
+    bad = BAD_PREFIX if invalid else ""
+    if stage == "premise":
+        return (BAD_PREMISE if invalid else PREMISE).format(who=rng.choice(SUBJECTS))
+    if stage in ("critic_summary", "thematic_critic_summary"):
+        return bad + " ".join(rng.sample(CRITIC_SENTENCES, 6))
+    if stage == "thematic_emotional_capsules":
+        return json.dumps([
+            {"theme": rng.choice(THEMES), "emotion": rng.choice(EMOTIONS), "text": bad + " ".join(rng.sample(CAPSULE_SENTENCES, 3))}
+            for _ in range(5)
+        ])
+    return bad + rng.choice(CAPSULE_SENTENCES)
+
+
+def malform(text: str, rng: random.Random) -> str:
+    """Broken output: truncated, fenced with a trailing comma, or empty."""
+    kind = rng.randrange(3)
+    if kind == 0:
+        return text[: max(1, len(text) // 2)]
+    if kind == 1:
+        return "Sure! Here you go:\n```json\n" + text.rstrip("}]") + ",\n```"
+    return ""
+
+
+# ---------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------
+class MockLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config: MockConfig):
+        super().__init__(address, MockHandler)
+        self.config = config
+        self.stats = MockStats()
+        self.prefixes = _prefix_stages()
+        self._seen: Counter = Counter()
+        self._seen_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def rng_for(self, body: bytes) -> random.Random:
+        digest = hashlib.sha1(body).hexdigest()
+        with self._seen_lock:
+            self._seen[digest] += 1
+            attempt = self._seen[digest]
+        return random.Random(f"{self.config.seed}:{digest}:{attempt}")
+
+    def stage_of(self, prefix: str) -> str:
+        return self.prefixes.get((prefix or "").strip(), "unknown")
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: MockLLMServer
+
+    def log_message(self, *args):
+        pass
+
+    # ---------- plumbing ----------
+    def _send_json(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _start_sse(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+    def _sse(self, data: Any, event: Optional[str] = None):
+        chunk = (f"event: {event}\n" if event else "") + f"data: {data if isinstance(data, str) else json.dumps(data)}\n\n"
+        self.wfile.write(chunk.encode("utf-8"))
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("/stats", "/v1/stats"):
+            self._send_json(200, self.server.stats.snapshot())
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        try:
+            body = json.loads(raw or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "invalid JSON body"}})
+            return
+
+        if self.path.endswith("/responses"):
+            prefix, user, api = body.get("instructions"), body.get("input"), "responses"
+        elif self.path.endswith("/chat/completions"):
+            messages = body.get("messages") or [{}]
+            prefix = messages[0].get("content") if messages[0].get("role") == "system" else ""
+            user, api = messages[-1].get("content"), "chat"
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        server, config = self.server, self.server.config
+        stage = server.stage_of(prefix)
+        rng = server.rng_for(raw)
+        server.stats.enter(stage)
+        outcome = "ok"
+
+        try:
+            if rng.random() < config.rate_limit:
+                outcome = "rate_limited"
+                self._send_json(
+                    429,
+                    {"error": {"message": "Rate limit reached (mock)", "type": "requests", "code": "rate_limit_exceeded"}},
+                    {"retry-after-ms": str(config.retry_after_ms)},
+                )
+                return
+
+            text, outcome = self._output(body, stage, user if isinstance(user, str) else json.dumps(user), rng)
+            latency = max(0.0, config.latency_ms + rng.uniform(-config.jitter_ms, config.jitter_ms)) / 1000
+
+            if body.get("stream"):
+                stream = self._stream_responses if api == "responses" else self._stream_chat
+                stream(body, text, latency)
+            else:
+                time.sleep(latency)
+                payload = self._responses_payload(body, text) if api == "responses" else self._chat_payload(body, text)
+                self._send_json(200, payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # client cancelled (e.g. a stream aborted by a partial validator)
+            outcome = "cancelled"
+        finally:
+            server.stats.leave(outcome)
+
+    # ---------- content ----------
+    def _output(self, body: Dict, stage: str, user: str, rng: random.Random):
+        config = self.server.config
+        invalid = rng.random() < config.invalid
+        fmt = ((body.get("text") or {}).get("format") or {})
+
+        if fmt.get("type") == "json_schema":
+            ctx = {"movie_ids": [int(m) for m in _MOVIE_ID.findall(user or "")], "invalid": invalid}
+            text = json.dumps(schema_instance(fmt.get("schema") or {}, rng, ctx=ctx), ensure_ascii=False)
+        else:
+            text = text_output(stage, rng, invalid)
+
+        if rng.random() < config.malformed:
+            return malform(text, rng), "malformed"
+        return text, "invalid" if invalid else "ok"
+
+    @staticmethod
+    def _usage(body: Dict, text: str) -> Dict[str, int]:
+        return {"input_tokens": len(json.dumps(body)) // 4, "output_tokens": len(text) // 4}
+
+    def _response_object(self, body: Dict, text: str, status: str) -> Dict:
+        usage = self._usage(body, text)
+        return {
+            "id": f"resp_{uuid.uuid4().hex[:16]}",
+            "object": "response",
+            "created_at": int(time.time()),
+            "model": body.get("model", "mock"),
+            "status": status,
+            "output": [{
+                "type": "message",
+                "id": "msg_mock",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }] if status == "completed" else [],
+            "usage": {**usage, "total_tokens": sum(usage.values())},
+            "parallel_tool_calls": False,
+            "tool_choice": "auto",
+            "tools": [],
+        }
+
+    def _responses_payload(self, body: Dict, text: str) -> Dict:
+        return self._response_object(body, text, "completed")
+
+    def _chat_payload(self, body: Dict, text: str) -> Dict:
+        usage = self._usage(body, text)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:16]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": usage["input_tokens"],
+                "completion_tokens": usage["output_tokens"],
+                "total_tokens": sum(usage.values()),
+            },
+        }
+
+    # ---------- streaming ----------
+    @staticmethod
+    def _deltas(text: str) -> List[str]:
+        return re.findall(r"\s*\S+", text) or [text]
+
+    def _stream_responses(self, body: Dict, text: str, latency: float):
+        deltas = self._deltas(text)
+        per_delta = latency / (len(deltas) + 1)
+
+        self._start_sse()
+        seq = 0
+        self._sse({"type": "response.created", "sequence_number": seq,
+                   "response": self._response_object(body, "", "in_progress")}, "response.created")
+        time.sleep(per_delta)
+
+        for delta in deltas:
+            seq += 1
+            self._sse({"type": "response.output_text.delta", "sequence_number": seq, "item_id": "msg_mock",
+                       "output_index": 0, "content_index": 0, "delta": delta, "logprobs": []},
+                      "response.output_text.delta")
+            time.sleep(per_delta)
+
+        seq += 1
+        self._sse({"type": "response.completed", "sequence_number": seq,
+                   "response": self._response_object(body, text, "completed")}, "response.completed")
+
+    def _stream_chat(self, body: Dict, text: str, latency: float):
+        deltas = self._deltas(text)
+        per_delta = latency / (len(deltas) + 1)
+        chunk_id = f"chatcmpl-{uuid.uuid4().hex[:16]}"
+
+        def chunk(delta: Dict, finish: Optional[str] = None):
+            return {"id": chunk_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                    "model": body.get("model", "mock"),
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish}]}
+
+        self._start_sse()
+        time.sleep(per_delta)
+        for delta in deltas:
+            self._sse(chunk({"content": delta}))
+            time.sleep(per_delta)
+        self._sse(chunk({}, "stop"))
+        self._sse("[DONE]")
+
+
+# ---------------------------------------------------------
+# Entry points
+# ---------------------------------------------------------
+def start_server(config: MockConfig, host: str = "127.0.0.1", port: int = 0) -> MockLLMServer:
+    """Starts the server on a background thread (port 0 = any free port)."""
+    server = MockLLMServer((host, port), config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_fault_args(parser: argparse.ArgumentParser):
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="mean response time")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="± uniform jitter")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="probability of a 429")
+    parser.add_argument("--malformed", type=float, default=0.0, help="probability of broken output")
+    parser.add_argument("--invalid", type=float, default=0.0, help="probability of validator-failing content")
+
+
+def config_from_args(args) -> MockConfig:
+    return MockConfig(
+        seed=args.seed,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        malformed=args.malformed,
+        invalid=args.invalid,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_fault_args(parser)
+    args = parser.parse_args()
+
+    server = MockLLMServer((args.host, args.port), config_from_args(args))
+    print(f"[+] Mock LLM server on {server.base_url} ({len(server.prefixes)} known prompt stages)")
+    print(f"[*] OPENAI_BASE_URL={server.base_url} OPENAI_API_KEY=mock")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"[✓] Stats: {json.dumps(server.stats.snapshot())}")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,14 +10,12 @@ import os
 import sys
 import json
 from pathlib import Path
-from dotenv import load_dotenv
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 
 from pipeline.extract.tmdb_extractor import TMDBClient, MovieExtractor
-
-load_dotenv(ROOT / ".env")
+from pipeline.llm_client import load_env
 
 TARGET_GENRES = {
     "comedy": ["Comedy"],
@@ -41,6 +39,7 @@ def dedupe_movies(movies):
 
 
 def main():
+    load_env()
     bearer = os.getenv("TMDB_BEARER_TOKEN")
     client = TMDBClient(bearer)
     extractor = MovieExtractor(client, verbose=True)
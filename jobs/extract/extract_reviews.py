@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import json
 from pathlib import Path
 import time
 import sys
@@ -9,6 +8,7 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT))
 
 
+from pipeline.artifacts import read_json
 from pipeline.extract.reviews_extractor import ReviewExtractor
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -20,24 +20,26 @@ OUT_DIR = ROOT / "data" / "bronze" / "reviews"
 def main():
     extractor = ReviewExtractor(save_dir=OUT_DIR)
 
-    with open(SILVER, "r", encoding="utf-8") as f:
-        movies = json.load(f)
+    movies = read_json(SILVER)
 
     print(f"Loaded {len(movies)} movies from Silver")
 
-    for m in movies:
-        movie_id = m["movie_id"]
-        print(f"→ Fetching reviews for {movie_id} - {m['title']}")
+    try:
+        for m in movies:
+            movie_id = m["movie_id"]
+            print(f"→ Fetching reviews for {movie_id} - {m['title']}")
 
-        reviews = extractor.fetch_reviews(movie_id)
-        if not reviews:
-            print("   No reviews found.")
-            continue
+            reviews = extractor.fetch_reviews(movie_id)
+            if not reviews:
+                print("   No reviews found.")
+                continue
 
-        path = extractor.save(movie_id, reviews)
-        print(f"   Saved {len(reviews)} reviews → {path}")
+            path = extractor.save(movie_id, reviews)
+            print(f"   Saved {len(reviews)} reviews → {path}")
 
-        time.sleep(0.25)  # polite rate-limit
+            time.sleep(0.25)  # polite rate-limit
+    finally:
+        extractor.close()
 
 if __name__ == "__main__":
     main()
@@ -12,51 +12,57 @@ Writes output to data/gold/emotional_scenes.parquet
 """
 
 import os
+import sys
 import json
 import time
 from pathlib import Path
 from typing import List, Dict
-import polars as pl
-from dotenv import load_dotenv
-from openai import OpenAI
+
+import requests
 
 # -----------------------------
 # Setup
 # -----------------------------
 
 ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+
+from pipeline.artifacts import read_json
+from pipeline.lazy import lazy_import
+from pipeline.llm_client import get_client, load_env
+from pipeline.transform.structured_output import items, parse_json
+
+pl = lazy_import("polars")
+
 SILVER_DIR = ROOT / "data" / "silver"
 GOLD_DIR = ROOT / "data" / "gold"
 
-load_dotenv(ROOT / ".env")
-
-OPENAI_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_KEY:
-    raise ValueError("OPENAI_API_KEY missing in .env")
 
-client = OpenAI(api_key=OPENAI_KEY)
+def require_env(name: str) -> str:
+    """Keys are checked when a stage needs them, not at import."""
+    load_env()
+    value = os.getenv(name)
+    if not value:
+        raise ValueError(f"{name} missing in .env")
+    return value
 
 
 # -----------------------------
 # TMDB review fetcher (stub; easy to expand)
 # -----------------------------
-import requests
-
-TMDB_TOKEN = os.getenv("TMDB_BEARER_TOKEN")
-if not TMDB_TOKEN:
-    raise ValueError("TMDB_BEARER_TOKEN missing.")
 
-TMDB_HEADERS = {
-    "Authorization": f"Bearer {TMDB_TOKEN}",
-    "Content-Type": "application/json;charset=utf-8"
-}
+def tmdb_headers() -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {require_env('TMDB_BEARER_TOKEN')}",
+        "Content-Type": "application/json;charset=utf-8"
+    }
 
 def fetch_reviews(movie_id: int, limit: int = 10) -> List[str]:
     """
     Fetch top user reviews from TMDB.
     """
     url = f"https://api.themoviedb.org/3/movie/{movie_id}/reviews"
-    resp = requests.get(url, headers=TMDB_HEADERS)
+    resp = requests.get(url, headers=tmdb_headers())
     resp.raise_for_status()
 
     data = resp.json().get("results", [])
@@ -122,7 +128,7 @@ Now produce JSON with exactly this structure:
 def generate_paragraphs(movie, overview, reviews):
     prompt = build_prompt(movie, overview, reviews)
 
-    response = client.chat.completions.create(
+    response = get_client().chat.completions.create(
         model="gpt-4o-mini",
         messages=[{"role": "user", "content": prompt}],
         max_tokens=600
@@ -130,11 +136,9 @@ def generate_paragraphs(movie, overview, reviews):
     
     text = response.choices[0].message.content
 
-    # Parse JSON
+    # Parse JSON (fences, stray prose and truncation are repaired)
     try:
-        data = json.loads(text)
-        paragraphs = data.get("paragraphs", [])
-        return paragraphs
+        return items(parse_json(text), "paragraphs")
     except Exception:
         print("LLM JSON parsing failed, retrying with safe extraction...")
         raise
@@ -144,11 +148,13 @@ def generate_paragraphs(movie, overview, reviews):
 # MAIN
 # -----------------------------
 def main():
+    require_env("OPENAI_API_KEY")
+    require_env("TMDB_BEARER_TOKEN")
     GOLD_DIR.mkdir(parents=True, exist_ok=True)
 
     # Load movies
     silver_path = SILVER_DIR / "movies_silver.json"
-    movies = json.load(open(silver_path, "r", encoding="utf-8"))
+    movies = read_json(silver_path)
 
     out_rows = []
 
@@ -1,35 +1,49 @@
 #!/usr/bin/env python3
 
-import json
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
-from openai import OpenAI
 
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT))
 
-from pipeline.transform.character_anchor_extractor import extract_character_anchors
+from pipeline.artifacts import read_json, write_json
+from pipeline.llm_client import get_client
+from pipeline.transform.character_anchor_extractor import (
+    extract_character_anchors,
+    extract_character_anchors_packed,
+)
 from pipeline.transform.character_anchor_validator import validate_character_anchors
+from pipeline.transform.packing import run_packed
+from pipeline.transform.retry_scheduler import RetryScheduler
 
 INPUT = ROOT / "data" / "gold" / "movie_premises.json"
 OUTPUT = ROOT / "data" / "gold" / "movie_character_anchors.json"
 
-load_dotenv(ROOT / ".env")
-client = OpenAI()
-
 def main():
-    movies = json.loads(INPUT.read_text(encoding="utf-8"))
+    client = get_client()
+    movies = read_json(INPUT)
     results = []
     empty = 0
 
-    for m in movies:
-        anchors = extract_character_anchors(
-            client,
-            m["title"],
-            m["premise"]
-        )
+    def check(m, anchors):
+        if validate_character_anchors(anchors):
+            return True, "pass"
+        return False, "no_valid_anchors"
 
+    # K movies per request; movies without a valid anchor are re-queued
+    # for one individual request after the packed pass
+    scheduler = RetryScheduler(
+        generate=lambda m: extract_character_anchors(client, m["title"], m["premise"]),
+        validate=check,
+    )
+    stats = run_packed(
+        movies,
+        generate_pack=lambda batch: extract_character_anchors_packed(client, batch),
+        scheduler=scheduler,
+    )
+
+    for m in movies:
+        anchors = scheduler.outcomes[m["movie_id"]].output or []
         valid = validate_character_anchors(anchors)
 
         if not valid:
@@ -42,9 +56,10 @@ def main():
             "character_anchors": valid
         })
 
-    OUTPUT.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    write_json(OUTPUT, results)
 
+    stats.report("Character anchors")
+    scheduler.report("Anchor validation")
     print(f"[✓] Processed {len(results)} movies")
     print(f"[!] Empty anchors: {empty}")
 
@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
 import sys
-import json
 from pathlib import Path
-from dotenv import load_dotenv
-from openai import OpenAI
 
 # --------------------------------------------------
 # Fix import path ONCE and forever
@@ -12,8 +9,13 @@ from openai import OpenAI
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
-from pipeline.transform.critic_generator import generate_critic_summary
+from pipeline.artifacts import read_json, write_json
+from pipeline.llm_client import get_client
+from pipeline.transform.critic_cleanup import clean_critic_summary, drop_flagged_sentences
+from pipeline.transform.critic_generator import stream_critic_summary
 from pipeline.transform.critic_validator import validate_critic_summary
+from pipeline.transform.retry_scheduler import RetryScheduler
+from pipeline.transform.streaming import STATS as STREAM_STATS
 
 # --------------------------------------------------
 # Paths
@@ -21,30 +23,43 @@ from pipeline.transform.critic_validator import validate_critic_summary
 GOLD_IN = ROOT / "data" / "gold" / "movies_gold.json"
 OUT = ROOT / "data" / "gold" / "movie_critic_summaries.json"
 
-# --------------------------------------------------
-# Setup
-# --------------------------------------------------
-load_dotenv(ROOT / ".env")
-client = OpenAI()
-
 MAX_RETRIES = 2
 
 
+# Local repairs, tried in order before a summary is re-queued
+REPAIRS = [
+    ("cleanup", lambda m, text: clean_critic_summary(text)),
+    ("drop_flagged_sentences", lambda m, text: drop_flagged_sentences(clean_critic_summary(text))),
+]
+
+
 def main():
-    movies = json.loads(GOLD_IN.read_text(encoding="utf-8"))
+    client = get_client()
+    movies = read_json(GOLD_IN)
     results = []
 
-    generated = 0
-    flagged = 0
-    skipped = 0
+    # Streamed: a banned word mid-summary cancels it and queues a retry
+    scheduler = RetryScheduler(
+        generate=lambda m: stream_critic_summary(
+            client=client,
+            title=m.get("title", ""),
+            premise=m["premise"].strip(),
+            axes=m["axes"],
+        ),
+        validate=lambda m, text: validate_critic_summary(text),
+        repairs=REPAIRS,
+        max_attempts=MAX_RETRIES,
+    )
+
+    ready = [m for m in movies if m.get("premise", "").strip() and m.get("axes")]
+    outcomes = scheduler.run(ready)
 
+    skipped = 0
     for m in movies:
         movie_id = m["movie_id"]
         title = m.get("title", "")
-        premise = m.get("premise", "").strip()
-        axes = m.get("axes", [])
 
-        if not premise or not axes:
+        if movie_id not in outcomes:
             skipped += 1
             results.append({
                 "movie_id": movie_id,
@@ -57,43 +72,23 @@ def main():
             })
             continue
 
-        summary = ""
-        valid = False
-        reason = "unknown"
-
-        for _ in range(MAX_RETRIES):
-            summary = generate_critic_summary(
-                client=client,
-                title=title,
-                premise=premise,
-                axes=axes
-            )
-
-            valid, reason = validate_critic_summary(summary)
-            if valid:
-                break
-
-        if valid:
-            generated += 1
-            status = "pass"
-        else:
-            flagged += 1
-            status = "flagged"
+        outcome = outcomes[movie_id]
 
         # IMPORTANT: flagged summaries are kept, not wiped
         results.append({
             "movie_id": movie_id,
             "title": title,
-            "critic_summary": summary,
-            "validation": {
-                "status": status,
-                "reason": reason
-            }
+            "critic_summary": outcome.output or "",
+            "validation": outcome.validation()
         })
 
-    OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    generated = sum(o.valid for o in outcomes.values())
+    flagged = len(outcomes) - generated
+
+    write_json(OUT, results, ensure_ascii=False)
 
+    scheduler.report("Critic summaries")
+    STREAM_STATS.report("Streaming")
     print(f"[✓] Critic summaries generated: {generated}")
     print(f"[!] Flagged (kept): {flagged}")
     print(f"[–] Skipped: {skipped}")
@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
 import sys
-import json
 from pathlib import Path
-from dotenv import load_dotenv
-from openai import OpenAI
 
 # --------------------------------------------------
 # Fix imports permanently
@@ -12,8 +9,16 @@ from openai import OpenAI
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT))
 
-from pipeline.transform.emotional_capsule_generator import generate_emotional_capsules
-from pipeline.transform.emotional_capsule_validator import validate_emotional_capsules
+from pipeline.artifacts import read_json, write_json
+from pipeline.llm_client import get_client
+from pipeline.transform.emotional_capsule_generator import stream_emotional_capsules
+from pipeline.transform.emotional_capsule_validator import (
+    drop_invalid_capsules,
+    validate_emotional_capsules,
+)
+from pipeline.transform.retry_scheduler import Aborted, RetryScheduler
+from pipeline.transform.streaming import STATS as STREAM_STATS
+from pipeline.transform.structured_output import StructuredOutputError, items, parse_json
 
 # --------------------------------------------------
 # Paths
@@ -21,16 +26,38 @@ from pipeline.transform.emotional_capsule_validator import validate_emotional_ca
 GOLD_IN = ROOT / "data" / "gold" / "movies_gold.json"
 OUT = ROOT / "data" / "gold" / "movie_emotional_capsules.json"
 
-# --------------------------------------------------
-# Setup
-# --------------------------------------------------
-load_dotenv(ROOT / ".env")
-client = OpenAI()
-
 MAX_RETRIES = 2
 
 
 def parse_capsules(text, axes):
+    """
+    Capsules on an allowed axis, from the JSON output (repaired if
+    needed); falls back to the legacy `AXIS :: emotion :: sentence` lines.
+    """
+    try:
+        data = parse_json(text)
+    except StructuredOutputError:
+        return parse_capsule_lines(text, axes)
+
+    capsules = []
+    for c in items(data, "capsules"):
+        if not isinstance(c, dict):
+            continue
+
+        axis = str(c.get("axis") or "").strip()
+        if axis not in axes:
+            continue
+
+        capsules.append({
+            "axis": axis,
+            "emotion": str(c.get("emotion") or "").strip(),
+            "text": str(c.get("text") or "").strip(),
+        })
+
+    return capsules
+
+
+def parse_capsule_lines(text, axes):
     capsules = []
 
     for line in text.splitlines():
@@ -56,19 +83,37 @@ def parse_capsules(text, axes):
 
 
 def main():
-    movies = json.loads(GOLD_IN.read_text(encoding="utf-8"))
+    client = get_client()
+    movies = read_json(GOLD_IN)
     results = []
 
-    generated = 0
-    flagged = 0
+    # Streamed: too many invalid capsules mid-response cancel it and queue a retry
+    def generate(m):
+        raw_text = stream_emotional_capsules(
+            client,
+            title=m["title"],
+            premise=m["premise"].strip(),
+            axes=m["axes"]
+        )
+        if isinstance(raw_text, Aborted):
+            return Aborted(raw_text.reason, parse_capsules(raw_text.partial, m["axes"]))
+        return parse_capsules(raw_text, m["axes"])
+
+    scheduler = RetryScheduler(
+        generate=generate,
+        validate=lambda m, capsules: validate_emotional_capsules(capsules, m["axes"]),
+        repairs=[("drop_invalid", lambda m, capsules: drop_invalid_capsules(capsules, m["axes"]))],
+        max_attempts=MAX_RETRIES,
+    )
+
+    ready = [m for m in movies if m.get("premise", "").strip() and m.get("axes")]
+    outcomes = scheduler.run(ready)
 
     for m in movies:
         movie_id = m["movie_id"]
         title = m["title"]
-        premise = m.get("premise", "").strip()
-        axes = m.get("axes", [])
 
-        if not premise or not axes:
+        if movie_id not in outcomes:
             results.append({
                 "movie_id": movie_id,
                 "title": title,
@@ -80,49 +125,23 @@ def main():
             })
             continue
 
-        raw_text = ""
-        capsules = []
-        valid = False
-        reason = "unknown"
-
-        for _ in range(MAX_RETRIES):
-            raw_text = generate_emotional_capsules(
-                client,
-                title=title,
-                premise=premise,
-                axes=axes
-            )
-
-            capsules = parse_capsules(raw_text, axes)
-            valid, reason = validate_emotional_capsules(capsules, axes)
-
-            if valid:
-                break
-
-        if valid:
-            generated += 1
-            status = "pass"
-        else:
-            flagged += 1
-            status = "flagged"
-
-        # IMPORTANT: Never drop capsules
+        outcome = outcomes[movie_id]
+
+        # IMPORTANT: flagged capsules are kept as generated, never dropped
         results.append({
             "movie_id": movie_id,
             "title": title,
-            "emotional_capsules": capsules,
-            "validation": {
-                "status": status,
-                "reason": reason
-            }
+            "emotional_capsules": outcome.output or [],
+            "validation": outcome.validation()
         })
 
-    OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(
-        json.dumps(results, indent=2, ensure_ascii=False),
-        encoding="utf-8"
-    )
+    generated = sum(o.valid for o in outcomes.values())
+    flagged = len(outcomes) - generated
+
+    write_json(OUT, results, ensure_ascii=False)
 
+    scheduler.report("Emotional capsules")
+    STREAM_STATS.report("Streaming")
     print(f"[✓] Generated: {generated}")
     print(f"[!] Flagged: {flagged}")
     print(f"[✓] Output → {OUT}")
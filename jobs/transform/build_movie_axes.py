@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
-import json
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
-from openai import OpenAI
 
 # ---------------------------------------------------
 # PATH FIX — ensures NO module errors
@@ -12,29 +9,51 @@ from openai import OpenAI
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT))
 
-load_dotenv(ROOT / ".env")
+from collections import Counter
 
+from pipeline.llm_client import get_client
+from pipeline.transform.axis_engine import decide_axes
 from pipeline.transform.axis_generator import generate_axes
 from pipeline.transform.axis_validator import validate_axes
+from pipeline.artifacts import exists, read_json, read_silver, write_json
 
 # ---------------------------------------------------
 # FILES
 # ---------------------------------------------------
-SILVER = ROOT / "data" / "silver" / "movies_silver_validated.json"
+SILVER = ROOT / "data" / "silver" / "movies_silver_validated.parquet"
+PREMISES = ROOT / "data" / "gold" / "movie_premises.json"
+ANCHORS = ROOT / "data" / "gold" / "movie_character_anchors.json"   # optional
 OUT = ROOT / "data" / "gold" / "movie_axes.json"
 
-client = OpenAI()
-
 def main():
-    movies = json.loads(SILVER.read_text(encoding="utf-8"))
+    movies = read_silver(SILVER, columns=["movie_id", "title", "genres"])
     results = []
 
+    # Premises (and anchors, when already built) live in gold, not silver
+    premises = {p["movie_id"]: p.get("premise") or "" for p in read_json(PREMISES)}
+    anchors = {}
+    if exists(ANCHORS):
+        anchors = {a["movie_id"]: a.get("character_anchors") or [] for a in read_json(ANCHORS)}
+
     for m in movies:
+        m["premise"] = premises.get(m["movie_id"], "")
+        m["character_anchors"] = anchors.get(m["movie_id"], [])
+
+    # Deterministic scoring first; only ambiguous movies go to the LLM
+    decisions = decide_axes(movies)
+    reasons = Counter()
+
+    for m, decision in zip(movies, decisions):
         title = m["title"]
-        premise = m.get("premise", "")
+        premise = m["premise"]
         genres = [g["name"] for g in m.get("genres", [])]
 
-        axes = generate_axes(client, title, premise, genres)
+        if decision.confident:
+            axes = {**decision.axes, "source": "local"}
+        else:
+            reasons[decision.reason] += 1
+            axes = {**generate_axes(get_client(), title, premise, genres), "source": "llm"}
+
         validation = validate_axes(axes, genres)
 
         results.append({
@@ -44,10 +63,13 @@ def main():
             "validation": validation
         })
 
-    OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    write_json(OUT, results)
 
+    local = sum(d.confident for d in decisions)
     print(f"[✓] Axes generated for {len(results)} movies")
+    print(f"[+] Resolved locally: {local}/{len(results)} ({local / max(len(results), 1):.0%})")
+    if reasons:
+        print("[+] Sent to LLM: " + ", ".join(f"{k}={v}" for k, v in reasons.most_common()))
 
 if __name__ == "__main__":
     main()
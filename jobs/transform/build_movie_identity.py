@@ -2,18 +2,19 @@
 
 import sys
 from pathlib import Path
-import json
 
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT))
 
+from pipeline.artifacts import read_json, write_json
+
 PREMISES = ROOT / "data/gold/movie_premises.json"
 AXES = ROOT / "data/gold/movie_axes.json"
 OUT = ROOT / "data/gold/movie_identity.json"
 
 def main():
-    premises = {m["movie_id"]: m for m in json.loads(PREMISES.read_text())}
-    axes = {m["movie_id"]: m for m in json.loads(AXES.read_text())}
+    premises = {m["movie_id"]: m for m in read_json(PREMISES)}
+    axes = {m["movie_id"]: m for m in read_json(AXES)}
 
     merged = []
 
@@ -27,8 +28,7 @@ def main():
             "axes": a.get("axes", [])
         })
 
-    OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(json.dumps(merged, indent=2), encoding="utf-8")
+    write_json(OUT, merged)
 
     print(f"[✓] Movie identity built: {len(merged)} movies")
 
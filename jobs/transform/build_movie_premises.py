@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
 import sys
-import json
 from pathlib import Path
-from dotenv import load_dotenv
-from openai import OpenAI
 
 # --------------------------------------------------
 # Fix import path
@@ -16,57 +13,77 @@ if str(ROOT) not in sys.path:
 # --------------------------------------------------
 # Imports
 # --------------------------------------------------
-from pipeline.transform.premise_generator import generate_premise
+from pipeline.llm_client import get_client
+from pipeline.transform.packing import run_packed
+from pipeline.transform.premise_generator import (
+    clean_premise,
+    generate_premise,
+    generate_premises_packed,
+)
 from pipeline.transform.premise_validator import validate_premise
+from pipeline.transform.retry_scheduler import RetryScheduler
+from pipeline.artifacts import read_silver, write_json
 
 # --------------------------------------------------
 # Paths
 # --------------------------------------------------
-SILVER = ROOT / "data" / "silver" / "movies_silver_validated.json"
+SILVER = ROOT / "data" / "silver" / "movies_silver_validated.parquet"
 OUT = ROOT / "data" / "gold" / "movie_premises.json"
 
-# --------------------------------------------------
-# Setup
-# --------------------------------------------------
-load_dotenv(ROOT / ".env")
-client = OpenAI()
+MAX_ATTEMPTS = 2
 
 # --------------------------------------------------
+def validation(outcome):
+    """
+    Genre keywords are a soft rule: a premise that only misses one is kept
+    as soft_pass; any other failure is flagged.
+    """
+    if not outcome.valid and outcome.reason.startswith("missing_genre_keyword"):
+        # validate_premise stops at the genre check: re-run the other rules
+        ok, reason = validate_premise(outcome.output or "", [])
+        if ok:
+            return {"status": "soft_pass", "reason": outcome.reason}
+        return {"status": "flagged", "reason": reason}
+    return outcome.validation()
+
+
 def main():
-    movies = json.loads(SILVER.read_text(encoding="utf-8"))
+    client = get_client()
+    movies = read_silver(SILVER, columns=["movie_id", "title", "overview", "genres"])
     results = []
 
-    for m in movies:
-        title = m["title"]
-        overview = m.get("overview", "")
-        genres = m.get("genres", [])
-
-        premise = generate_premise(client, title, overview)
-        valid, reason = validate_premise(premise, genres)
+    # K movies per request; failures are repaired locally or re-queued
+    # for one individual request after the packed pass
+    scheduler = RetryScheduler(
+        generate=lambda m: generate_premise(client, m["title"], m.get("overview", "")),
+        validate=lambda m, premise: validate_premise(premise, m.get("genres") or []),
+        repairs=[("clean_premise", lambda m, premise: clean_premise(premise))],
+        max_attempts=MAX_ATTEMPTS,
+    )
+    stats = run_packed(
+        movies,
+        generate_pack=lambda batch: generate_premises_packed(client, batch),
+        scheduler=scheduler,
+    )
 
-        # One retry only
-        if not valid:
-            premise = generate_premise(client, title, overview)
-            valid, reason = validate_premise(premise, genres)
+    for m in movies:
+        outcome = scheduler.outcomes[m["movie_id"]]
 
         results.append({
             "movie_id": m["movie_id"],
-            "title": title,
-            "premise": premise,
-            "validation": {
-            "status": "soft_pass",
-            "reason": "missing_genre_keyword"
-            }
+            "title": m["title"],
+            "premise": outcome.output or "",
+            "validation": validation(outcome),
         })
 
-    OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(
-        json.dumps(results, indent=2, ensure_ascii=False),
-        encoding="utf-8"
-    )
+    write_json(OUT, results, ensure_ascii=False)
 
-    flagged = sum(1 for r in results if r["validation"]["status"] != "pass")
+    flagged = sum(1 for r in results if r["validation"]["status"] == "flagged")
+    soft = sum(1 for r in results if r["validation"]["status"] == "soft_pass")
+    stats.report("Premises")
+    scheduler.report("Premise validation")
     print(f"[✓] Premises generated: {len(results)}")
+    print(f"[!] Soft pass (missing genre keyword): {soft}")
     print(f"[!] Flagged premises: {flagged}")
 
 # --------------------------------------------------
@@ -11,13 +11,16 @@ Output:
 - data/gold/movies_gold.json
 """
 
-import json
+import sys
 from pathlib import Path
 
 # -------------------------------------------------
-# Paths (NO pipeline imports, NO sys.path hacks)
+# Paths
 # -------------------------------------------------
 ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+
+from pipeline.artifacts import exists, read_json, write_json
 
 PREMISES_FILE = ROOT / "data" / "gold" / "movie_premises.json"
 AXES_FILE = ROOT / "data" / "gold" / "movie_axes.json"
@@ -28,10 +31,10 @@ OUT_FILE = ROOT / "data" / "gold" / "movies_gold.json"
 
 def load_indexed(path, key="movie_id"):
     """Load a list of dicts and index by movie_id."""
-    if not path.exists():
+    if not exists(path):
         return {}
 
-    items = json.loads(path.read_text(encoding="utf-8"))
+    items = read_json(path)
     return {item[key]: item for item in items}
 
 
@@ -62,11 +65,7 @@ def main():
             "character_anchors": c.get("character_anchors", [])
         })
 
-    OUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    OUT_FILE.write_text(
-        json.dumps(merged, indent=2, ensure_ascii=False),
-        encoding="utf-8"
-    )
+    write_json(OUT_FILE, merged, ensure_ascii=False)
 
     print(f"[✓] Gold movies merged: {len(merged)}")
     print(f"[✓] Output written to: {OUT_FILE}")
@@ -9,60 +9,45 @@ Adds:
 
 Reads from:
   - data/silver/movies_silver.json
-  - data/bronze/reviews/<movie_id>.json
+  - data/bronze/reviews/ (packed review store + legacy <movie_id>.json files)
 
 Outputs:
-  - data/silver/movies_silver_enriched.json
+  - data/silver/movies_silver_enriched.parquet
 """
 
-import json
+import sys
 from pathlib import Path
 
+import polars as pl
+
 ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+
+from pipeline.artifacts import read_json, write_silver
+from pipeline.extract.review_loader import load_review_table
+from pipeline.transform.silver_io import to_silver_frame
+
 SILVER_IN = ROOT / "data" / "silver" / "movies_silver.json"
-SILVER_OUT = ROOT / "data" / "silver" / "movies_silver_enriched.json"
+SILVER_OUT = ROOT / "data" / "silver" / "movies_silver_enriched.parquet"
 REVIEWS_DIR = ROOT / "data" / "bronze" / "reviews"
 
 
 # ---------------------------------------------------------
-# Load reviews for 1 movie
+# Join reviews onto movies
 # ---------------------------------------------------------
-def load_reviews(movie_id: int):
+def enrich(movies: pl.DataFrame, reviews: pl.DataFrame) -> pl.DataFrame:
     """
-    Returns:
-      list[str] reviews,
-      bool missing_flag
+    Left join on movie_id. No review row (no file, or a malformed one)
+    → reviews = [], reviews_missing = True.
     """
-
-    path = REVIEWS_DIR / f"{movie_id}.json"
-
-    # No file → missing
-    if not path.exists():
-        return [], True
-
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        if not isinstance(data, list):
-            # malformed file
-            return [], True
-
-        cleaned = []
-
-        for r in data:
-            content = r.get("content", "")
-            if isinstance(content, str):
-                text = content.strip()
-                if text:         # skip empty reviews
-                    cleaned.append(text)
-
-        # If file exists but no valid reviews → still "not missing"
-        return cleaned, False
-
-    except Exception:
-        # Any read/parse error → treat as missing
-        return [], True
+    return (
+        movies.drop("reviews", "reviews_missing", strict=False)
+        .join(reviews, on="movie_id", how="left", maintain_order="left")
+        .with_columns(
+            reviews_missing=pl.col("reviews").is_null(),
+            reviews=pl.col("reviews").fill_null([]),
+        )
+    )
 
 
 # ---------------------------------------------------------
@@ -70,36 +55,26 @@ def load_reviews(movie_id: int):
 # ---------------------------------------------------------
 def main():
     # Load silver movies
-    with open(SILVER_IN, "r", encoding="utf-8") as f:
-        movies = json.load(f)
+    movies = read_json(SILVER_IN)
 
     print(f"[+] Loaded {len(movies)} movies from Silver")
 
-    enriched = []
-    missing_count = 0
-
-    for m in movies:
-        mid = m["movie_id"]
-        reviews, missing = load_reviews(mid)
-
-        m["reviews"] = reviews
-        m["reviews_missing"] = missing
+    reviews = load_review_table(REVIEWS_DIR)
+    print(f"[+] Loaded reviews for {reviews.height} movies from {REVIEWS_DIR}")
 
-        if missing:
-            missing_count += 1
-            print(f"   ! Missing reviews for movie_id={mid} → '{m['title']}'")
+    enriched = enrich(to_silver_frame(movies), reviews)
 
-        enriched.append(m)
+    missing = enriched.filter("reviews_missing").select("movie_id", "title")
+    for mid, title in missing.iter_rows():
+        print(f"   ! Missing reviews for movie_id={mid} → '{title}'")
 
     # Save enriched data
-    SILVER_OUT.parent.mkdir(parents=True, exist_ok=True)
-    with open(SILVER_OUT, "w", encoding="utf-8") as f:
-        json.dump(enriched, f, indent=2)
+    write_silver(SILVER_OUT, enriched.to_dicts())
 
     print("\n[✓] Enrichment complete")
     print(f"[✓] Output → {SILVER_OUT}")
-    print(f"[✓] Movies with missing reviews: {missing_count}")
-    print(f"[✓] Movies with reviews: {len(movies) - missing_count}")
+    print(f"[✓] Movies with missing reviews: {missing.height}")
+    print(f"[✓] Movies with reviews: {len(movies) - missing.height}")
 
 
 if __name__ == "__main__":
@@ -5,14 +5,17 @@ Generates:
   data/silver/movies_thematic_and_emotional.json
 
 Input:
-  data/silver/movies_silver_validated.json
+  data/silver/movies_silver_validated.parquet
 
 Output for each movie:
   - critic_summary
   - emotional_capsules (5 per movie)
+
+Both calls per movie run concurrently and many movies are in flight at
+once, capped at LLM_CONCURRENCY requests.
 """
 
-import json
+import asyncio
 import time
 from pathlib import Path
 import sys
@@ -20,36 +23,49 @@ import sys
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT))
 
-from pipeline.transform.critic_extractor import generate_movie_themes_and_capsules
+from pipeline.artifacts import read_silver, write_json
+from pipeline.transform.critic_extractor import StageLatency, agenerate_all, max_concurrency
 
-SILVER_IN = ROOT / "data" / "silver" / "movies_silver_validated.json"
+SILVER_IN = ROOT / "data" / "silver" / "movies_silver_validated.parquet"
 OUT_FILE = ROOT / "data" / "silver" / "movies_thematic_and_emotional.json"
 
 
 def main():
-    with open(SILVER_IN, "r", encoding="utf-8") as f:
-        movies = json.load(f)
+    movies = read_silver(
+        SILVER_IN,
+        columns=["movie_id", "title", "overview", "genres", "validated_reviews"],
+    )
 
     print(f"[+] Loaded {len(movies)} movies.")
     print("[*] Generating critic summaries and emotional capsules…")
 
-    results = []
-
-    for idx, movie in enumerate(movies, start=1):
-        print(f" → ({idx}/{len(movies)}) {movie['title']}")
-
-        try:
-            entry = generate_movie_themes_and_capsules(movie)
-            results.append(entry)
-        except Exception as e:
-            print(f"   !! Error for {movie['title']}: {e}")
-            continue
-
-        time.sleep(0.25)  # polite throttle
-
-    OUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    latency = StageLatency()
+    done = 0
+    failed = 0
+
+    def on_done(movie, entry, error):
+        nonlocal done, failed
+        done += 1
+        if error is not None:
+            failed += 1
+            print(f"   !! Error for {movie['title']}: {error}")
+        else:
+            print(f" → ({done}/{len(movies)}) {movie['title']}")
+
+    concurrency = max_concurrency()
+    start = time.perf_counter()
+    entries = asyncio.run(agenerate_all(movies, concurrency, on_done=on_done, latency=latency))
+    elapsed = time.perf_counter() - start
+
+    results = [e for e in entries if e is not None]
+
+    print(f"[+] {len(results)} movies in {elapsed:.1f}s ({concurrency} requests in flight max)")
+    print("[+] Latency per stage:")
+    latency.report()
+    if failed:
+        print(f"[!] Failed: {failed}")
+
+    write_json(OUT_FILE, results, ensure_ascii=False)
 
     print(f"\n[✓] Saved → {OUT_FILE}")
 
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+"""
+Re-runs the validators over already generated gold artifacts WITHOUT
+regeneration, using the vectorized Polars validators.
+
+Use after a validator rule change:
+- data/gold/movie_premises.json
+- data/gold/movie_critic_summaries.json
+- data/gold/movie_emotional_capsules.json
+
+Skipped records (missing inputs) keep their validation untouched.
+"""
+
+import sys
+from pathlib import Path
+
+import polars as pl
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pipeline.artifacts import exists, read_json, read_silver, write_json
+from pipeline.transform.bulk_validators import (
+    validate_premises_frame,
+    validate_critic_summaries_frame,
+    validate_capsules_frame,
+)
+
+# --------------------------------------------------
+# Paths
+# --------------------------------------------------
+SILVER = ROOT / "data" / "silver" / "movies_silver_validated.parquet"
+GOLD_MOVIES = ROOT / "data" / "gold" / "movies_gold.json"
+PREMISES = ROOT / "data" / "gold" / "movie_premises.json"
+CRITICS = ROOT / "data" / "gold" / "movie_critic_summaries.json"
+CAPSULES = ROOT / "data" / "gold" / "movie_emotional_capsules.json"
+
+
+# --------------------------------------------------
+# Helpers
+# --------------------------------------------------
+def read_records(path: Path) -> pl.DataFrame:
+    return pl.DataFrame(read_json(path), infer_schema_length=None)
+
+
+def write_records(df: pl.DataFrame, path: Path):
+    write_json(path, df.to_dicts(), ensure_ascii=False)
+
+
+def revalidate(df: pl.DataFrame, validated: pl.DataFrame, columns) -> pl.DataFrame:
+    """Keep skipped records as-is, replace validation everywhere else."""
+    previous = df["validation"]
+    skipped = previous.struct.field("status") == "skipped"
+    return validated.with_columns(
+        validation=pl.when(pl.lit(skipped))
+        .then(pl.lit(previous))
+        .otherwise(pl.col("validation"))
+    ).select(columns)
+
+
+def report(name: str, df: pl.DataFrame):
+    counts = (
+        df.group_by(pl.col("validation").struct.field("status"))
+        .len()
+        .sort("status")
+    )
+    summary = ", ".join(f"{s}={n}" for s, n in counts.iter_rows())
+    print(f"[✓] {name}: {summary}")
+
+
+# --------------------------------------------------
+# Stages
+# --------------------------------------------------
+def revalidate_premises():
+    premises = read_records(PREMISES)
+    genres = pl.DataFrame(read_silver(SILVER, ["movie_id", "genres"]), infer_schema_length=None)
+
+    joined = premises.join(genres, on="movie_id", how="left")
+    out = revalidate(premises, validate_premises_frame(joined), premises.columns)
+
+    write_records(out, PREMISES)
+    report("Premises", out)
+
+
+def revalidate_critics():
+    critics = read_records(CRITICS)
+    out = revalidate(critics, validate_critic_summaries_frame(critics), critics.columns)
+
+    write_records(out, CRITICS)
+    report("Critic summaries", out)
+
+
+def revalidate_capsules():
+    capsules = read_records(CAPSULES)
+    axes = read_records(GOLD_MOVIES).select("movie_id", "axes")
+
+    # movie_axes stores {"primary": [...], "secondary": ...}
+    if isinstance(axes.schema["axes"], pl.Struct):
+        axes = axes.with_columns(
+            axes=pl.concat_list(
+                pl.col("axes").struct.field("primary"),
+                pl.col("axes").struct.field("secondary"),
+            ).list.drop_nulls()
+        )
+
+    joined = capsules.join(axes, on="movie_id", how="left")
+    out = revalidate(capsules, validate_capsules_frame(joined), capsules.columns)
+
+    write_records(out, CAPSULES)
+    report("Emotional capsules", out)
+
+
+def main():
+    for path, stage in [
+        (PREMISES, revalidate_premises),
+        (CRITICS, revalidate_critics),
+        (CAPSULES, revalidate_capsules),
+    ]:
+        if not exists(path):
+            print(f"[–] Skipping {path.name} (not generated yet)")
+            continue
+        stage()
+
+
+if __name__ == "__main__":
+    main()
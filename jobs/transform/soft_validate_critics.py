@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 import sys
-import json
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
+from pipeline.artifacts import read_json, write_json
 from pipeline.transform.critic_soft_validator import soft_validate_critic
 
 CRITIC_FILE = ROOT / "data" / "gold" / "movie_critic_summaries.json"
@@ -14,10 +14,10 @@ OUT = ROOT / "data" / "gold" / "movie_critic_summaries_refined.json"
 
 
 def main():
-    critics = json.loads(CRITIC_FILE.read_text(encoding="utf-8"))
+    critics = read_json(CRITIC_FILE)
     movies = {
         m["movie_id"]: m
-        for m in json.loads(MOVIES_FILE.read_text(encoding="utf-8"))
+        for m in read_json(MOVIES_FILE)
     }
 
     fixed = 0
@@ -43,11 +43,10 @@ def main():
             }
             fixed += 1
         else:
-            c["validation"]["reason"] = reason
+            c["validation"] = {**c["validation"], "reason": reason}
             still_flagged += 1
 
-    OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(json.dumps(critics, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_json(OUT, critics, ensure_ascii=False)
 
     print(f"[✓] Soft-validated: {fixed}")
     print(f"[!] Still flagged: {still_flagged}")
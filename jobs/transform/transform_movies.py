@@ -9,29 +9,54 @@ and writes a clean silver file with only necessary fields.
 
 import os
 import json
-import unicodedata
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import polars as pl
+
 ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+
+from pipeline.artifacts import write_json
+from pipeline.transform.text_cleaning import (
+    clean_printable,
+    clean_printable_expr,
+    clean_printable_texts,
+)
+
 BRONZE_DIR = ROOT / "data" / "bronze"
 SILVER_DIR = ROOT / "data" / "silver"
 
+# Bronze row layout written by MovieExtractor.save_raw_movies
+BRONZE_SCHEMA = {
+    "movie_id": pl.Int64,
+    "title": pl.Utf8,
+    "overview": pl.Utf8,
+    "vote_average": pl.Float64,
+    "vote_count": pl.Int64,
+    "popularity": pl.Float64,
+    "poster_path": pl.Utf8,
+    "source_category": pl.Utf8,
+    "genres": pl.List(pl.Struct({"id": pl.Int64, "name": pl.Utf8})),
+    "imdb_id": pl.Utf8,
+}
+
+SILVER_COLUMNS = [
+    "movie_id", "imdb_id", "title", "overview", "poster_path",
+    "vote_count", "vote_average", "popularity",
+    "genres", "source_categories",
+]
+
 
 # ---------------------------------------------------------
 # Unicode + Text Cleaning
 # ---------------------------------------------------------
 def clean_text(value):
-    if not value:
-        return value
-
-    # Normalize Unicode (fix accents, dots, quotes, WALL·E stays correct)
-    value = unicodedata.normalize("NFKC", value)
-
-    # Remove control chars / zero-width chars
-    value = "".join(ch for ch in value if ch.isprintable())
-
-    return value.strip()
+    # NFKC (fix accents, dots, quotes, WALL·E stays correct), then drop
+    # control / zero-width chars through a memoized translate table
+    return clean_printable(value)
 
 
 def is_valid_imdb(imdb_id):
@@ -76,15 +101,17 @@ def merge_movies(movies):
 
     merged = {}
 
-    for m in movies:
+    # Clean every title / overview in two bulk passes (memoized by text)
+    titles = clean_printable_texts([m.get("title", "") for m in movies])
+    overviews = clean_printable_texts([m.get("overview", "") for m in movies])
+
+    for m, title, overview in zip(movies, titles, overviews):
         mid = m["movie_id"]
 
         # -------------------------------
         # Data Quality checks
         # -------------------------------
         imdb_id = m.get("imdb_id")
-        title = clean_text(m.get("title", ""))
-        overview = clean_text(m.get("overview", ""))
 
         # Invalid → skip movie entirely
         if not title or not imdb_id or not is_valid_imdb(imdb_id):
@@ -145,15 +172,119 @@ def merge_movies(movies):
     return list(merged.values())
 
 
+# ---------------------------------------------------------
+# Vectorized (Polars) equivalents
+# ---------------------------------------------------------
+def clean_text_expr(col: str) -> pl.Expr:
+    """clean_text() as a column expression: NFKC, drop non-printables, strip."""
+    return clean_printable_expr(pl.col(col))
+
+
+def is_valid_imdb_expr(col: str) -> pl.Expr:
+    return pl.col(col).str.contains(r"^tt\d{7,}").fill_null(False)
+
+
+def _read_bronze_file(path: Path) -> pl.DataFrame:
+    return pl.read_json(path, schema=BRONZE_SCHEMA)
+
+
+def scan_bronze_files() -> pl.LazyFrame:
+    """
+    Reads all *_raw.json bronze files in parallel.
+    File order (and row order inside each file) is preserved in `_order`,
+    since the silver output keeps first-seen order.
+    """
+    files = [f for f in BRONZE_DIR.glob("*_raw.json") if f.is_file()]
+
+    with ThreadPoolExecutor() as pool:
+        frames = list(pool.map(_read_bronze_file, files))
+
+    print(f"[+] Loaded {len(files)} bronze files")
+    print(f"[+] Total rows loaded: {sum(f.height for f in frames)}")
+
+    if not frames:
+        return pl.DataFrame(schema=BRONZE_SCHEMA).lazy().with_row_index("_order")
+
+    return pl.concat(frames).lazy().with_row_index("_order")
+
+
+def _dedupe_genres(merged: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Dedupe genres by id like {g["id"]: g for g in genres}:
+    position of the first occurrence, value of the last one.
+    """
+    return (
+        merged.select("movie_id", "genres")
+        .explode("genres")
+        .with_columns(_pos=pl.int_range(pl.len()).over("movie_id"))
+        .filter(pl.col("genres").is_not_null())
+        .group_by("movie_id", pl.col("genres").struct.field("id").alias("_gid"))
+        .agg(pl.col("_pos").min(), pl.col("genres").last())
+        .sort("movie_id", "_pos")
+        .group_by("movie_id", maintain_order=True)
+        .agg("genres")
+    )
+
+
+def merge_movies_lazy(bronze: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    LazyFrame version of merge_movies(): same quality checks and merge rules,
+    expressed as vectorized cleaning plus one group_by aggregation.
+    """
+    overview_len = pl.col("overview").str.len_chars()
+    has_poster = pl.col("poster_path").is_not_null() & (pl.col("poster_path") != "")
+
+    valid = (
+        bronze
+        .with_columns(
+            title=clean_text_expr("title"),
+            overview=clean_text_expr("overview"),
+        )
+        .filter(
+            pl.col("title").is_not_null()
+            & (pl.col("title") != "")
+            & is_valid_imdb_expr("imdb_id")
+        )
+    )
+
+    merged = (
+        valid.group_by("movie_id")
+        .agg(
+            pl.col("_order").min(),
+            pl.col("imdb_id").first(),
+            pl.col("title").first(),
+            # Longest overview, earliest wins ties
+            pl.col("overview").filter(overview_len == overview_len.max()).first(),
+            # First non-empty poster, else whatever the first row had
+            pl.coalesce(
+                pl.col("poster_path").filter(has_poster).first(),
+                pl.col("poster_path").first(),
+            ),
+            pl.col("vote_count").max(),
+            pl.col("vote_average").max(),
+            pl.col("popularity").max(),
+            pl.col("genres").last(),
+            pl.col("source_category").unique().sort().alias("source_categories"),
+        )
+    )
+
+    genres = _dedupe_genres(merged)
+
+    return (
+        merged.drop("genres")
+        .join(genres, on="movie_id", how="left")
+        .with_columns(pl.col("genres").fill_null([]))
+        .sort("_order")
+        .select(SILVER_COLUMNS)
+    )
+
+
 # ---------------------------------------------------------
 # Save Silver Output
 # ---------------------------------------------------------
 def save_silver(movies):
-    SILVER_DIR.mkdir(parents=True, exist_ok=True)
     outpath = SILVER_DIR / "movies_silver.json"
-
-    with open(outpath, "w", encoding="utf-8") as f:
-        json.dump(movies, f, indent=2)
+    write_json(outpath, movies)
 
     print(f"[+] Saved {len(movies)} unique, clean movies → {outpath}")
 
@@ -162,9 +293,8 @@ def save_silver(movies):
 # Main
 # ---------------------------------------------------------
 def main():
-    movies = load_bronze_files()
-    merged = merge_movies(movies)
-    save_silver(merged)
+    merged = merge_movies_lazy(scan_bronze_files()).collect()
+    save_silver(merged.to_dicts())
 
 
 if __name__ == "__main__":
@@ -2,109 +2,301 @@
 """
 jobs/transform/build_gold_movies.py
 
-Reads Silver movie dataset (JSON), normalizes into 4 Parquet tables:
+Reads Silver movie dataset (JSON), normalizes into Parquet tables:
 - movies.parquet
 - genres.parquet
-- movie_genres.parquet
-- movie_source_categories.parquet
+- movie_genres/genre_id=<id>/                     (Hive-partitioned)
+- movie_source_categories/source_category=<cat>/  (Hive-partitioned)
+
+and, with --bitsets (the gold-bitsets stage, after the axes stage):
+- bit_dimensions.parquet   (genre / source category / axis → bit)
+- movie_bitsets.parquet    (per-movie BIGINT masks, see pipeline.db.mood_query)
+
+Files are zstd-compressed, sorted (movie_id first) and cut into row groups
+of ROW_GROUP_SIZE rows, so the min/max statistics in each row group let
+DuckDB / Polars scans skip what a filter cannot match; partitioned tables
+are pruned by directory. Read them with db_setup.gold_scan or
+pl.scan_parquet(".../movie_genres/**/*.parquet", hive_partitioning=True).
 
 This is the final Gold layer, optimized for DuckDB.
+
+The normalization is plain DuckDB SQL over the silver file (unnest of
+genres / source categories, the last name seen per id for the genre
+master), so rows stream straight from silver into Parquet — or into
+cheerbox.db with --db — without being materialized as Python objects.
 """
 
-import json
+import argparse
+import sys
 from pathlib import Path
-import polars as pl
+
+import duckdb
 
 # Paths
 ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+
+from pipeline.db.db_setup import DDL_STATEMENTS, DB_PATH, GOLD_PARTITIONS, sql_path
+from pipeline.transform.axis_ontology import ONTOLOGY
+
 SILVER_FILE = ROOT / "data" / "silver" / "movies_silver.json"
 GOLD_DIR = ROOT / "data" / "gold"
+MOVIE_AXES_FILE = GOLD_DIR / "movie_axes.json"
+
+# Masks are BIGINT: bits 0..62 per dimension
+MAX_BITS = 63
+
+# Parquet layout: small enough row groups for min/max pruning on movie_id
+ROW_GROUP_SIZE = 65_536
+COMPRESSION = "zstd"
+
+# Clustering order per table (default: movie_id)
+SORT_KEYS = {
+    "genres": "genre_id",
+    "bit_dimensions": "kind, bit",
+}
+
+# Silver layout (see transform_movies.SILVER_COLUMNS)
+# (integers are BIGINT, the int64 the Parquet files always had)
+SILVER_COLUMNS = {
+    "movie_id": "BIGINT",
+    "imdb_id": "VARCHAR",
+    "title": "VARCHAR",
+    "overview": "VARCHAR",
+    "poster_path": "VARCHAR",
+    "vote_count": "BIGINT",
+    "vote_average": "DOUBLE",
+    "popularity": "DOUBLE",
+    "genres": "STRUCT(id BIGINT, name VARCHAR)[]",
+    "source_categories": "VARCHAR[]",
+}
+
+# ---------------------------------------------------------
+# Gold tables (parents first, so FK order is respected)
+# ---------------------------------------------------------
+GOLD_QUERIES = {
+    "movies": """
+        SELECT
+            movie_id, imdb_id, title, overview, poster_path,
+            coalesce(vote_count, 0) AS vote_count,
+            coalesce(vote_average, 0.0) AS vote_average,
+            coalesce(popularity, 0.0) AS popularity
+        FROM silver
+    """,
+
+    "genres": """
+        SELECT genre_id, genre_name
+        FROM genre_names
+        ORDER BY genre_id
+    """,
 
+    "movie_genres": """
+        SELECT movie_id, g.id AS genre_id
+        FROM (SELECT movie_id, unnest(genres) AS g FROM silver)
+    """,
+
+    "movie_source_categories": """
+        SELECT movie_id, unnest(source_categories) AS source_category
+        FROM silver
+    """,
+}
 
 # ---------------------------------------------------------
-# Load Silver JSON
+# Bitmask tables (need the axes: built by run_bitsets)
 # ---------------------------------------------------------
-def load_silver():
+BITSET_QUERIES = {
+    "bit_dimensions": """
+        SELECT 'genre' AS kind, CAST(genre_id AS VARCHAR) AS key, genre_name AS label, bit FROM genre_bits
+        UNION ALL
+        SELECT 'source_category', source_category, source_category, bit FROM category_bits
+        UNION ALL
+        SELECT 'axis', axis_name, axis_name, bit FROM axis_bits
+    """,
+
+    "movie_bitsets": """
+        WITH genre_masks AS (
+            SELECT mg.movie_id, bit_or(1::BIGINT << gb.bit) AS mask
+            FROM (SELECT movie_id, unnest(genres).id AS genre_id FROM silver) mg
+            JOIN genre_bits gb USING (genre_id)
+            GROUP BY mg.movie_id
+        ),
+        category_masks AS (
+            SELECT sc.movie_id, bit_or(1::BIGINT << cb.bit) AS mask
+            FROM (SELECT movie_id, unnest(source_categories) AS source_category FROM silver) sc
+            JOIN category_bits cb USING (source_category)
+            GROUP BY sc.movie_id
+        ),
+        axis_masks AS (
+            SELECT
+                ma.movie_id,
+                bit_or(1::BIGINT << ab.bit) AS mask,
+                bit_or(CASE WHEN ma.is_primary THEN 1::BIGINT << ab.bit ELSE 0 END) AS primary_mask
+            FROM movie_axes ma
+            JOIN axis_bits ab USING (axis_name)
+            GROUP BY ma.movie_id
+        )
+        SELECT
+            s.movie_id,
+            coalesce(g.mask, 0) AS genre_mask,
+            coalesce(c.mask, 0) AS category_mask,
+            coalesce(a.mask, 0) AS axis_mask,
+            coalesce(a.primary_mask, 0) AS primary_axis_mask
+        FROM silver s
+        LEFT JOIN genre_masks g USING (movie_id)
+        LEFT JOIN category_masks c USING (movie_id)
+        LEFT JOIN axis_masks a USING (movie_id)
+    """,
+}
+
+# In FK order: every table only references tables before it
+ALL_TABLES = [*GOLD_QUERIES, *BITSET_QUERIES]
+
+
+# ---------------------------------------------------------
+# Register Silver JSON as a view
+# ---------------------------------------------------------
+def register_silver(con):
     if not SILVER_FILE.exists():
         raise FileNotFoundError(f"Silver file not found: {SILVER_FILE}")
 
-    with open(SILVER_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    columns = ", ".join(f"'{name}': '{dtype}'" for name, dtype in SILVER_COLUMNS.items())
+    con.execute(f"""
+        CREATE OR REPLACE TEMP VIEW silver AS
+        SELECT * FROM read_json({sql_path(SILVER_FILE)}, format = 'array', columns = {{{columns}}});
+    """)
+
+    # One name per genre id: the last one seen in silver order wins
+    con.execute("""
+        CREATE OR REPLACE TEMP VIEW genre_names AS
+        SELECT g.id AS genre_id, g.name AS genre_name
+        FROM (
+            SELECT row_number() OVER () AS movie_pos, unnest(genres) AS g,
+                   generate_subscripts(genres, 1) AS genre_pos
+            FROM silver
+        )
+        QUALIFY row_number() OVER (PARTITION BY g.id ORDER BY movie_pos DESC, genre_pos DESC) = 1;
+    """)
 
 
 # ---------------------------------------------------------
-# Build normalized Gold tables
+# Bit positions (dense, in key order) and the axes per movie
 # ---------------------------------------------------------
-def build_gold_tables(silver_movies):
-    movies_rows = []
-    genres_map = {}               # genre_id → genre_name
-    movie_genres_rows = []
-    source_categories_rows = []
-
-    for m in silver_movies:
-        mid = m["movie_id"]
-
-        # ------------ 1. movies table ------------
-        movies_rows.append({
-            "movie_id": mid,
-            "imdb_id": m["imdb_id"],
-            "title": m["title"],
-            "overview": m["overview"],
-            "poster_path": m.get("poster_path"),
-            "vote_count": m.get("vote_count", 0),
-            "vote_average": m.get("vote_average", 0.0),
-            "popularity": m.get("popularity", 0.0),
-        })
-
-        # ------------ 2. genres + movie_genres ------------
-        for g in m.get("genres", []):
-            gid, gname = g["id"], g["name"]
-            genres_map[gid] = gname  # dedupe master list
-
-            movie_genres_rows.append({
-                "movie_id": mid,
-                "genre_id": gid,
-            })
-
-        # ------------ 3. source categories ------------
-        for cat in m.get("source_categories", []):
-            source_categories_rows.append({
-                "movie_id": mid,
-                "source_category": cat
-            })
-
-    return movies_rows, genres_map, movie_genres_rows, source_categories_rows
+def register_dimensions(con):
+    if not MOVIE_AXES_FILE.exists():
+        raise FileNotFoundError(f"{MOVIE_AXES_FILE} not found: run the axes stage before gold-bitsets")
+
+    con.execute("""
+        CREATE OR REPLACE TEMP VIEW genre_bits AS
+        SELECT genre_id, genre_name, CAST(row_number() OVER (ORDER BY genre_id) - 1 AS INTEGER) AS bit
+        FROM genre_names;
+
+        CREATE OR REPLACE TEMP VIEW category_bits AS
+        SELECT source_category, CAST(row_number() OVER (ORDER BY source_category) - 1 AS INTEGER) AS bit
+        FROM (SELECT DISTINCT unnest(source_categories) AS source_category FROM silver);
+    """)
+
+    # Axis bits are the ontology's axis IDs
+    con.execute("CREATE OR REPLACE TEMP TABLE axis_bits (axis_name VARCHAR, bit INTEGER);")
+    con.executemany("INSERT INTO axis_bits VALUES (?, ?);", [[name, i] for i, name in enumerate(ONTOLOGY.names)])
+
+    axes_json = (
+        f"read_json({sql_path(MOVIE_AXES_FILE)}, format = 'array', "
+        """columns = {'movie_id': 'BIGINT', 'axes': 'STRUCT("primary" VARCHAR[], secondary VARCHAR)'})"""
+    )
+    con.execute(f"""
+        CREATE OR REPLACE TEMP VIEW movie_axes AS
+        SELECT movie_id, unnest(axes."primary") AS axis_name, true AS is_primary
+        FROM {axes_json}
+        UNION ALL
+        SELECT movie_id, axes.secondary, false
+        FROM {axes_json}
+        WHERE axes.secondary IS NOT NULL;
+    """)
+
+    for view in ("genre_bits", "category_bits", "axis_bits"):
+        bits = con.execute(f"SELECT count(*) FROM {view};").fetchone()[0]
+        if bits > MAX_BITS:
+            raise ValueError(f"{view}: {bits} values do not fit a BIGINT mask ({MAX_BITS} max)")
 
 
 # ---------------------------------------------------------
 # Save to Parquet (DuckDB-ready)
 # ---------------------------------------------------------
-def save_parquet(movies, genres_map, movie_genres, source_categories):
+def save_parquet(con, queries=GOLD_QUERIES):
     GOLD_DIR.mkdir(parents=True, exist_ok=True)
 
-    # 1. movies.parquet
-    pl.DataFrame(movies).write_parquet(GOLD_DIR / "movies.parquet")
-
-    # 2. genres.parquet
-    genres_rows = [{"genre_id": gid, "genre_name": name} for gid, name in genres_map.items()]
-    pl.DataFrame(genres_rows).write_parquet(GOLD_DIR / "genres.parquet")
+    for table, query in queries.items():
+        options = f"FORMAT parquet, COMPRESSION {COMPRESSION}, ROW_GROUP_SIZE {ROW_GROUP_SIZE}"
+        single = GOLD_DIR / f"{table}.parquet"
 
-    # 3. movie_genres.parquet
-    pl.DataFrame(movie_genres).write_parquet(GOLD_DIR / "movie_genres.parquet")
+        if table in GOLD_PARTITIONS:
+            out = GOLD_DIR / table
+            options += f", PARTITION_BY ({', '.join(GOLD_PARTITIONS[table])}), OVERWRITE"
+            single.unlink(missing_ok=True)   # pre-partitioning layout
+        else:
+            out = single
 
-    # 4. movie_source_categories.parquet
-    pl.DataFrame(source_categories).write_parquet(GOLD_DIR / "movie_source_categories.parquet")
+        sort = SORT_KEYS.get(table, "movie_id")
+        con.execute(f"COPY (SELECT * FROM ({query}) ORDER BY {sort}) TO {sql_path(out)} ({options});")
 
     print(f"[+] Gold Parquet tables created in {GOLD_DIR}")
 
 
+# ---------------------------------------------------------
+# Load straight into cheerbox.db
+# ---------------------------------------------------------
+def load_database(con, queries=GOLD_QUERIES):
+    for ddl in DDL_STATEMENTS:
+        con.execute(ddl)
+
+    # children first on delete (including tables built later, which
+    # reference these), parents first on insert
+    first = ALL_TABLES.index(next(iter(queries)))
+    for table in reversed(ALL_TABLES[first:]):
+        con.execute(f"DELETE FROM {table};")
+
+    for table, query in queries.items():
+        con.execute(f"INSERT INTO {table} {query};")
+        count = con.execute(f"SELECT COUNT(*) FROM {table};").fetchone()[0]
+        print(f"    → {table}: {count} rows")
+
+    print(f"[+] Gold tables loaded into {DB_PATH}")
+
+
 # ---------------------------------------------------------
 # Main
 # ---------------------------------------------------------
+def run(db: bool = False):
+    con = duckdb.connect(str(DB_PATH) if db else ":memory:")
+    register_silver(con)
+
+    save_parquet(con)
+    if db:
+        load_database(con)
+
+    con.close()
+
+
+def run_bitsets(db: bool = False):
+    """bit_dimensions + movie_bitsets; fails if movie_axes.json is missing."""
+    con = duckdb.connect(str(DB_PATH) if db else ":memory:")
+    register_silver(con)
+    register_dimensions(con)
+
+    save_parquet(con, BITSET_QUERIES)
+    if db:
+        load_database(con, BITSET_QUERIES)
+
+    con.close()
+
+
 def main():
-    silver_movies = load_silver()
-    movies, genres_map, movie_genres, source_categories = build_gold_tables(silver_movies)
-    save_parquet(movies, genres_map, movie_genres, source_categories)
+    parser = argparse.ArgumentParser(description="Build the gold movie tables from silver.")
+    parser.add_argument("--db", action="store_true", help=f"also load the tables into {DB_PATH.name}")
+    parser.add_argument("--bitsets", action="store_true",
+                        help="build the bitmask tables instead (after build_movie_axes)")
+    args = parser.parse_args()
+    (run_bitsets if args.bitsets else run)(db=args.db)
 
 
 if __name__ == "__main__":
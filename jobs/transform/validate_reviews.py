@@ -6,26 +6,35 @@ Optimized version:
  - Pre-calculates context embeddings ONCE per movie.
  - Uses fast relevance scoring without recomputing embeddings.
  - Dedup + ranking still identical.
+ - Reviews are compact slotted records; embeddings sit in one float32
+   matrix per movie and all bookkeeping is index-based.
 """
 
-import json
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from collections import defaultdict
+from typing import Dict, Optional
 import sys
 
+import numpy as np
+
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT))
 
 from pipeline.transform.nlp_utils import (
-    clean_text,
-    get_embedding,
-    sentiment_score,
-    cosine_sim,
+    clean_texts,
+    get_embeddings,
+    report_embedding_throughput,
+    sentiment_scores,
+    save_embedding_cache,
 )
+from pipeline.transform.embedding_pool import start_embedding_pool
+from pipeline.llm_client import load_env
+from pipeline.artifacts import read_silver, write_silver
 
 ROOT = Path(__file__).resolve().parents[2]
-SILVER_IN = ROOT / "data" / "silver" / "movies_silver_enriched.json"
-SILVER_OUT = ROOT / "data" / "silver" / "movies_silver_validated.json"
+SILVER_IN = ROOT / "data" / "silver" / "movies_silver_enriched.parquet"
+SILVER_OUT = ROOT / "data" / "silver" / "movies_silver_validated.parquet"
 
 # thresholds
 RELEVANCE_THRESHOLD = 0.62
@@ -33,6 +42,15 @@ DUPLICATE_SIM_THRESHOLD = 0.92
 MIN_REVIEW_LENGTH = 40
 MAX_KEEP_PER_MOVIE = 10
 
+# movies per embedding / sentiment batch
+PREFETCH_MOVIES = 256
+
+
+def embedding_workers() -> int:
+    """EMBEDDING_WORKERS: embedding worker processes (0/1 = in-process)."""
+    load_env()
+    return int(os.getenv("EMBEDDING_WORKERS", "0"))
+
 
 # -------------------------------------------------------------------
 # Create keyword set from movie genres
@@ -62,61 +80,98 @@ def genre_to_keywords(genres):
 
 
 # -------------------------------------------------------------------
-# NEW OPTIMIZED RELEVANCE FUNCTION
+# Compact per-review record
 # -------------------------------------------------------------------
-def relevance_from_embeddings(review_emb, context_embs, threshold):
+@dataclass(slots=True)
+class ReviewRecord:
     """
-    Efficient version of is_relevant:
-      - review_emb: vector
-      - context_embs: list of vectors
+    One candidate review. The embedding lives in the movie's float32
+    matrix at `row` (-1 when embedding failed), not on the record.
     """
-    if review_emb is None:
-        return {"score": 0.0, "relevant": False, "best_context_idx": None}
+    content: str
+    polarity: float
+    subjectivity: float
+    row: int
+    score: float = 0.0
+    relevant: bool = False
+    best_context_idx: Optional[int] = None
+    keep: Optional[bool] = None
+    reason: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "content": self.content,
+            "length": len(self.content),
+            "sentiment": {"polarity": self.polarity, "subjectivity": self.subjectivity},
+            "relevance": {
+                "score": self.score,
+                "relevant": self.relevant,
+                "best_context_idx": self.best_context_idx,
+            },
+            "keep": self.keep,
+            "reason": self.reason,
+        }
 
-    best_score = 0.0
-    best_idx = None
 
-    for i, c_emb in enumerate(context_embs):
-        if c_emb is None:
-            continue
-        score = cosine_sim(review_emb, c_emb)
-        if score > best_score:
-            best_score = score
-            best_idx = i
+def embedding_matrix(embeddings) -> np.ndarray:
+    """Stacks vectors into one row-normalized float32 matrix (zero rows stay zero)."""
+    if not embeddings:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    mat = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    np.divide(mat, norms, out=mat, where=norms > 0)
+    return mat
+
 
-    return {
-        "score": best_score,
-        "relevant": best_score >= threshold,
-        "best_context_idx": best_idx,
-    }
+# -------------------------------------------------------------------
+# Relevance (all reviews of a movie at once)
+# -------------------------------------------------------------------
+def score_relevance(records, review_matrix, context_embs, threshold):
+    """
+    Best cosine similarity of each review against the movie contexts.
+    Scores start at 0.0, so best_context_idx stays None unless some
+    context is positively similar; failed contexts are skipped.
+    """
+    ctx_idx = [i for i, c in enumerate(context_embs) if c is not None]
+    if not ctx_idx or not len(review_matrix):
+        return
+
+    ctx_matrix = embedding_matrix([context_embs[i] for i in ctx_idx])
+    sims = review_matrix @ ctx_matrix.T
+    best = sims.argmax(axis=1)
+
+    for r in records:
+        if r.row < 0:
+            continue
+        j = best[r.row]
+        score = float(sims[r.row, j])
+        if score > 0.0:
+            r.score = score
+            r.best_context_idx = ctx_idx[j]
+        r.relevant = r.score >= threshold
 
 
 # -------------------------------------------------------------------
 # Remove duplicates by embedding
 # -------------------------------------------------------------------
-def dedupe_by_embedding(review_items):
+def dedupe_by_embedding(records, review_matrix):
+    """Greedy near-duplicate removal in review order."""
     kept = []
-    embeddings = []
-
-    for r in review_items:
-        emb = r.get("embedding")
+    kept_rows = []
 
-        if emb is None:
+    for r in records:
+        if r.row < 0:
             kept.append(r)
-            embeddings.append(None)
             continue
 
-        duplicate = False
-        for other_emb in embeddings:
-            if other_emb is None:
+        if kept_rows:
+            sims = review_matrix[kept_rows] @ review_matrix[r.row]
+            if sims.max() >= DUPLICATE_SIM_THRESHOLD:
                 continue
-            if cosine_sim(emb, other_emb) >= DUPLICATE_SIM_THRESHOLD:
-                duplicate = True
-                break
 
-        if not duplicate:
-            kept.append(r)
-            embeddings.append(emb)
+        kept.append(r)
+        kept_rows.append(r.row)
 
     return kept
 
@@ -124,7 +179,11 @@ def dedupe_by_embedding(review_items):
 # -------------------------------------------------------------------
 # MAIN MOVIE PROCESSING LOGIC
 # -------------------------------------------------------------------
-def process_movie(m):
+def movie_texts(m):
+    """
+    Returns (context_texts, candidate_reviews) for a movie:
+    the texts that need embeddings.
+    """
     overview = m.get("overview", "") or ""
     genres = m.get("genres", [])
 
@@ -137,137 +196,165 @@ def process_movie(m):
     if gk:
         context_texts.append(gk)
 
-    # PRE-CALCULATE CONTEXT EMBEDDINGS (big optimization)
-    context_embs = []
-    for c in context_texts:
-        try:
-            context_embs.append(get_embedding(c))
-        except:
-            context_embs.append(None)
-
-    validated_reviews = []
-    review_items_for_dedupe = []
-
     reviews = m.get("reviews", []) or []
 
-    # -------- Review Loop ----------
-    for rev in reviews:
-        cleaned = clean_text(rev)
+    candidates = []
+    seen = set()
 
-        # Too short to be meaningful
+    for cleaned in clean_texts(reviews):
+        # Too short to be meaningful (never part of the output)
         if len(cleaned) < MIN_REVIEW_LENGTH:
-            validated_reviews.append({
-                "content": cleaned,
-                "length": len(cleaned),
-                "sentiment": sentiment_score(cleaned),
-                "relevance": {"score": 0.0, "relevant": False, "best_context_idx": None},
-                "embedding": None,
-                "keep": False,
-                "reason": "too_short",
-            })
             continue
 
-        # Compute review embedding once
-        try:
-            r_emb = get_embedding(cleaned)
-        except:
-            r_emb = None
-
-        # Compute relevance using cached context embeddings
-        rel = relevance_from_embeddings(
-            r_emb,
-            context_embs,
-            threshold=RELEVANCE_THRESHOLD,
-        )
-
-        item = {
-            "content": cleaned,
-            "length": len(cleaned),
-            "sentiment": sentiment_score(cleaned),
-            "relevance": rel,
-            "embedding": r_emb,
-            "keep": None,
-            "reason": None
-        }
+        # Identical text → identical record; keep the first
+        if cleaned in seen:
+            continue
+        seen.add(cleaned)
+        candidates.append(cleaned)
 
-        review_items_for_dedupe.append(item)
+    return context_texts, candidates
+
+
+def process_movie(m, embed=get_embeddings, sentiment=sentiment_scores):
+    """
+    Validates one movie's reviews. `embed` maps a list of texts to a list
+    of vectors (or None), `sentiment` to a list of {polarity, subjectivity};
+    main() passes lookups into prefetched embeddings and sentiments.
+    """
+    context_texts, candidates = movie_texts(m)
+
+    # PRE-CALCULATE CONTEXT EMBEDDINGS (big optimization)
+    context_embs = embed(context_texts)
+
+    # All review embeddings of the movie in one batch
+    review_embs = embed(candidates)
+
+    records = []
+    embeddings = []
+
+    # -------- Review Loop ----------
+    for cleaned, r_emb, s in zip(candidates, review_embs, sentiment(candidates)):
+        records.append(ReviewRecord(
+            content=cleaned,
+            polarity=s["polarity"],
+            subjectivity=s["subjectivity"],
+            row=len(embeddings) if r_emb is not None else -1,
+        ))
+        if r_emb is not None:
+            embeddings.append(r_emb)
+
+    review_matrix = embedding_matrix(embeddings)
+
+    # Relevance using cached context embeddings
+    score_relevance(records, review_matrix, context_embs, RELEVANCE_THRESHOLD)
 
     # -------- DEDUPE ----------
-    deduped = dedupe_by_embedding(review_items_for_dedupe)
+    deduped = dedupe_by_embedding(records, review_matrix)
 
     # -------- RANKING ----------
     ranked = sorted(
-        deduped,
-        key=lambda x: (
-            x["relevance"]["score"],
-            x["length"],
-            abs(x["sentiment"]["polarity"]),
+        range(len(deduped)),
+        key=lambda i: (
+            deduped[i].score,
+            len(deduped[i].content),
+            abs(deduped[i].polarity),
         ),
         reverse=True,
     )
 
-    keep_set = set()
-    for r in ranked[:MAX_KEEP_PER_MOVIE]:
-        r["keep"] = True
-        r["reason"] = "top_ranked"
-        keep_set.add(r["content"])
-
     for r in deduped:
-        if r["content"] not in keep_set:
-            r["keep"] = False
-            r["reason"] = "low_rank"
+        r.keep = False
+        r.reason = "low_rank"
 
-    # Combine in original review order
-    final = []
-    content_to_item = {r["content"]: r for r in deduped}
+    for i in ranked[:MAX_KEEP_PER_MOVIE]:
+        deduped[i].keep = True
+        deduped[i].reason = "top_ranked"
 
-    for orig in reviews:
-        c = clean_text(orig)
-        if c in content_to_item:
-            final.append(content_to_item[c])
-            content_to_item.pop(c, None)
+    # Already in original review order
+    return deduped
 
-    # Add any leftover deduped items
-    for r in deduped:
-        if r["content"] not in [v["content"] for v in final]:
-            final.append(r)
 
-    return final
+# -------------------------------------------------------------------
+# Embedding prefetch
+# -------------------------------------------------------------------
+def prefetch_embeddings(movies):
+    """
+    Embeds every text of a group of movies in one batch (so a worker pool
+    sees enough work to use all cores) and returns a lookup `embed` function.
+    """
+    texts = []
+    for m in movies:
+        context_texts, candidates = movie_texts(m)
+        texts += context_texts + candidates
+    texts = list(dict.fromkeys(texts))
+
+    vectors = dict(zip(texts, get_embeddings(texts)))
+    return lambda batch: [vectors.get(t) for t in batch]
+
+
+def prefetch_sentiments(movies):
+    """
+    Scores every candidate review of a group of movies in one batch (the
+    lexicon scorer's per-call overhead dwarfs a single movie's reviews) and
+    returns a lookup `sentiment` function.
+    """
+    texts = []
+    for m in movies:
+        texts += movie_texts(m)[1]
+    texts = list(dict.fromkeys(texts))
+
+    scores = dict(zip(texts, sentiment_scores(texts)))
+    return lambda batch: [scores[t] for t in batch]
 
 
 # -------------------------------------------------------------------
 # MAIN SCRIPT
 # -------------------------------------------------------------------
 def main():
-    with open(SILVER_IN, "r", encoding="utf-8") as f:
-        movies = json.load(f)
+    movies = read_silver(SILVER_IN)
 
     print(f"[+] Loaded {len(movies)} movies for validation.")
 
+    pool = None
+    workers = embedding_workers()
+    if workers > 1:
+        pool = start_embedding_pool(workers)
+        print(f"[+] Embedding pool: {pool.workers} workers × {pool.threads_per_worker} threads")
+
     validated = []
     missing = 0
     total_reviews = 0
     kept_total = 0
 
-    for m in movies:
-        total_reviews += len(m.get("reviews", []))
-        if m.get("reviews_missing"):
-            missing += 1
+    try:
+        for start in range(0, len(movies), PREFETCH_MOVIES):
+            chunk = movies[start:start + PREFETCH_MOVIES]
+
+            # One bulk cleaning pass; movie_texts() below only hits the memo
+            clean_texts([r for m in chunk for r in m.get("reviews", []) or []])
+
+            embed = prefetch_embeddings(chunk)
+            sentiment = prefetch_sentiments(chunk)
 
-        processed = process_movie(m)
+            for m in chunk:
+                total_reviews += len(m.get("reviews", []))
+                if m.get("reviews_missing"):
+                    missing += 1
 
-        # Remove embeddings before writing output
-        for r in processed:
-            r.pop("embedding", None)
+                processed = [r.to_dict() for r in process_movie(m, embed, sentiment)]
 
-        kept_total += sum(r["keep"] for r in processed)
+                kept_total += sum(r["keep"] for r in processed)
 
-        m_out = dict(m)
-        m_out["validated_reviews"] = processed
-        validated.append(m_out)
+                m_out = dict(m)
+                m_out["validated_reviews"] = processed
+                validated.append(m_out)
+    finally:
+        if pool is not None:
+            pool.close()
 
-    with open(SILVER_OUT, "w", encoding="utf-8") as f:
-        json.dump(validated, f, indent=2, ensure_ascii=False)
+    write_silver(SILVER_OUT, validated)
+    save_embedding_cache()
+    report_embedding_throughput()
 
     print(f"[✓] Saved validated reviews → {SILVER_OUT}")
     print(f"[✓] Movies missing reviews: {missing}")
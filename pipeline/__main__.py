@@ -0,0 +1,5 @@
+# pipeline/__main__.py
+
+from pipeline.cli import main
+
+main()
@@ -0,0 +1,118 @@
+# pipeline/artifacts.py
+
+"""
+Artifact I/O shared by the jobs.
+
+Run as scripts, jobs read and write their files exactly as before. Inside a
+CLI session (see pipeline.cli), every written artifact is also kept in
+memory, so a later stage in the same process gets it without re-parsing,
+and outputs marked deferred are only written to disk when flushed.
+"""
+
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from pipeline.transform import silver_io
+
+# path -> (data, writer); only populated inside a session
+_memory: Dict[Path, Tuple[Any, Callable[[Any, Path], None]]] = {}
+_deferred: Set[Path] = set()
+_active = False
+
+
+def _key(path) -> Path:
+    return Path(path).resolve()
+
+
+def _copy_rows(data, columns: Optional[Sequence[str]] = None):
+    """
+    Shallow per-row copies, so a stage can add or replace keys without
+    touching another stage's output (nested values must not be mutated).
+    """
+    if not isinstance(data, list):
+        return data
+    if columns is None:
+        return [dict(r) if isinstance(r, dict) else r for r in data]
+    return [{c: r[c] for c in columns if c in r} for r in data]
+
+
+# ---------------------------------------------------------
+# Session
+# ---------------------------------------------------------
+@contextmanager
+def session(deferred: Iterable = ()):
+    """
+    Keeps artifacts in memory for the duration of a multi-stage run.
+    Paths in `deferred` are not written to disk until flush().
+    """
+    global _active
+    _active = True
+    _deferred.update(_key(p) for p in deferred)
+    try:
+        yield
+    finally:
+        _active = False
+        _memory.clear()
+        _deferred.clear()
+
+
+def flush(paths: Iterable):
+    """Writes deferred in-memory artifacts to disk (e.g. for a SQL reader)."""
+    for path in map(_key, paths):
+        if path in _deferred and path in _memory:
+            data, writer = _memory[path]
+            writer(data, path)
+            _deferred.discard(path)
+            print(f"[+] Checkpoint written: {path}")
+
+
+def _store(path, data, writer: Callable[[Any, Path], None]):
+    key = _key(path)
+    if _active:
+        _memory[key] = (data, writer)
+        if key in _deferred:
+            return
+    writer(data, Path(path))
+
+
+def exists(path) -> bool:
+    return _key(path) in _memory or Path(path).exists()
+
+
+# ---------------------------------------------------------
+# JSON artifacts
+# ---------------------------------------------------------
+def read_json(path) -> Any:
+    key = _key(path)
+    if key in _memory:
+        return _copy_rows(_memory[key][0])
+
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def write_json(path, data, ensure_ascii: bool = True, indent: int = 2):
+    def writer(data, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(data, indent=indent, ensure_ascii=ensure_ascii),
+            encoding="utf-8",
+        )
+
+    _store(path, data, writer)
+
+
+# ---------------------------------------------------------
+# Silver Parquet artifacts
+# ---------------------------------------------------------
+def read_silver(path, columns: Optional[Sequence[str]] = None) -> List[Dict]:
+    key = _key(path)
+    if key in _memory:
+        return _copy_rows(_memory[key][0], columns)
+
+    return silver_io.read_silver(path, columns)
+
+
+def write_silver(path, movies: List[Dict]):
+    _store(path, movies, lambda data, path: silver_io.write_silver(data, path))
@@ -0,0 +1,123 @@
+# pipeline/cli.py
+
+"""
+cheerbox command line.
+
+    python -m pipeline list
+    python -m pipeline run validate-reviews premises anchors axes
+    python -m pipeline prompts [--update]
+
+`run` executes the given stages in order in one process. Artifacts written
+by one stage are handed to later stages in memory; only checkpoints, final
+outputs and inputs of disk-reading stages are written (see pipeline.stages).
+"""
+
+import argparse
+import importlib
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from pipeline import artifacts
+from pipeline.stages import STAGES, Stage, deferred_outputs, get_stage
+
+
+# ---------------------------------------------------------
+# Commands
+# ---------------------------------------------------------
+def list_stages():
+    width = max(map(len, STAGES))
+    for stage in STAGES.values():
+        mark = " [checkpoint]" if stage.checkpoint else ""
+        print(f"  {stage.name:<{width}}  {stage.help}{mark}")
+
+
+def check_prompts(update: bool = False) -> int:
+    """Prefix report + stability check against the committed fingerprints."""
+    from pipeline.transform import prompt_registry
+
+    prompt_registry.report()
+
+    if update:
+        prompt_registry.write_lock()
+        print(f"\n[✓] Prefix fingerprints written → {prompt_registry.LOCK_FILE}")
+        return 0
+
+    changed = prompt_registry.check_stable()
+    if changed:
+        print(f"\n[!] Prompt prefixes changed (provider cache resets): {', '.join(changed)}")
+        print("    Re-run with --update if the change is intended.")
+        return 1
+
+    print("\n[✓] All prompt prefixes stable")
+    return 0
+
+
+def run_stage(stage: Stage):
+    module = importlib.import_module(stage.module)
+    getattr(module, stage.entry)()
+
+
+def run_stages(names: List[str], write_all: bool = False):
+    plan = [get_stage(n) for n in names]
+    deferred = [] if write_all else deferred_outputs(plan)
+    pending = [ROOT / p for p in deferred]
+
+    with artifacts.session(deferred=pending):
+        try:
+            for stage in plan:
+                if stage.reads_disk:
+                    artifacts.flush(ROOT / p for p in stage.inputs)
+
+                print(f"\n=== {stage.name} ===")
+                start = time.perf_counter()
+                run_stage(stage)
+                print(f"[✓] {stage.name} finished in {time.perf_counter() - start:.1f}s")
+        except BaseException:
+            # keep finished work when a later stage fails
+            artifacts.flush(pending)
+            raise
+
+    if deferred:
+        print(f"\n[✓] Kept in memory only: {', '.join(deferred)}")
+
+
+# ---------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cheerbox", description="cheerbox data pipeline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="list available stages")
+
+    run = sub.add_parser("run", help="run one or more stages in a single process")
+    run.add_argument("stages", nargs="+", choices=list(STAGES), metavar="STAGE")
+    run.add_argument(
+        "--write-all", action="store_true",
+        help="write every intermediate artifact to disk, not only checkpoints",
+    )
+
+    prompts = sub.add_parser("prompts", help="report cacheable prompt prefixes and check they are stable")
+    prompts.add_argument("--update", action="store_true", help="record the current prefixes as the baseline")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == "list":
+        list_stages()
+    elif args.command == "run":
+        run_stages(args.stages, write_all=args.write_all)
+    elif args.command == "prompts":
+        sys.exit(check_prompts(update=args.update))
+
+
+if __name__ == "__main__":
+    main()
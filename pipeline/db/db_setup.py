@@ -7,6 +7,10 @@ Creates:
 - genres
 - movie_genres
 - movie_source_categories
+- bit_dimensions / movie_bitsets (bitmask filtering, see mood_query)
+
+Link tables are Hive-partitioned directories (see GOLD_PARTITIONS), the
+rest are single files; gold_scan() reads either.
 """
 
 import duckdb
@@ -19,6 +23,12 @@ ROOT = Path(__file__).resolve().parents[2]
 GOLD_DIR = ROOT / "data" / "gold"
 DB_PATH = ROOT / "cheerbox.db"
 
+# Gold tables written as <table>/<column>=<value>/*.parquet
+GOLD_PARTITIONS = {
+    "movie_genres": ("genre_id",),
+    "movie_source_categories": ("source_category",),
+}
+
 # -------------------------------------------------------------
 # DDL statements (table schema)
 # -------------------------------------------------------------
@@ -58,20 +68,58 @@ DDL_STATEMENTS = [
         source_category TEXT,
         FOREIGN KEY(movie_id) REFERENCES movies(movie_id)
     );
+    """,
+
+    # kind: genre | source_category | axis; key: genre_id as text, category, axis name
+    """
+    CREATE TABLE IF NOT EXISTS bit_dimensions (
+        kind TEXT,
+        key TEXT,
+        label TEXT,
+        bit INTEGER,
+        PRIMARY KEY(kind, key)
+    );
+    """,
+
+    """
+    CREATE TABLE IF NOT EXISTS movie_bitsets (
+        movie_id INTEGER PRIMARY KEY,
+        genre_mask BIGINT,
+        category_mask BIGINT,
+        axis_mask BIGINT,
+        primary_axis_mask BIGINT,
+        FOREIGN KEY(movie_id) REFERENCES movies(movie_id)
+    );
     """
 ]
 
 
+# -------------------------------------------------------------
+# Gold Parquet source (file or Hive-partitioned directory)
+# -------------------------------------------------------------
+def sql_path(path) -> str:
+    """A path as a quoted SQL string literal (for COPY / table functions)."""
+    return "'" + str(path).replace("'", "''") + "'"
+
+
+def gold_scan(table_name, gold_dir=GOLD_DIR):
+    """DuckDB table function reading a gold table; partition columns come back from the paths."""
+    if table_name in GOLD_PARTITIONS:
+        return f"read_parquet({sql_path(f'{gold_dir / table_name}/**/*.parquet')}, hive_partitioning = true)"
+    return f"read_parquet({sql_path(gold_dir / f'{table_name}.parquet')})"
+
+
 # -------------------------------------------------------------
 # Load Parquet → DuckDB table
 # -------------------------------------------------------------
-def load_table(con, table_name, parquet_file):
-    print(f"[+] Loading {table_name} from {parquet_file.name} ...")
+def load_table(con, table_name):
+    print(f"[+] Loading {table_name} from {GOLD_DIR.name}/ ...")
 
+    # BY NAME: partition columns are appended after the file columns
     con.execute(f"DELETE FROM {table_name};")
     con.execute(f"""
-        INSERT INTO {table_name}
-        SELECT * FROM '{parquet_file}';
+        INSERT INTO {table_name} BY NAME
+        SELECT * FROM {gold_scan(table_name)};
     """)
 
     count = con.execute(f"SELECT COUNT(*) FROM {table_name};").fetchone()[0]
@@ -92,12 +140,21 @@ def main():
     for ddl in DDL_STATEMENTS:
         con.execute(ddl)
 
+    # Children first, so reloading a parent never trips a foreign key
+    tables = ["movies", "genres", "movie_genres", "movie_source_categories", "bit_dimensions", "movie_bitsets"]
+    for table in reversed(tables):
+        con.execute(f"DELETE FROM {table};")
+
     # Load tables
-    load_table(con, "movies", GOLD_DIR / "movies.parquet")
-    load_table(con, "genres", GOLD_DIR / "genres.parquet")
-    load_table(con, "movie_genres", GOLD_DIR / "movie_genres.parquet")
-    load_table(con, "movie_source_categories",
-               GOLD_DIR / "movie_source_categories.parquet")
+    for table in tables[:4]:
+        load_table(con, table)
+
+    # Written by the gold-bitsets stage, after the axes
+    for table in tables[4:]:
+        if (GOLD_DIR / f"{table}.parquet").exists():
+            load_table(con, table)
+        else:
+            print(f"[!] {table}.parquet not found: run the gold-bitsets stage, then db_setup again\n")
 
     print("[✓] DuckDB setup complete!")
     con.close()
@@ -0,0 +1,151 @@
+# pipeline/db/mood_query.py
+
+"""
+Mood / genre filtering on the per-movie bitmasks (movie_bitsets).
+
+Every genre, source category and axis has a bit (bit_dimensions), and each
+movie stores one BIGINT mask per kind, so a filter like "Drama or Action,
+with Loyalty ↔ Betrayal, without Order ↔ Chaos" is a few integer ANDs on
+one row instead of joins over movie_genres:
+
+    con = duckdb.connect("cheerbox.db")
+    ids = find_movies(con, genres=["Drama", "Action"], axes=["Loyalty ↔ Betrayal"],
+                      exclude_axes=["Order ↔ Chaos"])
+
+The same masks work on the Parquet files via filter_expr (Polars).
+Bits are assigned by the gold build: resolve names through bit_dimensions,
+never hard-code them.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pipeline.lazy import lazy_import
+
+pl = lazy_import("polars")
+
+MASK_COLUMNS = {
+    "genre": "genre_mask",
+    "source_category": "category_mask",
+    "axis": "axis_mask",
+}
+
+
+# ---------------------------------------------------------
+# Names → masks
+# ---------------------------------------------------------
+def load_bits(con) -> Dict[str, Dict[str, int]]:
+    """kind → {key or label → bit}; genres resolve by id or by name."""
+    bits: Dict[str, Dict[str, int]] = {}
+    for kind, key, label, bit in con.execute("SELECT kind, key, label, bit FROM bit_dimensions;").fetchall():
+        names = bits.setdefault(kind, {})
+        names[key] = bit
+        names[label] = bit
+    return bits
+
+
+def mask_of(bits: Dict[str, Dict[str, int]], kind: str, values: Iterable) -> int:
+    names = bits.get(kind, {})
+    mask, unknown = 0, []
+    for v in values:
+        bit = names.get(str(v))
+        if bit is None:
+            unknown.append(v)
+        else:
+            mask |= 1 << bit
+    if unknown:
+        raise ValueError(f"Unknown {kind} values: {unknown}")
+    return mask
+
+
+@dataclass
+class MoodFilter:
+    """Masks to test; 0 means "no condition"."""
+    axes_all: int = 0           # every one of these axes
+    axes_none: int = 0          # none of these axes
+    genres_any: int = 0
+    genres_all: int = 0
+    categories_any: int = 0
+    primary_only: bool = False  # axes_all must be primary axes
+
+    @classmethod
+    def resolve(
+        cls,
+        bits: Dict[str, Dict[str, int]],
+        axes: Iterable[str] = (),
+        exclude_axes: Iterable[str] = (),
+        genres: Iterable = (),
+        all_genres: bool = False,
+        categories: Iterable[str] = (),
+        primary_only: bool = False,
+    ) -> "MoodFilter":
+        genre_mask = mask_of(bits, "genre", genres)
+        return cls(
+            axes_all=mask_of(bits, "axis", axes),
+            axes_none=mask_of(bits, "axis", exclude_axes),
+            genres_any=0 if all_genres else genre_mask,
+            genres_all=genre_mask if all_genres else 0,
+            categories_any=mask_of(bits, "source_category", categories),
+            primary_only=primary_only,
+        )
+
+    def conditions(self) -> List[Tuple[str, str, int]]:
+        """(column, test, mask) with test in any / all / none."""
+        axis_column = "primary_axis_mask" if self.primary_only else "axis_mask"
+        out = []
+        if self.axes_all:
+            out.append((axis_column, "all", self.axes_all))
+        if self.axes_none:
+            out.append(("axis_mask", "none", self.axes_none))
+        if self.genres_any:
+            out.append(("genre_mask", "any", self.genres_any))
+        if self.genres_all:
+            out.append(("genre_mask", "all", self.genres_all))
+        if self.categories_any:
+            out.append(("category_mask", "any", self.categories_any))
+        return out
+
+
+# ---------------------------------------------------------
+# SQL (DuckDB)
+# ---------------------------------------------------------
+def build_filter(f: MoodFilter) -> Tuple[str, list]:
+    """WHERE clause over movie_bitsets and its parameters."""
+    clauses, params = [], []
+    for column, test, mask in f.conditions():
+        if test == "all":
+            clauses.append(f"({column} & ?) = ?")
+            params += [mask, mask]
+        elif test == "any":
+            clauses.append(f"({column} & ?) <> 0")
+            params.append(mask)
+        else:
+            clauses.append(f"({column} & ?) = 0")
+            params.append(mask)
+    return (" AND ".join(clauses) or "true"), params
+
+
+def find_movies(con, limit: Optional[int] = None, **filters) -> List[int]:
+    """movie_ids matching the filters (see MoodFilter.resolve for the arguments)."""
+    where, params = build_filter(MoodFilter.resolve(load_bits(con), **filters))
+    sql = f"SELECT movie_id FROM movie_bitsets WHERE {where} ORDER BY movie_id"
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return [r[0] for r in con.execute(sql, params).fetchall()]
+
+
+# ---------------------------------------------------------
+# Polars (gold Parquet)
+# ---------------------------------------------------------
+def filter_expr(f: MoodFilter) -> "pl.Expr":
+    """Same conditions as build_filter, for pl.scan_parquet(".../movie_bitsets.parquet")."""
+    expr = pl.lit(True)
+    for column, test, mask in f.conditions():
+        hit = pl.col(column) & mask
+        if test == "all":
+            expr = expr & (hit == mask)
+        elif test == "any":
+            expr = expr & (hit != 0)
+        else:
+            expr = expr & (hit == 0)
+    return expr
@@ -0,0 +1,119 @@
+# pipeline/extract/review_loader.py
+
+"""
+Bulk loader for bronze reviews.
+
+Reads the packed review store (pipeline.extract.review_store) and any
+legacy per-movie data/bronze/reviews/<movie_id>.json files, in parallel,
+into a single table keyed by movie_id, so enrichment is one join instead
+of a stat + open per movie. Store records win over legacy files.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from pipeline.extract.review_store import ReviewStore
+from pipeline.lazy import lazy_import
+
+pl = lazy_import("polars")
+
+# Files per worker task; small files make per-task overhead dominate
+_FILES_PER_TASK = 64
+
+
+def parse_reviews(raw: bytes) -> Optional[List[str]]:
+    """
+    Non-empty, stripped review texts of one bronze file.
+    None if the file is malformed (treated as missing reviews).
+    """
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return None
+
+    if not isinstance(data, list):
+        return None
+
+    cleaned = []
+    for r in data:
+        if not isinstance(r, dict):
+            return None
+        content = r.get("content", "")
+        if isinstance(content, str):
+            text = content.strip()
+            if text:         # skip empty reviews
+                cleaned.append(text)
+
+    # If file exists but no valid reviews → still "not missing"
+    return cleaned
+
+
+def _read_files(paths: List[Tuple[int, str]]) -> List[Tuple[int, List[str]]]:
+    rows = []
+    for movie_id, path in paths:
+        try:
+            with open(path, "rb") as f:
+                reviews = parse_reviews(f.read())
+        except OSError:
+            continue
+        if reviews is not None:
+            rows.append((movie_id, reviews))
+    return rows
+
+
+def review_files(reviews_dir: Path) -> List[Tuple[int, str]]:
+    """(movie_id, path) of every <movie_id>.json, from one directory listing."""
+    if not Path(reviews_dir).is_dir():
+        return []
+
+    files = []
+    with os.scandir(reviews_dir) as entries:
+        for e in entries:
+            stem, ext = os.path.splitext(e.name)
+            if ext == ".json" and stem.isdigit():
+                files.append((int(stem), e.path))
+    return files
+
+
+def _legacy_table(reviews_dir: Path, workers: Optional[int]) -> pl.DataFrame:
+    files = review_files(reviews_dir)
+    tasks = [files[i:i + _FILES_PER_TASK] for i in range(0, len(files), _FILES_PER_TASK)]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        rows = [row for part in pool.map(_read_files, tasks) for row in part]
+
+    return pl.DataFrame(
+        rows,
+        schema={"movie_id": pl.Int64, "reviews": pl.List(pl.Utf8)},
+        orient="row",
+    )
+
+
+def _store_table(reviews_dir: Path, workers: Optional[int]) -> pl.DataFrame:
+    """Same rules as parse_reviews(): stripped, non-empty string contents."""
+    content = pl.element().struct.field("content").str.strip_chars()
+    return (
+        ReviewStore(reviews_dir).table(workers)
+        .select(
+            "movie_id",
+            pl.col("reviews")
+            .list.eval(content)
+            .list.eval(pl.element().filter(pl.element().is_not_null() & (pl.element() != ""))),
+        )
+    )
+
+
+def load_review_table(reviews_dir: Path, workers: Optional[int] = None) -> pl.DataFrame:
+    """
+    movie_id → reviews (list[str]) for every movie with readable reviews.
+    Movies without a record, or with a malformed legacy file, have no row.
+    """
+    return (
+        pl.concat([_legacy_table(reviews_dir, workers), _store_table(reviews_dir, workers)])
+        .unique("movie_id", keep="last", maintain_order=True)
+    )
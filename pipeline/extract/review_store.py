@@ -0,0 +1,275 @@
+# pipeline/extract/review_store.py
+
+"""
+Packed, append-only bronze store for TMDB reviews.
+
+Instead of one pretty-printed <movie_id>.json per movie, fetched reviews
+are appended as JSON lines to a few large segments, partitioned by fetch
+date:
+
+    data/bronze/reviews/
+        date=2026-10-19/part-00000.jsonl   {"movie_id", "fetched_at", "reviews"} per line
+        date=2026-10-19/part-00001.jsonl   (new part every SEGMENT_BYTES)
+        index.json                         movie_id → [segment, offset, length]
+
+- Upsert: re-fetching a movie appends a new line; the index points at the
+  latest one, so every reader sees one record per movie.
+- Atomic: a record becomes visible only once its line is fully written;
+  index.json is replaced atomically (temp file + os.replace). Lines past
+  the last saved index are recovered on open; a torn last line (crash
+  mid-write) is ignored and cut off before the next append.
+- Random access: get(movie_id) is one seek + read.
+
+One writer at a time; any number of readers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pipeline.lazy import lazy_import
+
+pl = lazy_import("polars")
+
+SEGMENT_BYTES = 64 * 1024 * 1024
+# Saves the index every N appends (and on close)
+INDEX_EVERY = 200
+
+INDEX_FILE = "index.json"
+
+# movie_id → (segment path relative to the store root, byte offset, line length)
+Entry = Tuple[str, int, int]
+
+
+class ReviewStore:
+    def __init__(self, root, segment_bytes: int = SEGMENT_BYTES):
+        self.root = Path(root)
+        self.segment_bytes = segment_bytes
+
+        self._index: Dict[int, Entry] = {}
+        self._indexed: Dict[str, int] = {}   # segment → bytes covered by the index
+        self._file = None
+        self._segment: Optional[str] = None
+        self._unsaved = 0
+
+        self._load_index()
+        self._recover()
+
+    # ------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------
+    def _load_index(self):
+        path = self.root / INDEX_FILE
+        if not path.exists():
+            return
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        self._indexed = dict(data.get("segments", {}))
+        self._index = {int(k): tuple(v) for k, v in data.get("movies", {}).items()}
+
+    def _recover(self):
+        """Index complete lines written after the last index save."""
+        for segment in self.segments():
+            start = self._indexed.get(segment, 0)
+            path = self.root / segment
+            if path.stat().st_size <= start:
+                continue
+
+            with open(path, "rb") as f:
+                f.seek(start)
+                offset = start
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # torn write
+                    try:
+                        movie_id = int(json.loads(line)["movie_id"])
+                    except (ValueError, KeyError, TypeError):
+                        break
+                    self._index[movie_id] = (segment, offset, len(line) - 1)
+                    offset += len(line)
+
+            self._indexed[segment] = offset
+            self._unsaved += 1
+
+    def save_index(self):
+        """Atomically replaces index.json."""
+        if not self._index and not self._indexed:
+            return
+
+        # Records must be on disk before the index points at them
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / INDEX_FILE
+        tmp = path.with_suffix(".json.tmp")
+
+        data = {
+            "segments": self._indexed,
+            "movies": {str(k): list(v) for k, v in self._index.items()},
+        }
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        self._unsaved = 0
+
+    # ------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------
+    def segments(self) -> List[str]:
+        """Segment paths relative to the root, oldest first."""
+        if not self.root.is_dir():
+            return []
+        return sorted(p.relative_to(self.root).as_posix() for p in self.root.glob("date=*/part-*.jsonl"))
+
+    def _open_segment(self, day: str):
+        """Current part for `day`, rolled over once it reaches segment_bytes."""
+        prefix = f"date={day}/"
+        if self._file is not None and self._segment.startswith(prefix):
+            if self._file.tell() < self.segment_bytes:
+                return
+
+        self.close_segment()
+
+        parts = [s for s in self.segments() if s.startswith(prefix)]
+        part = _part_number(parts[-1]) if parts else 0
+
+        while True:
+            segment = f"{prefix}part-{part:05d}.jsonl"
+            path = self.root / segment
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            f = open(path, "ab")
+            # Drop a torn line left by a crash, so the next record starts clean
+            end = self._indexed.get(segment, 0)
+            if f.tell() > end:
+                f.truncate(end)
+                f.seek(end)
+
+            if f.tell() < self.segment_bytes:
+                break
+            f.close()
+            part += 1
+
+        self._segment, self._file = segment, f
+
+    def close_segment(self):
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    # ------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------
+    def put(self, movie_id: int, reviews: List[Dict], fetched_at: Optional[datetime] = None) -> Entry:
+        """Appends (or replaces) the reviews of one movie."""
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        self._open_segment(fetched_at.date().isoformat())
+
+        line = json.dumps(
+            {"movie_id": int(movie_id), "fetched_at": fetched_at.isoformat(), "reviews": reviews},
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        offset = self._file.tell()
+        self._file.write(line + b"\n")
+        self._file.flush()
+
+        entry = (self._segment, offset, len(line))
+        self._index[int(movie_id)] = entry
+        self._indexed[self._segment] = offset + len(line) + 1
+
+        self._unsaved += 1
+        if self._unsaved >= INDEX_EVERY:
+            self.save_index()
+        return entry
+
+    def close(self):
+        self.close_segment()
+        if self._unsaved:
+            self.save_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------
+    def __contains__(self, movie_id) -> bool:
+        return int(movie_id) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def movie_ids(self) -> List[int]:
+        return list(self._index)
+
+    def get(self, movie_id: int) -> Optional[Dict]:
+        """Latest record of one movie ({movie_id, fetched_at, reviews}), or None."""
+        entry = self._index.get(int(movie_id))
+        if entry is None:
+            return None
+
+        segment, offset, length = entry
+        if self._file is not None and segment == self._segment:
+            self._file.flush()
+
+        with open(self.root / segment, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def spans(self) -> Dict[str, List[Tuple[int, int]]]:
+        """segment → [(offset, length)] of the latest record of each movie."""
+        spans: Dict[str, List[Tuple[int, int]]] = {}
+        for segment, offset, length in self._index.values():
+            spans.setdefault(segment, []).append((offset, length))
+        return spans
+
+    def read_segment(self, segment: str, spans: List[Tuple[int, int]]) -> pl.DataFrame:
+        """The given records of one segment, as a table (one read + one parse)."""
+        if self._file is not None and segment == self._segment:
+            self._file.flush()
+
+        with open(self.root / segment, "rb") as f:
+            data = f.read()
+
+        lines = b"\n".join(data[o:o + n] for o, n in sorted(spans))
+        return pl.read_ndjson(BytesIO(lines), schema=record_schema())
+
+    def table(self, workers: Optional[int] = None) -> pl.DataFrame:
+        """Upsert view: the latest record of every movie, segments read in parallel."""
+        spans = sorted(self.spans().items())
+        if not spans:
+            return pl.DataFrame(schema=record_schema())
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(lambda item: self.read_segment(*item), spans))
+        return pl.concat(frames)
+
+
+def _part_number(segment: str) -> int:
+    return int(Path(segment).stem.split("-")[1])
+
+
+@lru_cache(maxsize=None)
+def record_schema() -> Dict[str, pl.DataType]:
+    """Column types of one stored record."""
+    review = pl.Struct({"rating": pl.Float64, "content": pl.Utf8})
+    return {"movie_id": pl.Int64, "fetched_at": pl.Utf8, "reviews": pl.List(review)}
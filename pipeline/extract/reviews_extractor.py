@@ -1,11 +1,12 @@
 import os
-import json
 import time
 import requests
 from pathlib import Path
 from dotenv import load_dotenv
 from requests.exceptions import RequestException
 
+from pipeline.extract.review_store import ReviewStore
+
 load_dotenv()
 TMDB_KEY = os.getenv("TMDB_BEARER_TOKEN")
 
@@ -21,6 +22,7 @@ class ReviewExtractor:
     def __init__(self, save_dir):
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.store = ReviewStore(self.save_dir)
 
     # ------------------------------------------------------------
     # INTERNAL METHOD: Safe request with retry + backoff
@@ -74,10 +76,13 @@ class ReviewExtractor:
         return cleaned
 
     # ------------------------------------------------------------
-    # Save reviews to disk
+    # Save reviews to the packed bronze store
     # ------------------------------------------------------------
     def save(self, movie_id, reviews):
-        out = self.save_dir / f"{movie_id}.json"
-        with open(out, "w", encoding="utf-8") as f:
-            json.dump(reviews, f, indent=2, ensure_ascii=False)
-        return out
+        """Appends (or replaces) a movie's reviews; returns the segment file."""
+        segment, _, _ = self.store.put(movie_id, reviews)
+        return self.save_dir / segment
+
+    def close(self):
+        """Flushes the open segment and writes the index."""
+        self.store.close()
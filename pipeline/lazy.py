@@ -0,0 +1,29 @@
+# pipeline/lazy.py
+
+"""
+Deferred imports for heavy dependencies.
+
+lazy_import("numpy") returns a module object whose real import runs on
+first attribute access, so importing a pipeline module (CLI startup,
+--help, test collection) doesn't pay for numpy / polars / textblob.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,36 @@
+# pipeline/llm_client.py
+
+"""
+Shared, lazily created OpenAI client.
+
+Jobs used to build `OpenAI()` at import time, which made every import
+(and --help) require API keys and pay for the openai import. The client is
+now created on first use, after .env has been loaded.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@lru_cache(maxsize=None)
+def load_env():
+    """Loads ROOT/.env once (values already in the environment win)."""
+    from dotenv import load_dotenv
+    load_dotenv(ROOT / ".env")
+
+
+@lru_cache(maxsize=None)
+def get_client():
+    load_env()
+    from openai import OpenAI
+    return OpenAI()
+
+
+@lru_cache(maxsize=None)
+def get_async_client():
+    """AsyncOpenAI for concurrent jobs; use it from a single event loop."""
+    load_env()
+    from openai import AsyncOpenAI
+    return AsyncOpenAI()
@@ -0,0 +1,135 @@
+# pipeline/stages.py
+
+"""
+Stage registry for the cheerbox CLI.
+
+Each stage points at a job module and declares the artifacts it reads and
+writes (paths relative to the repo root). The CLI uses this to hand
+artifacts over in memory between chained stages and to decide which
+outputs must still be written to disk.
+
+checkpoint=True marks outputs that are expensive to rebuild (embeddings,
+LLM calls) or read outside the pipeline; they are always written.
+reads_disk=True marks stages that read their inputs straight from disk
+(e.g. DuckDB), so pending inputs are flushed before they run.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+SILVER = "data/silver/movies_silver.json"
+SILVER_ENRICHED = "data/silver/movies_silver_enriched.parquet"
+SILVER_VALIDATED = "data/silver/movies_silver_validated.parquet"
+PREMISES = "data/gold/movie_premises.json"
+AXES = "data/gold/movie_axes.json"
+ANCHORS = "data/gold/movie_character_anchors.json"
+MOVIES_GOLD = "data/gold/movies_gold.json"
+CRITICS = "data/gold/movie_critic_summaries.json"
+CAPSULES = "data/gold/movie_emotional_capsules.json"
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    module: str
+    help: str
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    checkpoint: bool = False
+    reads_disk: bool = False
+    entry: str = "main"
+
+
+# Pipeline order
+STAGES: Dict[str, Stage] = {s.name: s for s in [
+    # ---------------- extract / silver ----------------
+    Stage("extract-movies", "jobs.extract.extract_movies",
+          "Fetch TMDB movies per target genre into bronze"),
+    Stage("transform-movies", "jobs.transform.transform_movies",
+          "Merge bronze files into the silver movie list",
+          outputs=(SILVER,), checkpoint=True),
+    Stage("extract-reviews", "jobs.extract.extract_reviews",
+          "Fetch TMDB reviews for every silver movie",
+          inputs=(SILVER,)),
+    Stage("gold-tables", "jobs.transform.transform_movies_gold",
+          "Build the normalized gold Parquet tables with DuckDB",
+          inputs=(SILVER,), reads_disk=True, entry="run"),
+    Stage("enrich-reviews", "jobs.transform.enrich_silver_with_reviews",
+          "Attach bronze reviews to silver movies",
+          inputs=(SILVER,), outputs=(SILVER_ENRICHED,)),
+    Stage("validate-reviews", "jobs.transform.validate_reviews",
+          "Score, dedupe and filter reviews with embeddings",
+          inputs=(SILVER_ENRICHED,), outputs=(SILVER_VALIDATED,), checkpoint=True),
+
+    # ---------------- gold (LLM) ----------------
+    Stage("premises", "jobs.transform.build_movie_premises",
+          "Generate literal narrative premises",
+          inputs=(SILVER_VALIDATED,), outputs=(PREMISES,), checkpoint=True),
+    Stage("anchors", "jobs.transform.build_character_anchors",
+          "Extract character anchors from premises",
+          inputs=(PREMISES,), outputs=(ANCHORS,), checkpoint=True),
+    Stage("axes", "jobs.transform.build_movie_axes",
+          "Generate emotional axes",
+          inputs=(SILVER_VALIDATED, PREMISES, ANCHORS), outputs=(AXES,), checkpoint=True),
+    Stage("gold-bitsets", "jobs.transform.transform_movies_gold",
+          "Build the genre / category / axis bitmask tables with DuckDB",
+          inputs=(SILVER, AXES), reads_disk=True, entry="run_bitsets"),
+    Stage("identity", "jobs.transform.build_movie_identity",
+          "Merge premises and axes into movie identities",
+          inputs=(PREMISES, AXES), outputs=("data/gold/movie_identity.json",)),
+    Stage("movies-gold", "jobs.transform.build_movies_gold",
+          "Merge premises, axes and anchors into movies_gold",
+          inputs=(PREMISES, AXES, ANCHORS), outputs=(MOVIES_GOLD,), checkpoint=True),
+    Stage("critic-summaries", "jobs.transform.build_critic_summaries",
+          "Generate critic summaries",
+          inputs=(MOVIES_GOLD,), outputs=(CRITICS,), checkpoint=True),
+    Stage("capsules", "jobs.transform.build_emotional_capsules",
+          "Generate emotional capsules",
+          inputs=(MOVIES_GOLD,), outputs=(CAPSULES,), checkpoint=True),
+
+    # ---------------- post-processing ----------------
+    Stage("cleanup-critics", "jobs.transform.cleanup_critic_summaries",
+          "Clean flagged critic summaries without regeneration",
+          inputs=(CRITICS,), outputs=("data/gold/movie_critic_summaries_cleaned.json",)),
+    Stage("soft-validate-critics", "jobs.transform.soft_validate_critics",
+          "Soft-validate flagged critic summaries against premises",
+          inputs=(CRITICS, MOVIES_GOLD), outputs=("data/gold/movie_critic_summaries_refined.json",)),
+    Stage("revalidate", "jobs.transform.revalidate_catalog",
+          "Re-run the validators over generated gold artifacts",
+          inputs=(SILVER_VALIDATED, MOVIES_GOLD, PREMISES, CRITICS, CAPSULES),
+          outputs=(PREMISES, CRITICS, CAPSULES)),
+    Stage("thematic-capsules", "jobs.transform.generate_thematic_and_emotional_capsules",
+          "Generate critic summaries + capsules from validated reviews",
+          inputs=(SILVER_VALIDATED,), outputs=("data/silver/movies_thematic_and_emotional.json",),
+          checkpoint=True),
+    Stage("emotional-scenes", "jobs.extract.generate_emotional_scenes",
+          "Generate emotional scene paragraphs",
+          inputs=(SILVER,)),
+]}
+
+
+def get_stage(name: str) -> Stage:
+    if name not in STAGES:
+        raise ValueError(f"Unknown stage '{name}'. Available: {', '.join(STAGES)}")
+    return STAGES[name]
+
+
+def deferred_outputs(plan: List[Stage]) -> List[str]:
+    """
+    Outputs that can stay in memory: not a checkpoint, and consumed by a
+    later stage of the same run. Everything else is written as usual.
+
+    A path that is any stage's checkpoint (e.g. premises rewritten by
+    revalidate) is never deferred, or the rewrite would not reach disk.
+    """
+    checkpoints = {p for s in STAGES.values() if s.checkpoint for p in s.outputs}
+    deferred = []
+    for i, stage in enumerate(plan):
+        if stage.checkpoint:
+            continue
+        later_inputs = {p for s in plan[i + 1:] for p in s.inputs}
+        deferred.extend(
+            p for p in stage.outputs
+            if p in later_inputs and p not in checkpoints and p not in deferred
+        )
+    return deferred
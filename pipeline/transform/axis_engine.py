@@ -0,0 +1,168 @@
+# pipeline/transform/axis_engine.py
+
+"""
+Hybrid axis selection: deterministic scoring first, LLM only when unsure.
+
+Each candidate axis (from the movie's genres) is scored from two signals:
+
+- keywords: the ontology's precompiled keyword regex (AXIS_KEYWORDS with
+  common inflections), run once per premise + anchor text; each distinct
+  keyword hit adds KEYWORD_WEIGHT (up to MAX_KEYWORD_HITS per axis)
+- embeddings: cosine similarity between the premise and the axis
+  description (AXIS_DESCRIPTIONS), premises encoded in one batch
+
+A movie is resolved locally when its two best axes both have evidence and
+the top three are separated from the rest by at least MARGIN; everything
+else is left to axis_generator.generate_axes.
+"""
+
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pipeline.lazy import lazy_import
+from pipeline.llm_client import load_env
+from pipeline.transform.axis_ontology import ONTOLOGY
+
+np = lazy_import("numpy")
+
+KEYWORD_WEIGHT = 0.15
+MAX_KEYWORD_HITS = 3
+
+# Minimum premise ↔ description similarity that counts as evidence
+MIN_SIMILARITY = 0.25
+
+# Score gap required around the cut-off of the picked axes
+MARGIN = 0.05
+
+
+def use_embeddings() -> bool:
+    """AXIS_EMBEDDINGS=0 scores on keywords only."""
+    load_env()
+    return os.getenv("AXIS_EMBEDDINGS", "1") != "0"
+
+
+@dataclass
+class AxisDecision:
+    axes: Optional[Dict]
+    reason: str
+    scores: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def confident(self) -> bool:
+        return self.axes is not None
+
+
+# ---------------------------------------------------------
+# Keywords / candidates (compiled in the ontology)
+# ---------------------------------------------------------
+def keyword_hits(text: str) -> Dict[str, int]:
+    """Distinct keywords found per axis."""
+    return ONTOLOGY.keyword_hits(text)
+
+
+def candidate_axes(genres: Sequence) -> List[str]:
+    """Allowed axes in genre order (the tie-breaker)."""
+    return ONTOLOGY.allowed(genres)
+
+
+def movie_text(premise: str, character_anchors: Sequence = ()) -> str:
+    labels = [a["label"] if isinstance(a, dict) else str(a) for a in character_anchors]
+    return " ".join([premise or "", *labels])
+
+
+# ---------------------------------------------------------
+# Embeddings
+# ---------------------------------------------------------
+@lru_cache(maxsize=None)
+def _description_matrix() -> Tuple[Tuple[str, ...], Optional["np.ndarray"]]:
+    from pipeline.transform.nlp_utils import get_embeddings
+
+    axes = tuple(ONTOLOGY.descriptions)
+    vectors = get_embeddings([ONTOLOGY.descriptions[a] for a in axes])
+    if any(v is None for v in vectors):
+        return axes, None
+    return axes, _unit(np.vstack(vectors))
+
+
+def _unit(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def premise_similarities(premises: List[str]) -> List[Dict[str, float]]:
+    """Cosine similarity of each premise to every axis description ({} if unavailable)."""
+    if not premises or not use_embeddings():
+        return [{} for _ in premises]
+
+    from pipeline.transform.nlp_utils import get_embeddings
+
+    axes, descriptions = _description_matrix()
+    if descriptions is None:
+        return [{} for _ in premises]
+
+    vectors = get_embeddings(premises)
+    out: List[Dict[str, float]] = [{} for _ in premises]
+    rows = [i for i, v in enumerate(vectors) if v is not None]
+    if rows:
+        sims = _unit(np.vstack([vectors[i] for i in rows])) @ descriptions.T
+        for i, row in zip(rows, sims):
+            out[i] = dict(zip(axes, row.tolist()))
+    return out
+
+
+# ---------------------------------------------------------
+# Decision
+# ---------------------------------------------------------
+def score_axes(
+    candidates: List[str],
+    hits: Dict[str, int],
+    similarities: Dict[str, float],
+) -> List[Tuple[str, float, bool]]:
+    """(axis, score, has_evidence), best first; ties keep genre order."""
+    scored = []
+    for axis in candidates:
+        n = hits.get(axis, 0)
+        sim = similarities.get(axis, 0.0)
+        score = KEYWORD_WEIGHT * min(n, MAX_KEYWORD_HITS) + sim
+        scored.append((axis, score, n > 0 or sim >= MIN_SIMILARITY))
+    return sorted(scored, key=lambda s: -s[1])
+
+
+def decide(candidates: List[str], hits: Dict[str, int], similarities: Dict[str, float]) -> AxisDecision:
+    if not candidates:
+        return AxisDecision(None, "no_genre_axes")
+
+    ranked = score_axes(candidates, hits, similarities)
+    scores = {axis: round(score, 4) for axis, score, _ in ranked}
+
+    if len(ranked) < 2 or not (ranked[0][2] and ranked[1][2]):
+        return AxisDecision(None, "weak_evidence", scores)
+
+    if len(ranked) > 3 and ranked[2][1] - ranked[3][1] < MARGIN:
+        return AxisDecision(None, "ambiguous", scores)
+
+    axes = {
+        "primary": [ranked[0][0], ranked[1][0]],
+        "secondary": ranked[2][0] if len(ranked) > 2 else None,
+        "status": "pass",
+    }
+    return AxisDecision(axes, "confident", scores)
+
+
+def decide_axes(movies: Sequence[Dict]) -> List[AxisDecision]:
+    """
+    Local decisions for movies ({premise, genres, character_anchors?});
+    premises are embedded in one batch.
+    """
+    similarities = premise_similarities([m.get("premise") or "" for m in movies])
+
+    return [
+        decide(
+            candidate_axes(m.get("genres") or []),
+            keyword_hits(movie_text(m.get("premise") or "", m.get("character_anchors") or [])),
+            sims,
+        )
+        for m, sims in zip(movies, similarities)
+    ]
@@ -1,43 +1,25 @@
 # pipeline/transform/axis_extractor.py
 
-from typing import List, Dict
-from openai import OpenAI
-from pipeline.transform.axis_ontology import AXIS_FAMILIES, AXIS_TO_FAMILY
+from typing import TYPE_CHECKING, List, Dict
 
-def extract_movie_axes(
-    client: OpenAI,
-    title: str,
-    premise: str,
-    genres: List[str],
-    character_anchors: List[str],
-    max_primary: int = 2,
-    allow_secondary: bool = True
-) -> Dict:
-    """
-    Returns:
-    {
-      "primary_axes": [...],
-      "secondary_axis": str | None
-    }
-    """
-
-    # Build candidate pool (flattened)
-    candidate_axes = sorted({axis for axes in AXIS_FAMILIES.values() for axis in axes})
+if TYPE_CHECKING:
+    from openai import OpenAI
 
-    prompt = f"""
-You are selecting emotional tension axes for a movie.
-
-Movie title:
-{title}
+from pipeline.transform.axis_ontology import ONTOLOGY
+from pipeline.transform.prompt_registry import register
+from pipeline.transform.structured_output import create_structured, movie_axes_schema
 
-Premise (short identifier):
-{premise}
+# Candidate pool (flattened)
+CANDIDATE_AXES = list(ONTOLOGY.names)
 
-Characters / anchors:
-{", ".join(character_anchors) if character_anchors else "None"}
+# The full axis list is static, so it sits in the cacheable prefix
+AXES_PROMPT = register(
+    "movie_axes",
+    prefix=f"""
+You are selecting emotional tension axes for a movie.
 
 Rules:
-- Choose AT MOST {max_primary} primary axes
+- Choose AT MOST the number of primary axes given with the movie
 - Optionally choose 1 secondary axis
 - Axes must be chosen ONLY from the list below
 - Do NOT invent new axes
@@ -45,39 +27,79 @@ Rules:
 - If none strongly apply, return empty lists
 
 Allowed axes:
-{chr(10).join(candidate_axes)}
+{chr(10).join(CANDIDATE_AXES)}
 
 Respond strictly in JSON:
 {{
   "primary_axes": [],
   "secondary_axis": null
 }}
-"""
+""",
+    template="""
+Movie title:
+{title}
 
-    resp = client.responses.create(
-        model="gpt-4o-mini",
-        input=prompt
-    )
+Premise (short identifier):
+{premise}
+
+Characters / anchors:
+{anchors}
+
+Primary axes: at most {max_primary}
+""",
+)
+
+def extract_movie_axes(
+    client: "OpenAI",
+    title: str,
+    premise: str,
+    genres: List[str],
+    character_anchors: List[str],
+    max_primary: int = 2,
+    allow_secondary: bool = True
+) -> Dict:
+    """
+    Returns:
+    {
+      "primary_axes": [...],
+      "secondary_axis": str | None
+    }
+    """
 
-    data = resp.output_parsed or {}
+    data, _ = create_structured(
+        client,
+        AXES_PROMPT.render(
+            title=title,
+            premise=premise,
+            anchors=", ".join(character_anchors) if character_anchors else "None",
+            max_primary=max_primary,
+        ),
+        "movie_axes",
+        movie_axes_schema(CANDIDATE_AXES),
+        instructions=AXES_PROMPT.prefix,
+    )
+    if not isinstance(data, dict):
+        data = {}
 
     primary = data.get("primary_axes", []) or []
+    if not isinstance(primary, list):
+        primary = []
     secondary = data.get("secondary_axis")
 
     # ---------- Post-validation ----------
-    used_families = set()
+    used_families = 0   # mask of the axes in already used families
     cleaned_primary = []
 
     for axis in primary:
-        family = AXIS_TO_FAMILY.get(axis)
-        if family and family not in used_families:
+        family = ONTOLOGY.family_mask_of(axis)
+        if family and not used_families & family:
             cleaned_primary.append(axis)
-            used_families.add(family)
+            used_families |= family
 
     cleaned_secondary = None
     if secondary:
-        fam = AXIS_TO_FAMILY.get(secondary)
-        if fam and fam not in used_families:
+        fam = ONTOLOGY.family_mask_of(secondary)
+        if fam and not used_families & fam:
             cleaned_secondary = secondary
 
     return {
@@ -1,87 +1,56 @@
 #!/usr/bin/env python3
 
-from typing import List, Dict
-from openai import OpenAI
-
-GENRE_AXIS_RULES = {
-    "Science Fiction": [
-        "Reality ↔ Illusion",
-        "Control ↔ Surrender",
-        "Power ↔ Responsibility",
-        "Purpose ↔ Emptiness",
-        "Freedom ↔ Constraint",
-    ],
-    "Action": [
-        "Safety ↔ Threat",
-        "Order ↔ Chaos",
-        "Individual ↔ Collective",
-        "Survival ↔ Sacrifice",
-    ],
-    "Fantasy": [
-        "Power ↔ Responsibility",
-        "Identity ↔ Role",
-        "Order ↔ Chaos",
-        "Loyalty ↔ Betrayal",
-    ],
-    "Drama": [
-        "Identity ↔ Role",
-        "Purpose ↔ Emptiness",
-        "Justice ↔ Compromise",
-        "Loyalty ↔ Betrayal",
-    ],
-    "Adventure": [
-        "Individual ↔ Collective",
-        "Freedom ↔ Constraint",
-        "Survival ↔ Sacrifice",
-    ],
-}
+from typing import TYPE_CHECKING, List, Dict
 
-def _allowed_axes(genres: List[str]) -> List[str]:
-    axes = set()
-    for g in genres:
-        axes.update(GENRE_AXIS_RULES.get(g, []))
-    return list(axes)
+from pipeline.transform.axis_ontology import GENRE_AXIS_RULES, ONTOLOGY  # noqa: F401 (re-exported)
+from pipeline.transform.prompt_registry import register
+from pipeline.transform.structured_output import axes_schema, create_structured
 
-def generate_axes(
-    client: OpenAI,
-    title: str,
-    premise: str,
-    genres: List[str]
-) -> Dict:
-    allowed = _allowed_axes(genres)
-    if not allowed:
-        return {"primary": [], "secondary": None, "status": "no_genre_axes"}
+if TYPE_CHECKING:
+    from openai import OpenAI
 
-    prompt = f"""
-Select emotional tension axes for this movie.
+AXES_PROMPT = register(
+    "genre_axes",
+    prefix="""
+Select emotional tension axes for the movie below.
 
+Rules:
+- Choose EXACTLY 2 primary axes
+- Choose EXACTLY 1 secondary axis
+- Use ONLY from the movie's allowed list
+- No explanations
+
+Respond in JSON:
+{"primary": ["axis", "axis"], "secondary": "axis"}
+""",
+    template="""
 Movie: {title}
 Premise: {premise}
 
 Allowed axes:
-{", ".join(allowed)}
+{allowed}
+""",
+)
 
-Rules:
-- Choose EXACTLY 2 primary axes
-- Choose EXACTLY 1 secondary axis
-- Use ONLY from allowed list
-- No explanations
+def _allowed_axes(genres: List[str]) -> List[str]:
+    # ID order is name order: the same genres always give the same prompt
+    return ONTOLOGY.names_of(ONTOLOGY.allowed_mask(genres))
 
-Format:
-Primary:
-- axis
-- axis
-Secondary:
-- axis
-"""
-
-    resp = client.responses.create(
-        model="gpt-4o-mini",
-        input=prompt
-    )
+def _pick_axes(data: Dict, allowed: List[str]):
+    """Primary / secondary from parsed JSON, keeping only allowed, distinct axes."""
+    candidates = data.get("primary") or []
+    if not isinstance(candidates, list):
+        candidates = []
+    primary = list(dict.fromkeys(a for a in candidates if a in allowed))[:2]
 
-    text = resp.output_text or ""
+    secondary = data.get("secondary")
+    if secondary not in allowed or secondary in primary:
+        secondary = None
+    return primary, secondary
 
+
+def _scan_axes(text: str, allowed: List[str]):
+    """Fallback for non-JSON output: allowed axes in line order."""
     primary, secondary = [], None
     for line in text.splitlines():
         line = line.strip().lstrip("- ").strip()
@@ -90,6 +59,31 @@ Secondary:
                 primary.append(line)
             elif secondary is None and line not in primary:
                 secondary = line
+    return primary, secondary
+
+
+def generate_axes(
+    client: "OpenAI",
+    title: str,
+    premise: str,
+    genres: List[str]
+) -> Dict:
+    allowed = _allowed_axes(genres)
+    if not allowed:
+        return {"primary": [], "secondary": None, "status": "no_genre_axes"}
+
+    data, text = create_structured(
+        client,
+        AXES_PROMPT.render(title=title, premise=premise, allowed=", ".join(allowed)),
+        "movie_axes",
+        axes_schema(allowed),
+        instructions=AXES_PROMPT.prefix,
+    )
+
+    if isinstance(data, dict):
+        primary, secondary = _pick_axes(data, allowed)
+    else:
+        primary, secondary = _scan_axes(text, allowed)
 
     return {
         "primary": primary[:2],
@@ -1,16 +1,4 @@
 # pipeline/transform/axis_keywords.py
 
-AXIS_KEYWORDS = {
-    "Reality ↔ Illusion": ["dream", "simulation", "illusion", "false", "real"],
-    "Control ↔ Surrender": ["control", "force", "resist", "submit", "command"],
-    "Power ↔ Responsibility": ["power", "weapon", "ability", "responsibility"],
-    "Purpose ↔ Emptiness": ["purpose", "meaning", "survive", "exist", "nothing"],
-    "Freedom ↔ Constraint": ["free", "escape", "trapped", "rule", "limit"],
-    "Safety ↔ Threat": ["threat", "danger", "protect", "attack", "enemy"],
-    "Order ↔ Chaos": ["order", "law", "collapse", "chaos", "anarchy"],
-    "Individual ↔ Collective": ["team", "alone", "together", "group"],
-    "Survival ↔ Sacrifice": ["survive", "sacrifice", "cost", "loss"],
-    "Identity ↔ Role": ["identity", "role", "who", "become"],
-    "Loyalty ↔ Betrayal": ["loyal", "betray", "trust", "turn"],
-    "Justice ↔ Compromise": ["justice", "right", "wrong", "deal"]
-}
+# Defined in axis_ontology (the single source); re-exported here
+from pipeline.transform.axis_ontology import AXIS_DESCRIPTIONS, AXIS_KEYWORDS  # noqa: F401
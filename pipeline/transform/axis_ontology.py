@@ -1,37 +1,149 @@
 # pipeline/transform/axis_ontology.py
 
+"""
+The axis ontology: every emotional axis, its family, the genres that
+allow it, its keywords and its description — defined once, here.
+
+ONTOLOGY is compiled at import into lookup tables:
+
+- integer axis IDs (position in the sorted axis names) and bitmasks of
+  IDs, so "allowed for these genres" or "same family" are set operations
+  on ints
+- genre → allowed-axes mask, family → mask, axis → family ID
+- one precompiled keyword regex (the keyword automaton)
+
+axis_rules, axis_keywords and axis_generator re-export the raw tables.
+IDs are only stable for a given ontology: stored masks are rebuilt with
+the gold tables.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# ---------------------------------------------------------
+# Definitions
+# ---------------------------------------------------------
 AXIS_FAMILIES = {
-    "Reality & Perception": {
+    "Reality & Perception": [
         "Reality ↔ Illusion",
         "Truth ↔ Deception",
-    },
-    "Power & Control": {
+        "Truth ↔ Illusion",
+    ],
+    "Power & Control": [
         "Power ↔ Responsibility",
         "Control ↔ Chaos",
-    },
-    "Identity & Self": {
+        "Control ↔ Surrender",
+        "Freedom ↔ Constraint",
+        "Agency ↔ Powerlessness",
+    ],
+    "Identity & Self": [
         "Identity ↔ Role",
         "Self ↔ Mask",
-    },
-    "Survival & Stakes": {
+        "Identity ↔ Mask",
+    ],
+    "Survival & Stakes": [
         "Safety ↔ Threat",
         "Survival ↔ Sacrifice",
-    },
-    "Social Bonds": {
+    ],
+    "Social Bonds": [
         "Belonging ↔ Isolation",
         "Loyalty ↔ Betrayal",
-    },
-    "Order & Justice": {
+        "Individual ↔ Collective",
+        "Love ↔ Loss",
+    ],
+    "Order & Justice": [
         "Order ↔ Corruption",
         "Justice ↔ Compromise",
-    },
-    "Knowledge & Fear": {
+        "Order ↔ Chaos",
+        "Innocence ↔ Corruption",
+    ],
+    "Knowledge & Fear": [
         "Known ↔ Unknown",
         "Safety ↔ Exposure",
-    },
-    "Meaning & Absurdity": {
+    ],
+    "Meaning & Absurdity": [
         "Meaning ↔ Absurdity",
-    },
+        "Purpose ↔ Emptiness",
+        "Hope ↔ Despair",
+    ],
+}
+
+# Allowed axes per genre, in priority order
+GENRE_AXIS_RULES = {
+    "Science Fiction": [
+        "Reality ↔ Illusion",
+        "Control ↔ Surrender",
+        "Power ↔ Responsibility",
+        "Purpose ↔ Emptiness",
+        "Freedom ↔ Constraint",
+    ],
+    "Action": [
+        "Safety ↔ Threat",
+        "Order ↔ Chaos",
+        "Individual ↔ Collective",
+        "Survival ↔ Sacrifice",
+    ],
+    "Fantasy": [
+        "Power ↔ Responsibility",
+        "Identity ↔ Role",
+        "Order ↔ Chaos",
+        "Loyalty ↔ Betrayal",
+    ],
+    "Drama": [
+        "Identity ↔ Role",
+        "Purpose ↔ Emptiness",
+        "Justice ↔ Compromise",
+        "Loyalty ↔ Betrayal",
+    ],
+    "Adventure": [
+        "Individual ↔ Collective",
+        "Freedom ↔ Constraint",
+        "Survival ↔ Sacrifice",
+    ],
+}
+
+AXIS_KEYWORDS = {
+    "Reality ↔ Illusion": ["dream", "simulation", "illusion", "false", "real"],
+    "Control ↔ Surrender": ["control", "force", "resist", "submit", "command"],
+    "Power ↔ Responsibility": ["power", "weapon", "ability", "responsibility"],
+    "Purpose ↔ Emptiness": ["purpose", "meaning", "survive", "exist", "nothing"],
+    "Freedom ↔ Constraint": ["free", "escape", "trapped", "rule", "limit"],
+    "Safety ↔ Threat": ["threat", "danger", "protect", "attack", "enemy"],
+    "Order ↔ Chaos": ["order", "law", "collapse", "chaos", "anarchy"],
+    "Individual ↔ Collective": ["team", "alone", "together", "group"],
+    "Survival ↔ Sacrifice": ["survive", "sacrifice", "cost", "loss"],
+    "Identity ↔ Role": ["identity", "role", "who", "become"],
+    "Loyalty ↔ Betrayal": ["loyal", "betray", "trust", "turn"],
+    "Justice ↔ Compromise": ["justice", "right", "wrong", "deal"],
+    "Agency ↔ Powerlessness": ["helpless", "powerless", "choice", "agency", "fight back"],
+    "Identity ↔ Mask": ["disguise", "mask", "pretend", "double life", "impostor"],
+    "Hope ↔ Despair": ["hope", "despair", "grief", "give up", "last chance"],
+    "Innocence ↔ Corruption": ["innocent", "corrupt", "temptation", "greed", "child"],
+    "Love ↔ Loss": ["love", "romance", "death", "mourn", "widow"],
+    "Truth ↔ Illusion": ["truth", "lie", "hoax", "cover-up", "secret"],
+}
+
+# Short descriptions, embedded once and compared with the premise (axis_engine)
+AXIS_DESCRIPTIONS = {
+    "Reality ↔ Illusion": "not knowing what is real: dreams, simulations, false memories and illusions",
+    "Control ↔ Surrender": "fighting to stay in control versus giving in to a stronger force",
+    "Power ↔ Responsibility": "gaining great power or a weapon and having to use it responsibly",
+    "Purpose ↔ Emptiness": "searching for a reason to live or a mission that gives life meaning",
+    "Freedom ↔ Constraint": "escaping from a prison, rules or limits to be free",
+    "Safety ↔ Threat": "protecting people from a dangerous enemy, attack or threat",
+    "Order ↔ Chaos": "law and order collapsing into chaos and anarchy",
+    "Individual ↔ Collective": "acting alone versus working together as a team or group",
+    "Survival ↔ Sacrifice": "staying alive at any cost or sacrificing yourself for others",
+    "Identity ↔ Role": "discovering who you really are versus the role you are expected to play",
+    "Loyalty ↔ Betrayal": "trusting friends and family and being betrayed by someone close",
+    "Justice ↔ Compromise": "doing what is right versus making a deal with the wrong people",
+    "Agency ↔ Powerlessness": "taking control of your own fate versus being helpless against forces you cannot change",
+    "Identity ↔ Mask": "hiding behind a disguise or false persona while your real self is at risk of exposure",
+    "Hope ↔ Despair": "holding on to hope through grief and setbacks or giving up when all seems lost",
+    "Innocence ↔ Corruption": "an innocent person tempted, corrupted or losing their innocence",
+    "Love ↔ Loss": "loving someone deeply and losing them to death, distance or time",
+    "Truth ↔ Illusion": "uncovering the truth behind lies, hoaxes and comforting illusions",
 }
 
 # Reverse lookup
@@ -40,3 +152,144 @@ AXIS_TO_FAMILY = {
     for family, axes in AXIS_FAMILIES.items()
     for axis in axes
 }
+
+# ---------------------------------------------------------
+# Keyword automaton
+# ---------------------------------------------------------
+_SUFFIXES = r"(?:s|es|d|ed|ing|er|ers|al|ty|dom)?"
+# "escape" → escaping, "survive" → survival
+_E_SUFFIXES = r"(?:e|es|ed|ing|er|ers|al)"
+
+
+def _inflected(kw: str) -> str:
+    if kw.endswith("e") and len(kw) > 3:
+        return re.escape(kw[:-1]) + _E_SUFFIXES
+    return re.escape(kw) + _SUFFIXES
+
+
+# ---------------------------------------------------------
+# Compiled ontology
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class AxisOntology:
+    names: Tuple[str, ...]
+    ids: Dict[str, int]
+    families: Tuple[str, ...]
+    family_of: Tuple[int, ...]          # axis ID → family ID
+    family_masks: Tuple[int, ...]       # family ID → mask of its axes
+    genre_masks: Dict[str, int]
+    genre_order: Dict[str, Tuple[int, ...]]
+    keyword_pattern: "re.Pattern"
+    keyword_masks: Dict[str, int]       # regex group → mask of axes
+    descriptions: Dict[str, str]
+
+    @property
+    def all_mask(self) -> int:
+        return (1 << len(self.names)) - 1
+
+    # ---------- ids / masks ----------
+    def id(self, axis: str) -> Optional[int]:
+        return self.ids.get(axis)
+
+    def mask(self, axes: Iterable[str]) -> int:
+        """Bitmask of the known axes among `axes` (unknown ones are ignored)."""
+        m = 0
+        for axis in axes:
+            i = self.ids.get(axis)
+            if i is not None:
+                m |= 1 << i
+        return m
+
+    def names_of(self, mask: int) -> List[str]:
+        """Axis names in a mask, in ID order."""
+        out = []
+        while mask:
+            low = mask & -mask
+            out.append(self.names[low.bit_length() - 1])
+            mask ^= low
+        return out
+
+    # ---------- genres ----------
+    def allowed_mask(self, genres: Sequence) -> int:
+        m = 0
+        for g in genres:
+            m |= self.genre_masks.get(g["name"] if isinstance(g, dict) else str(g), 0)
+        return m
+
+    def allowed(self, genres: Sequence) -> List[str]:
+        """Allowed axes in genre priority order (first genre first)."""
+        seen, out = 0, []
+        for g in genres:
+            for i in self.genre_order.get(g["name"] if isinstance(g, dict) else str(g), ()):
+                if not seen >> i & 1:
+                    seen |= 1 << i
+                    out.append(self.names[i])
+        return out
+
+    # ---------- families ----------
+    def family(self, axis: str) -> Optional[str]:
+        i = self.ids.get(axis)
+        return None if i is None else self.families[self.family_of[i]]
+
+    def family_mask_of(self, axis: str) -> int:
+        i = self.ids.get(axis)
+        return 0 if i is None else self.family_masks[self.family_of[i]]
+
+    # ---------- keywords ----------
+    def keyword_hits(self, text: str) -> Dict[str, int]:
+        """Distinct keywords found per axis."""
+        found = {m.lastgroup for m in self.keyword_pattern.finditer(text)}
+
+        hits: Dict[str, int] = {}
+        for group in found:
+            for axis in self.names_of(self.keyword_masks[group]):
+                hits[axis] = hits.get(axis, 0) + 1
+        return hits
+
+
+def compile_ontology(
+    families: Dict[str, List[str]] = AXIS_FAMILIES,
+    genre_rules: Dict[str, List[str]] = GENRE_AXIS_RULES,
+    keywords: Dict[str, List[str]] = AXIS_KEYWORDS,
+    descriptions: Dict[str, str] = AXIS_DESCRIPTIONS,
+) -> AxisOntology:
+    family_by_axis = {axis: fam for fam, axes in families.items() for axis in axes}
+
+    # Every axis used anywhere must belong to a family
+    used = {a for axes in genre_rules.values() for a in axes} | set(keywords) | set(descriptions)
+    unknown = sorted(used - set(family_by_axis))
+    if unknown:
+        raise ValueError(f"Axes without a family: {unknown}")
+
+    names = tuple(sorted(family_by_axis))
+    ids = {axis: i for i, axis in enumerate(names)}
+    family_names = tuple(families)
+    family_index = {fam: i for i, fam in enumerate(family_names)}
+
+    family_masks = [0] * len(family_names)
+    for axis, fam in family_by_axis.items():
+        family_masks[family_index[fam]] |= 1 << ids[axis]
+
+    axes_by_keyword: Dict[str, int] = {}
+    for axis, kws in keywords.items():
+        for kw in kws:
+            axes_by_keyword[kw.lower()] = axes_by_keyword.get(kw.lower(), 0) | 1 << ids[axis]
+
+    ordered = sorted(axes_by_keyword, key=len, reverse=True)
+    alternation = "|".join(f"(?P<k{i}>{_inflected(kw)})" for i, kw in enumerate(ordered))
+
+    return AxisOntology(
+        names=names,
+        ids=ids,
+        families=family_names,
+        family_of=tuple(family_index[family_by_axis[a]] for a in names),
+        family_masks=tuple(family_masks),
+        genre_masks={g: sum(1 << ids[a] for a in set(axes)) for g, axes in genre_rules.items()},
+        genre_order={g: tuple(dict.fromkeys(ids[a] for a in axes)) for g, axes in genre_rules.items()},
+        keyword_pattern=re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE),
+        keyword_masks={f"k{i}": axes_by_keyword[kw] for i, kw in enumerate(ordered)},
+        descriptions=dict(descriptions),
+    )
+
+
+ONTOLOGY = compile_ontology()
@@ -1,34 +1,4 @@
 # pipeline/transform/axis_rules.py
 
-GENRE_AXIS_RULES = {
-    "Science Fiction": [
-        "Reality ↔ Illusion",
-        "Control ↔ Surrender",
-        "Power ↔ Responsibility",
-        "Purpose ↔ Emptiness",
-        "Freedom ↔ Constraint"
-    ],
-    "Action": [
-        "Safety ↔ Threat",
-        "Order ↔ Chaos",
-        "Individual ↔ Collective",
-        "Survival ↔ Sacrifice"
-    ],
-    "Fantasy": [
-        "Power ↔ Responsibility",
-        "Identity ↔ Role",
-        "Order ↔ Chaos",
-        "Loyalty ↔ Betrayal"
-    ],
-    "Drama": [
-        "Identity ↔ Role",
-        "Purpose ↔ Emptiness",
-        "Justice ↔ Compromise",
-        "Loyalty ↔ Betrayal"
-    ],
-    "Adventure": [
-        "Individual ↔ Collective",
-        "Freedom ↔ Constraint",
-        "Survival ↔ Sacrifice"
-    ],
-}
+# Defined in axis_ontology (the single source); re-exported here
+from pipeline.transform.axis_ontology import GENRE_AXIS_RULES  # noqa: F401
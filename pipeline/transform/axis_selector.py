@@ -1,36 +1,22 @@
 # pipeline/transform/axis_selector.py
 
-from collections import defaultdict
-from .axis_rules import GENRE_AXIS_RULES
-from .axis_keywords import AXIS_KEYWORDS
+from .axis_engine import candidate_axes, keyword_hits, movie_text
 
 
 def select_axes(genres, premise, character_anchors, max_axes=3):
     """
     Deterministically select axes based on genre + keyword overlap.
+    (Keyword-only; axis_engine.decide_axes adds embeddings and a
+    confidence check.)
     """
 
-    candidate_axes = set()
-    for g in genres:
-        name = g["name"] if isinstance(g, dict) else str(g)
-        if name in GENRE_AXIS_RULES:
-            candidate_axes.update(GENRE_AXIS_RULES[name])
-
-    text = premise.lower()
-    for c in character_anchors:
-        text += " " + c["label"].lower()
-
-    scores = defaultdict(int)
-
-    for axis in candidate_axes:
-        for kw in AXIS_KEYWORDS.get(axis, []):
-            if kw in text:
-                scores[axis] += 1
+    candidates = candidate_axes(genres)
+    hits = keyword_hits(movie_text(premise, character_anchors))
 
     # sort by score desc, fallback to genre priority
     sorted_axes = sorted(
-        candidate_axes,
-        key=lambda a: scores[a],
+        candidates,
+        key=lambda a: hits.get(a, 0),
         reverse=True
     )
 
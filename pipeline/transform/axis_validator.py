@@ -1,27 +1,26 @@
 #!/usr/bin/env python3
 
 from typing import Dict, List
-from pipeline.transform.axis_generator import GENRE_AXIS_RULES
+from pipeline.transform.axis_ontology import ONTOLOGY
 
 def validate_axes(
     axes: Dict,
     genres: List[str]
 ) -> Dict:
-    allowed = set()
-    for g in genres:
-        allowed.update(GENRE_AXIS_RULES.get(g, []))
+    allowed = ONTOLOGY.allowed_mask(genres)
+    primary = axes.get("primary", [])
 
     errors = []
 
-    for ax in axes.get("primary", []):
-        if ax not in allowed:
+    for ax in primary:
+        if not allowed & ONTOLOGY.mask([ax]):
             errors.append(f"Invalid primary axis: {ax}")
 
     sec = axes.get("secondary")
-    if sec and sec not in allowed:
+    if sec and not allowed & ONTOLOGY.mask([sec]):
         errors.append(f"Invalid secondary axis: {sec}")
 
-    if len(set(axes.get("primary", []))) < len(axes.get("primary", [])):
+    if len(set(primary)) < len(primary):
         errors.append("Duplicate primary axes")
 
     return {
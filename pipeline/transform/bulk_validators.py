@@ -0,0 +1,242 @@
+# pipeline/transform/bulk_validators.py
+
+"""
+Vectorized versions of the per-record validators.
+
+Each function takes a Polars DataFrame of generated text and returns it with
+a `validation` struct column ({status, reason}) — the same shape the gold
+jobs write — so a full catalog can be re-validated in one pass after a rule
+change. Rule order matches the scalar validators, so the first failing rule
+is the one reported.
+"""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from pipeline.lazy import lazy_import
+from pipeline.transform.premise_validator import GENRE_KEYWORDS, INVALID_PATTERNS
+from pipeline.transform.critic_validator import BANNED_WORDS
+from pipeline.transform.critic_soft_validator import ABSTRACT_PHRASES
+
+pl = lazy_import("polars")
+
+# Same word definition as str.split()
+_WORD = r"\S+"
+
+AUDIENCE_PHRASES = ["viewers", "audience", "people", "you feel", "it feels"]
+PREMISE_STOPWORDS = ["about", "their", "there", "which"]
+CONFLICT_MARKERS = [
+    "struggle", "conflict", "threat", "pressure",
+    "collapse", "choice", "risk", "cost", "loss"
+]
+
+
+# --------------------------------------------------
+# Helpers
+# --------------------------------------------------
+def _first_failure(rules: List[Tuple[pl.Expr, str]]) -> pl.Expr:
+    """
+    Folds (failed, reason) pairs into one expression that yields the
+    reason of the first failing rule, or null when every rule passes.
+    """
+    expr = None
+    for failed, reason in rules:
+        reason_expr = reason if isinstance(reason, pl.Expr) else pl.lit(reason)
+        if expr is None:
+            expr = pl.when(failed).then(reason_expr)
+        else:
+            expr = expr.when(failed).then(reason_expr)
+    return expr.otherwise(pl.lit(None, dtype=pl.Utf8))
+
+
+def _with_validation(
+    df: pl.DataFrame,
+    reason: pl.Expr,
+    pass_status: str = "pass",
+    pass_reason: str = "pass",
+) -> pl.DataFrame:
+    failed = reason.is_not_null()
+    return df.with_columns(
+        validation=pl.struct(
+            status=pl.when(failed).then(pl.lit("flagged")).otherwise(pl.lit(pass_status)),
+            reason=pl.when(failed).then(reason).otherwise(pl.lit(pass_reason)),
+        )
+    )
+
+
+def _struct_field(df: pl.DataFrame, col: str, field: str) -> pl.Expr:
+    """Struct field access that yields null when the field was never generated."""
+    dtype = df.schema[col]
+    if isinstance(dtype, pl.Struct) and field in [f.name for f in dtype.fields]:
+        return pl.col(col).struct.field(field)
+    return pl.lit(None, dtype=pl.Utf8)
+
+
+# --------------------------------------------------
+# Premises
+# --------------------------------------------------
+def validate_premises_frame(
+    df: pl.DataFrame,
+    text_col: str = "premise",
+    genres_col: str = "genres",
+) -> pl.DataFrame:
+    """
+    Bulk validate_premise().
+    `genres_col` holds the TMDb genre list (list of {id, name} structs).
+    """
+    text = pl.col(text_col).fill_null("")
+    lowered = text.str.to_lowercase()
+
+    frame = df.with_row_index("_row")
+
+    # ---- First genre (in movie order) whose keywords are all missing ----
+    genre_rules = [(g, kws) for g, kws in GENRE_KEYWORDS.items() if kws]
+    missing = pl.lit(False)
+    for genre_name, keywords in reversed(genre_rules):
+        missing = (
+            pl.when(pl.col("_genre") == genre_name)
+            .then(~pl.col("_text").str.contains_any(keywords))
+            .otherwise(missing)
+        )
+
+    genre_failures = (
+        frame.select(
+            "_row",
+            _text=lowered,
+            _genre=pl.col(genres_col),
+        )
+        .explode("_genre")
+        .with_columns(_genre=pl.col("_genre").struct.field("name"))
+        .filter(missing)
+        .group_by("_row", maintain_order=True)
+        .agg(_missing_genre=pl.col("_genre").first())
+    )
+
+    frame = frame.join(genre_failures, on="_row", how="left")
+
+    word_count = text.str.count_matches(_WORD)
+    reason = _first_failure([
+        (pl.any_horizontal([lowered.str.contains(p) for p in INVALID_PATTERNS]),
+         "abstract_or_meta_language"),
+        (pl.col("_missing_genre").is_not_null(),
+         pl.lit("missing_genre_keyword:") + pl.col("_missing_genre")),
+        ((word_count < 8) | (word_count > 30), "invalid_length"),
+    ])
+
+    return _with_validation(frame, reason).drop("_row", "_missing_genre")
+
+
+# --------------------------------------------------
+# Critic summaries
+# --------------------------------------------------
+def validate_critic_summaries_frame(
+    df: pl.DataFrame,
+    text_col: str = "critic_summary",
+) -> pl.DataFrame:
+    """Bulk validate_critic_summary()."""
+    text = pl.col(text_col).fill_null("")
+    lowered = text.str.to_lowercase()
+
+    rules = [(text.str.count_matches(_WORD) < 60, "too_short")]
+
+    # Iterate the set exactly like the scalar validator does
+    for word in BANNED_WORDS:
+        rules.append((lowered.str.contains(word, literal=True), f"banned_word:{word}"))
+
+    rules += [
+        (~lowered.str.contains_any(AUDIENCE_PHRASES), "no_audience_perspective"),
+        (lowered.str.contains(r"\b(identity|tension|duality|conflict)\b"), "abstract_language"),
+    ]
+
+    return _with_validation(df, _first_failure(rules))
+
+
+def soft_validate_critics_frame(
+    df: pl.DataFrame,
+    text_col: str = "critic_summary",
+    premise_col: str = "premise",
+) -> pl.DataFrame:
+    """
+    Bulk soft_validate_critic().
+    Premise grounding is computed as a token-set intersection per row.
+    """
+    summary = pl.col(text_col).fill_null("")
+    premise = pl.col(premise_col).fill_null("")
+    summary_l = summary.str.to_lowercase()
+    word_count = summary.str.count_matches(_WORD)
+
+    abstract_hits = pl.sum_horizontal([
+        summary_l.str.contains(p, literal=True).cast(pl.Int32)
+        for p in ABSTRACT_PHRASES
+    ])
+
+    premise_tokens = (
+        premise.str.to_lowercase()
+        .str.extract_all(r"[a-z]{4,}")
+        .list.eval(pl.element().filter(~pl.element().is_in(PREMISE_STOPWORDS)))
+    )
+    summary_tokens = summary_l.str.extract_all(r"[a-z]{4,}")
+    overlap = premise_tokens.list.set_intersection(summary_tokens).list.len()
+    has_conflict = summary_tokens.list.eval(pl.element().is_in(CONFLICT_MARKERS)).list.any()
+
+    reason = _first_failure([
+        ((summary == "") | (premise == ""), "empty"),
+        ((word_count < 70) | (word_count > 150), "length_out_of_bounds"),
+        (abstract_hits >= 2, "too_abstract"),
+        (overlap < 2, "weak_premise_grounding"),
+        (~has_conflict, "no_conflict_signal"),
+    ])
+
+    return _with_validation(df, reason, pass_status="pass_soft", pass_reason="soft_pass")
+
+
+# --------------------------------------------------
+# Emotional capsules
+# --------------------------------------------------
+def validate_capsules_frame(
+    df: pl.DataFrame,
+    capsules_col: str = "emotional_capsules",
+    axes_col: str = "axes",
+) -> pl.DataFrame:
+    """
+    Bulk validate_emotional_capsules().
+    Capsules are exploded once; the first failing capsule decides the reason.
+    """
+    frame = df.with_row_index("_row")
+
+    exploded = (
+        frame.select("_row", _capsule=pl.col(capsules_col), _axes=pl.col(axes_col))
+        .explode("_capsule")
+        .filter(pl.col("_capsule").is_not_null())
+    )
+
+    axis = _struct_field(exploded, "_capsule", "axis")
+    emotion = _struct_field(exploded, "_capsule", "emotion")
+    text = _struct_field(exploded, "_capsule", "text")
+
+    capsule_reason = _first_failure([
+        (axis.is_null() | emotion.is_null() | text.is_null(), "invalid_structure"),
+        (~pl.col("_axes").list.contains(axis).fill_null(False), "invalid_axis"),
+        (text.str.count_matches(_WORD) > 20, "text_too_long"),
+        (text.str.to_lowercase().str.contains(r"\b(masterfully|intricately|explores|delves)\b"),
+         "ai_language"),
+    ])
+
+    capsule_failures = (
+        exploded.select("_row", _capsule_reason=capsule_reason)
+        .filter(pl.col("_capsule_reason").is_not_null())
+        .group_by("_row", maintain_order=True)
+        .agg(pl.col("_capsule_reason").first())
+    )
+
+    frame = frame.join(capsule_failures, on="_row", how="left")
+
+    count = pl.col(capsules_col).list.len().fill_null(0)
+    reason = _first_failure([
+        (count == 0, "no_capsules"),
+        (count < 4, "too_few_capsules"),
+        (pl.col("_capsule_reason").is_not_null(), pl.col("_capsule_reason")),
+    ])
+
+    return _with_validation(frame, reason).drop("_row", "_capsule_reason")
@@ -1,11 +1,19 @@
 # pipeline/transform/character_anchor_extractor.py
 
-import json
+from typing import Dict, List
 
-def extract_character_anchors(client, title: str, premise: str):
-    prompt = f"""
-Extract CHARACTER ANCHORS for a movie.
+from pipeline.transform.character_anchor_validator import ALLOWED_TYPES
+from pipeline.transform.prompt_registry import register
+from pipeline.transform.structured_output import (
+    anchor_list_schema,
+    anchors_schema,
+    create_structured,
+    items,
+    keyed_items,
+    packed_schema,
+)
 
+ANCHOR_RULES = """
 Definition:
 A character anchor is a SIMPLE, CONCRETE identifier
 that instantly helps a human recognize the movie.
@@ -24,36 +32,82 @@ Allowed types:
 - duo
 - team
 - symbolic
+"""
 
+
+ANCHORS_PROMPT = register(
+    "character_anchors",
+    prefix=f"""
+Extract CHARACTER ANCHORS for a movie.
+{ANCHOR_RULES}
 Return ONLY valid JSON.
 No markdown. No explanation.
 
 Format:
-[
-  {{
-    "label": "Cooper",
-    "descriptor": "astronaut father",
-    "type": "protagonist"
-  }}
-]
-
+{{
+  "anchors": [
+    {{
+      "label": "Cooper",
+      "descriptor": "astronaut father",
+      "type": "protagonist"
+    }}
+  ]
+}}
+""",
+    template="""
 Movie title: {title}
 Premise: {premise}
-"""
+""",
+)
 
-    resp = client.responses.create(
-        model="gpt-4o-mini",
-        input=prompt
-    )
+PACKED_ANCHORS_PROMPT = register(
+    "character_anchors_packed",
+    prefix=f"""
+Extract CHARACTER ANCHORS for EACH movie listed.
+{ANCHOR_RULES}
+Return one item per movie, with its movie_id.
+""",
+    template="""
+{listing}
+""",
+)
 
-    raw = resp.output_text.strip()
 
-    try:
-        parsed = json.loads(raw)
-        if isinstance(parsed, list):
-            return parsed
-        return []
-    except json.JSONDecodeError:
+def extract_character_anchors(client, title: str, premise: str):
+    parsed, raw = create_structured(
+        client,
+        ANCHORS_PROMPT.render(title=title, premise=premise),
+        "character_anchors",
+        anchors_schema(sorted(ALLOWED_TYPES)),
+        instructions=ANCHORS_PROMPT.prefix,
+    )
+
+    if parsed is None:
         print(f"[!] JSON parse failed for: {title}")
         print(raw)
         return []
+
+    # {"anchors": [...]} per the schema; a bare list is accepted too
+    return items(parsed, "anchors")
+
+
+def extract_character_anchors_packed(client, movies: List[Dict]) -> Dict[int, List]:
+    """
+    One request for several movies ({movie_id, title, premise}).
+    Returns {movie_id: anchors} for the movies the response covered.
+    """
+    listing = "\n\n".join(
+        f"movie_id: {m['movie_id']}\nMovie title: {m['title']}\nPremise: {m['premise']}"
+        for m in movies
+    )
+
+    schema = packed_schema({"anchors": anchor_list_schema(sorted(ALLOWED_TYPES))})
+    data, _ = create_structured(
+        client,
+        PACKED_ANCHORS_PROMPT.render(listing=listing),
+        "character_anchors_packed",
+        schema,
+        instructions=PACKED_ANCHORS_PROMPT.prefix,
+    )
+
+    return {mid: items(item, "anchors") for mid, item in keyed_items(data).items()}
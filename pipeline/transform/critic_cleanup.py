@@ -0,0 +1,74 @@
+# pipeline/transform/critic_cleanup.py
+
+"""
+Local repairs for critic summaries — no regeneration.
+
+Used by cleanup_critic_summaries on flagged output, and by the retry
+scheduler in build_critic_summaries before a summary is re-queued.
+"""
+
+import re
+
+from pipeline.transform.critic_validator import BANNED_WORDS
+
+# --------------------------------------------------
+# Generic phrases to remove (surgical)
+# --------------------------------------------------
+GENERIC_PHRASES = [
+    "emotional journey",
+    "deeply emotional",
+    "thought-provoking experience",
+    "explores themes of",
+    "at its core",
+    "ultimately",
+    "serves as a reminder",
+]
+
+# Removed one after another, in list order: overlapping phrases
+# ("deeply emotional journey") depend on it
+_GENERIC = [
+    re.compile(r"\b" + re.escape(phrase) + r"\b", re.IGNORECASE)
+    for phrase in GENERIC_PHRASES
+]
+
+# Words the validator rejects (banned words match as substrings there)
+_FLAGGED = re.compile(
+    "|".join(map(re.escape, sorted(BANNED_WORDS)))
+    + r"|\b(?:identity|tension|duality|conflict)\b",
+    re.IGNORECASE,
+)
+
+_SENTENCE = re.compile(r"(?<=[.!?])\s+")
+
+
+def clean_critic_summary(text: str) -> str:
+    if not text:
+        return ""
+
+    # Remove markdown italics/bold
+    text = re.sub(r"[*_]{1,2}([^*_]+)[*_]{1,2}", r"\1", text)
+
+    # Strip leading/trailing quotes
+    text = text.strip().strip('"').strip("'")
+
+    # Remove excessive parentheses
+    text = re.sub(r"\([^)]*\)", "", text)
+
+    # Remove generic phrases
+    for pattern in _GENERIC:
+        text = pattern.sub("", text)
+
+    # Normalize whitespace
+    text = re.sub(r"\s{2,}", " ", text)
+    text = re.sub(r"\s+([.,])", r"\1", text)
+
+    return text.strip()
+
+
+def drop_flagged_sentences(text: str) -> str:
+    """Drops the sentences that use banned or academic words."""
+    if not text:
+        return ""
+
+    kept = [s for s in _SENTENCE.split(text.strip()) if not _FLAGGED.search(s)]
+    return " ".join(kept)
@@ -1,22 +1,27 @@
 # pipeline/transform/critic_extractor.py
 
+import asyncio
 import os
-import json
-from typing import List, Dict, Any
-from dotenv import load_dotenv
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
-from pathlib import Path
-
-# Load environment
-ROOT = Path(__file__).resolve().parents[2]
-load_dotenv(ROOT / ".env")
-
-from openai import OpenAI
-client = OpenAI()
+from pipeline.llm_client import get_async_client, get_client, load_env
+from pipeline.transform.prompt_registry import register
+from pipeline.transform.structured_output import StructuredOutputError, parse_json
 
 # Faster + cheaper model
 MODEL = "gpt-4o-mini"     # MUCH faster than 4.1-mini and reliable
 
+DEFAULT_CONCURRENCY = 16
+
+
+def max_concurrency() -> int:
+    """LLM_CONCURRENCY: requests in flight at once across all movies (async API)."""
+    load_env()
+    return int(os.getenv("LLM_CONCURRENCY", DEFAULT_CONCURRENCY))
+
 
 # ---------------------------------------------------------
 #  Select strongest review snippets
@@ -41,12 +46,13 @@ def select_review_snippets(validated_reviews: List[Dict], max_snippets: int = 5)
 
 # ---------------------------------------------------------
 #  Critic Summary Prompt — Updated & Strict
+#  (static prefix first, film-specific part last: see prompt_registry)
 # ---------------------------------------------------------
-def build_critic_prompt(title: str, overview: str, genres: List[str], review_snippets: List[str]):
-    genre_str = ", ".join(genres)
-    snippets = "\n".join(f"- {s}" for s in review_snippets)
+CRITIC_PROMPT = register(
+    "thematic_critic_summary",
+    prefix="""
+You produce high-quality thematic film analysis.
 
-    return f"""
 You are a professional film critic with expert-level knowledge of cinema history, genre conventions, and thematic analysis.
 
 Write ONE paragraph (80–120 words) that analyzes the film’s broader thematic ideas.
@@ -72,31 +78,42 @@ Focus only on:
 
 When drawing on prior knowledge, keep it thematic — NEVER descriptive.
 
+Your Output:
+One cohesive thematic paragraph, no more than 120 words.
+""",
+    template="""
 Film Title: {title}
-Genres: {genre_str}
+Genres: {genres}
 
 Overview:
 {overview}
 
 Key Audience Review Signals:
 {snippets}
+""",
+)
 
-Your Output:
-One cohesive thematic paragraph, no more than 120 words.
-"""
+
+def build_critic_messages(title: str, overview: str, genres: List[str], review_snippets: List[str]):
+    return CRITIC_PROMPT.messages(
+        title=title,
+        genres=", ".join(genres),
+        overview=overview,
+        snippets="\n".join(f"- {s}" for s in review_snippets),
+    )
 
 
 # ---------------------------------------------------------
 #  Emotional Capsules Prompt — STRICT THEME RULES
 # ---------------------------------------------------------
-def build_emotional_capsules_prompt(title: str, overview: str, genres: List[str], review_snippets: List[str]):
-    genre_str = ", ".join(genres)
-    snippets = "\n".join(f"- {s}" for s in review_snippets)
+CAPSULES_PROMPT = register(
+    "thematic_emotional_capsules",
+    prefix="""
+You generate emotional narrative archetypes without scene details.
 
-    return f"""
 You are an expert narrative analyst.
 
-Generate **5 emotional capsules** for the film *{title}*.
+Generate **5 emotional capsules** for the film described at the end.
 Each capsule must be 3–5 sentences.
 
 STRICT RULES:
@@ -126,32 +143,46 @@ CONTENT RULES:
 ALLOWED:
 ✔ High-level emotional archetypes
 ✔ Connections inspired by reviews
-✔ Tone/style consistent with genres: {genre_str}
-
-FILM OVERVIEW:
-{overview}
-
-AUDIENCE REVIEW SIGNALS:
-{snippets}
+✔ Tone/style consistent with the film's genres
 
 Output EXACTLY this JSON structure:
 
 [
-  {{
+  {
     "theme": "...",
     "emotion": "...",
     "text": "3–5 sentences..."
-  }},
+  },
   ...
 ]
-"""
+""",
+    template="""
+FILM: {title}
+GENRES: {genres}
+
+FILM OVERVIEW:
+{overview}
+
+AUDIENCE REVIEW SIGNALS:
+{snippets}
+""",
+)
+
+
+def build_emotional_capsules_messages(title: str, overview: str, genres: List[str], review_snippets: List[str]):
+    return CAPSULES_PROMPT.messages(
+        title=title,
+        genres=", ".join(genres),
+        overview=overview,
+        snippets="\n".join(f"- {s}" for s in review_snippets),
+    )
 
 
 # ---------------------------------------------------------
-#  Main generation logic
+#  Requests (shared by the sync and async paths)
 # ---------------------------------------------------------
-def generate_movie_themes_and_capsules(movie: Dict[str, Any]) -> Dict[str, Any]:
-
+def build_requests(movie: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Chat Completions kwargs per stage; the two stages are independent."""
     title = movie["title"]
     overview = movie.get("overview", "")
     genres = [g["name"] for g in movie.get("genres", [])]
@@ -159,42 +190,139 @@ def generate_movie_themes_and_capsules(movie: Dict[str, Any]) -> Dict[str, Any]:
     validated_reviews = movie.get("validated_reviews", [])
     review_snippets = select_review_snippets(validated_reviews, max_snippets=5)
 
-    critic_prompt = build_critic_prompt(title, overview, genres, review_snippets)
-    capsule_prompt = build_emotional_capsules_prompt(title, overview, genres, review_snippets)
-
-    # ---------- Critic Summary ----------
-    critic_resp = client.chat.completions.create(
-        model=MODEL,
-        messages=[
-            {"role": "system", "content": "You produce high-quality thematic film analysis."},
-            {"role": "user", "content": critic_prompt}
-        ],
-        temperature=0.4,
-        max_tokens=250
-    )
-    critic_summary = critic_resp.choices[0].message.content.strip()
-
-    # ---------- Emotional Capsules ----------
-    capsule_resp = client.chat.completions.create(
-        model=MODEL,
-        messages=[
-            {"role": "system", "content": "You generate emotional narrative archetypes without scene details."},
-            {"role": "user", "content": capsule_prompt}
-        ],
-        temperature=0.5,
-        max_tokens=600
-    )
+    return {
+        "critic_summary": {
+            "model": MODEL,
+            "messages": build_critic_messages(title, overview, genres, review_snippets),
+            "temperature": 0.4,
+            "max_tokens": 250,
+        },
+        "emotional_capsules": {
+            "model": MODEL,
+            "messages": build_emotional_capsules_messages(title, overview, genres, review_snippets),
+            "temperature": 0.5,
+            "max_tokens": 600,
+        },
+    }
 
-    capsules_text = capsule_resp.choices[0].message.content.strip()
 
+def build_entry(movie: Dict[str, Any], critic_summary: str, capsules_text: str) -> Dict[str, Any]:
     try:
-        capsules = json.loads(capsules_text)
-    except Exception:
+        capsules = parse_json(capsules_text)
+    except StructuredOutputError:
         capsules = [{"theme": "Unknown Motif", "emotion": "neutral", "text": capsules_text}]
 
     return {
         "movie_id": movie["movie_id"],
-        "title": title,
+        "title": movie["title"],
         "critic_summary": critic_summary,
         "emotional_capsules": capsules
     }
+
+
+def _content(resp) -> str:
+    return resp.choices[0].message.content.strip()
+
+
+# ---------------------------------------------------------
+#  Main generation logic (sync, one call after the other)
+# ---------------------------------------------------------
+def generate_movie_themes_and_capsules(movie: Dict[str, Any]) -> Dict[str, Any]:
+    requests = build_requests(movie)
+    client = get_client()
+
+    critic_summary = _content(client.chat.completions.create(**requests["critic_summary"]))
+    capsules_text = _content(client.chat.completions.create(**requests["emotional_capsules"]))
+
+    return build_entry(movie, critic_summary, capsules_text)
+
+
+# ---------------------------------------------------------
+#  Async: both calls per movie at once, many movies in flight
+# ---------------------------------------------------------
+@dataclass
+class StageLatency:
+    """Wall-clock seconds per stage ("movie" = both calls end to end)."""
+    samples: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+
+    def add(self, stage: str, seconds: float):
+        self.samples[stage].append(seconds)
+
+    def report(self):
+        for stage, values in sorted(self.samples.items()):
+            values = sorted(values)
+            p50 = values[len(values) // 2]
+            p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+            mean = sum(values) / len(values)
+            print(f"    {stage:<20} n={len(values):<6} mean={mean:.2f}s  p50={p50:.2f}s  p95={p95:.2f}s")
+
+
+async def agenerate_movie_themes_and_capsules(
+    movie: Dict[str, Any],
+    client=None,
+    limiter: Optional[asyncio.Semaphore] = None,
+    latency: Optional[StageLatency] = None,
+) -> Dict[str, Any]:
+    """
+    Async counterpart of generate_movie_themes_and_capsules: the critic and
+    capsule calls run concurrently. `limiter` caps requests in flight
+    across every movie sharing it.
+    """
+    client = client or get_async_client()
+    limiter = limiter or asyncio.Semaphore(max_concurrency())
+    latency = latency if latency is not None else StageLatency()
+
+    async def call(stage: str, kwargs: Dict[str, Any]) -> str:
+        async with limiter:
+            start = time.perf_counter()
+            resp = await client.chat.completions.create(**kwargs)
+            latency.add(stage, time.perf_counter() - start)
+        return _content(resp)
+
+    start = time.perf_counter()
+    requests = build_requests(movie)
+    critic_summary, capsules_text = await asyncio.gather(
+        call("critic_summary", requests["critic_summary"]),
+        call("emotional_capsules", requests["emotional_capsules"]),
+    )
+    latency.add("movie", time.perf_counter() - start)
+
+    return build_entry(movie, critic_summary, capsules_text)
+
+
+async def agenerate_all(
+    movies: Iterable[Dict[str, Any]],
+    concurrency: Optional[int] = None,
+    on_done: Optional[Callable[[Dict[str, Any], Optional[Dict], Optional[Exception]], None]] = None,
+    latency: Optional[StageLatency] = None,
+    client=None,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Generates every movie with at most `concurrency` requests in flight
+    (default: the LLM_CONCURRENCY setting).
+    Results keep input order; a movie whose calls failed is None.
+    on_done(movie, entry, error) is called as each movie finishes.
+    """
+    movies = list(movies)
+    client = client or get_async_client()
+    concurrency = concurrency or max_concurrency()
+    limiter = asyncio.Semaphore(concurrency)
+    latency = latency if latency is not None else StageLatency()
+    results: List[Optional[Dict[str, Any]]] = [None] * len(movies)
+    pending = iter(enumerate(movies))
+
+    async def worker():
+        # Each worker holds one movie (two requests); the limiter is what
+        # actually caps requests in flight.
+        for idx, movie in pending:
+            entry, error = None, None
+            try:
+                entry = await agenerate_movie_themes_and_capsules(movie, client, limiter, latency)
+            except Exception as e:
+                error = e
+            results[idx] = entry
+            if on_done is not None:
+                on_done(movie, entry, error)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(movies))))))
+    return results
@@ -1,14 +1,12 @@
 # cheerbox/pipeline/transform/critic_generator.py
 
-def generate_critic_summary(client, title: str, premise: str, axes: list[str]) -> str:
-    """
-    Generates a human-sounding critic summary that explains
-    WHY the movie emotionally works on audiences.
-    """
+from pipeline.transform.critic_validator import critic_hard_violation
+from pipeline.transform.prompt_registry import register
+from pipeline.transform.streaming import generate
 
-    axes_text = ", ".join(axes)
-
-    prompt = f"""
+CRITIC_SUMMARY_PROMPT = register(
+    "critic_summary",
+    prefix="""
 You are writing like a human film critic explaining audience reaction.
 
 Write ONE paragraph (70–100 words).
@@ -21,20 +19,42 @@ Rules (VERY IMPORTANT):
 - DO explain how the movie makes viewers feel and why it stays with them
 - Write like someone recommending the movie from experience
 
+Write naturally and plainly.
+""",
+    template="""
 Movie title: {title}
 
 Movie identity:
 {premise}
 
 Emotional tensions the movie operates on:
-{axes_text}
+{axes}
+""",
+)
+
+
+def critic_summary_request(title: str, premise: str, axes: list[str]) -> dict:
+    return {
+        "model": "gpt-4o-mini",
+        "instructions": CRITIC_SUMMARY_PROMPT.prefix,
+        "input": CRITIC_SUMMARY_PROMPT.render(title=title, premise=premise, axes=", ".join(axes)),
+    }
 
-Write naturally and plainly.
-"""
 
-    response = client.responses.create(
-        model="gpt-4o-mini",
-        input=prompt
-    )
+def generate_critic_summary(client, title: str, premise: str, axes: list[str]) -> str:
+    """
+    Generates a human-sounding critic summary that explains
+    WHY the movie emotionally works on audiences.
+    """
+
+    response = client.responses.create(**critic_summary_request(title, premise, axes))
 
     return response.output_text.strip()
+
+
+def stream_critic_summary(client, title: str, premise: str, axes: list[str]):
+    """
+    Streaming generate_critic_summary: returns Aborted as soon as the
+    partial summary uses a banned or academic word.
+    """
+    return generate(client, critic_hard_violation, **critic_summary_request(title, premise, axes))
@@ -1,6 +1,7 @@
 # cheerbox/pipeline/transform/critic_validator.py
 
 import re
+from typing import Optional
 
 BANNED_WORDS = {
     "masterfully",
@@ -14,6 +15,12 @@ BANNED_WORDS = {
     "symbolizes"
 }
 
+ABSTRACT_LANGUAGE = re.compile(r"\b(identity|tension|duality|conflict)\b")
+
+# Same words, but only once followed by another character: on partial
+# output "conflict" may still become "conflicted"
+_ABSTRACT_WORD_DONE = re.compile(r"\b(identity|tension|duality|conflict)(?=\W)")
+
 def validate_critic_summary(text: str) -> tuple[bool, str]:
     """
     Validates whether the critic summary sounds human and experiential.
@@ -36,7 +43,24 @@ def validate_critic_summary(text: str) -> tuple[bool, str]:
         return False, "no_audience_perspective"
 
     # reject academic tone
-    if re.search(r"\b(identity|tension|duality|conflict)\b", lowered):
+    if ABSTRACT_LANGUAGE.search(lowered):
         return False, "abstract_language"
 
     return True, "pass"
+
+
+def critic_hard_violation(partial: str) -> Optional[str]:
+    """
+    Partial-output check for streaming: the violations no continuation
+    can fix (banned words, academic words). Same reasons as the validator.
+    """
+    lowered = partial.lower()
+
+    for word in BANNED_WORDS:
+        if word in lowered:
+            return f"banned_word:{word}"
+
+    if _ABSTRACT_WORD_DONE.search(lowered):
+        return "abstract_language"
+
+    return None
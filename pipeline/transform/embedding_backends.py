@@ -0,0 +1,215 @@
+# pipeline/transform/embedding_backends.py
+
+"""
+Embedding backend registry.
+
+Every backend encodes a batch of texts into a float32 matrix and keeps
+throughput counters. The backend is picked by name (EMBEDDING_BACKEND in
+.env), so CPU-only hosts can swap the PyTorch mpnet model for an ONNX
+Runtime export, an int8-quantized ONNX model, or the smaller MiniLM.
+
+Built-in backends:
+- mpnet / minilm                   sentence-transformers on PyTorch
+- mpnet-onnx / minilm-onnx         same models on ONNX Runtime
+- mpnet-onnx-int8 / minilm-onnx-int8  int8-quantized ONNX exports
+- openai                           remote API, one pooled client, batched input
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Callable, Dict, List, Optional
+
+from pipeline.lazy import lazy_import
+from pipeline.llm_client import get_client, load_env
+
+np = lazy_import("numpy")
+
+DEFAULT_BACKEND = "mpnet"
+
+# Quantized export shipped in the sentence-transformers model repos;
+# pick another via EMBEDDING_ONNX_INT8_FILE
+# (e.g. onnx/model_qint8_avx512_vnni.onnx) to match the CPU.
+ONNX_INT8_FILE = "onnx/model_quint8_avx2.onnx"
+
+MAX_CHARS = 3500  # safety truncation, same as the single-text helpers
+
+
+# -------------------------------------------------------------------
+# Base class
+# -------------------------------------------------------------------
+class EmbeddingBackend:
+    name = "base"
+
+    # lazily created models/clients; dropped when pickled to worker processes
+    _lazy_attrs = ()
+
+    def __init__(self, batch_size: int = 32):
+        self.batch_size = batch_size
+        self.texts_encoded = 0
+        self.seconds = 0.0
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Encodes texts into an (n, dim) float32 matrix."""
+        start = time.perf_counter()
+        vectors = self._encode([t[:MAX_CHARS] for t in texts])
+        self.seconds += time.perf_counter() - start
+        self.texts_encoded += len(texts)
+        return np.asarray(vectors, dtype=np.float32)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        raise NotImplementedError
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for attr in self._lazy_attrs:
+            state[attr] = None
+        return state
+
+    def throughput(self) -> Dict:
+        return {
+            "backend": self.name,
+            "texts": self.texts_encoded,
+            "seconds": round(self.seconds, 3),
+            "texts_per_sec": round(self.texts_encoded / self.seconds, 1) if self.seconds else 0.0,
+        }
+
+    def report(self):
+        t = self.throughput()
+        print(f"[✓] Embeddings ({t['backend']}): {t['texts']} texts in {t['seconds']}s "
+              f"→ {t['texts_per_sec']} texts/s")
+
+
+# -------------------------------------------------------------------
+# Local sentence-transformers (torch or ONNX Runtime)
+# -------------------------------------------------------------------
+class SentenceTransformerBackend(EmbeddingBackend):
+    _lazy_attrs = ("_model",)
+
+    def __init__(
+        self,
+        name: str,
+        model_name: str,
+        runtime: str = "torch",
+        file_name: Optional[str] = None,
+        batch_size: int = 32,
+    ):
+        super().__init__(batch_size)
+        self.name = name
+        self.model_name = model_name
+        self.runtime = runtime
+        self.file_name = file_name
+        self._model = None
+
+    def _load(self):
+        from sentence_transformers import SentenceTransformer
+
+        kwargs = {"device": "cpu"}
+        if self.runtime != "torch":
+            kwargs["backend"] = self.runtime
+        if self.file_name:
+            kwargs["model_kwargs"] = {"file_name": self.file_name}
+
+        return SentenceTransformer(self.model_name, **kwargs)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        if self._model is None:
+            self._model = self._load()
+
+        return self._model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+
+
+# -------------------------------------------------------------------
+# Remote (OpenAI / compatible)
+# -------------------------------------------------------------------
+class OpenAIEmbeddingBackend(EmbeddingBackend):
+    """Reuses a single client and sends `input` as a list per request."""
+
+    _lazy_attrs = ("_client",)
+
+    def __init__(self, name: str, model_name: str, batch_size: int = 256):
+        super().__init__(batch_size)
+        self.name = name
+        self.model_name = model_name
+        self._client = None
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        if self._client is None:
+            self._client = get_client()
+
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            resp = self._client.embeddings.create(
+                model=self.model_name,
+                input=texts[start:start + self.batch_size],
+            )
+            vectors.extend(d.embedding for d in sorted(resp.data, key=lambda d: d.index))
+        return np.asarray(vectors, dtype=np.float32)
+
+
+# -------------------------------------------------------------------
+# Registry
+# -------------------------------------------------------------------
+_FACTORIES: Dict[str, Callable[[], EmbeddingBackend]] = {}
+_INSTANCES: Dict[str, EmbeddingBackend] = {}
+
+
+def register_backend(name: str, factory: Callable[[], EmbeddingBackend]):
+    _FACTORIES[name] = factory
+    _INSTANCES.pop(name, None)
+
+
+def available_backends() -> List[str]:
+    return sorted(_FACTORIES)
+
+
+def get_backend(name: Optional[str] = None) -> EmbeddingBackend:
+    """
+    Returns the (process-wide) backend instance for `name`,
+    defaulting to EMBEDDING_BACKEND from the environment.
+    """
+    load_env()
+    name = name or os.getenv("EMBEDDING_BACKEND", DEFAULT_BACKEND)
+
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown embedding backend '{name}'. Available: {available_backends()}")
+
+    if name not in _INSTANCES:
+        _INSTANCES[name] = _FACTORIES[name]()
+    return _INSTANCES[name]
+
+
+def set_backend_instance(name: str, backend: EmbeddingBackend):
+    """Replaces the process-wide instance for `name` (e.g. with a worker pool)."""
+    _INSTANCES[name] = backend
+
+
+def active_backends() -> List[EmbeddingBackend]:
+    """Backends instantiated so far in this process (for throughput reports)."""
+    return list(_INSTANCES.values())
+
+
+for _name, _model in [
+    ("mpnet", "all-mpnet-base-v2"),
+    ("minilm", "all-MiniLM-L6-v2"),
+]:
+    register_backend(_name, lambda n=_name, m=_model: SentenceTransformerBackend(n, m))
+    register_backend(
+        f"{_name}-onnx",
+        lambda n=_name, m=_model: SentenceTransformerBackend(f"{n}-onnx", m, runtime="onnx"),
+    )
+    register_backend(
+        f"{_name}-onnx-int8",
+        lambda n=_name, m=_model: SentenceTransformerBackend(
+            f"{n}-onnx-int8", m, runtime="onnx",
+            file_name=os.getenv("EMBEDDING_ONNX_INT8_FILE", ONNX_INT8_FILE),
+        ),
+    )
+
+register_backend("openai", lambda: OpenAIEmbeddingBackend("openai", "text-embedding-3-large"))
@@ -0,0 +1,147 @@
+# pipeline/transform/embedding_pool.py
+
+"""
+Multi-process embedding service for CPU-only hosts.
+
+A single model instance only uses one process and its intra-op threads
+fight over the cores. The pool starts N worker processes instead, each with
+its own copy of the backend, a pinned thread count and (on Linux) its own
+CPU set, and fans text chunks out to them in order.
+
+The pool is itself an EmbeddingBackend with the wrapped backend's name, so
+installing it in the registry (start_embedding_pool) makes every
+get_embeddings() consumer scale across cores, sharing the same cache keys.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+from typing import List, Optional
+
+from pipeline.lazy import lazy_import
+
+from pipeline.transform.embedding_backends import (
+    EmbeddingBackend,
+    get_backend,
+    set_backend_instance,
+)
+
+np = lazy_import("numpy")
+
+# Worker-process globals
+_worker_backend: Optional[EmbeddingBackend] = None
+
+
+def _pin_threads(threads: int):
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(threads)
+
+    try:
+        import torch
+        torch.set_num_threads(threads)
+        torch.set_num_interop_threads(1)
+    except Exception:
+        pass
+
+
+def _pin_cpus(threads: int):
+    """Give worker k the k-th block of `threads` CPUs (Linux only)."""
+    if not hasattr(os, "sched_setaffinity"):
+        return
+
+    identity = mp.current_process()._identity
+    if not identity:
+        return
+
+    cpus = sorted(os.sched_getaffinity(0))
+    k = identity[0] - 1
+    block = cpus[(k * threads) % len(cpus):][:threads]
+    if block:
+        os.sched_setaffinity(0, block)
+
+
+def _init_worker(backend: EmbeddingBackend, threads: int, pin_cpus: bool):
+    global _worker_backend
+
+    _pin_threads(threads)
+    if pin_cpus:
+        _pin_cpus(threads)
+
+    # Arrives unloaded (see EmbeddingBackend.__getstate__); loads on first chunk
+    _worker_backend = backend
+
+
+def _encode_chunk(texts: List[str]) -> np.ndarray:
+    return _worker_backend.encode(texts)
+
+
+class EmbeddingPool(EmbeddingBackend):
+    """Process pool of backend copies that encodes chunks in parallel."""
+
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        workers: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+        chunk_size: int = 64,
+        pin_cpus: bool = True,
+    ):
+        super().__init__(batch_size=chunk_size)
+        self.backend = get_backend(backend)
+        self.name = self.backend.name
+        cpus = os.cpu_count() or 1
+        self.workers = workers or cpus
+        self.threads_per_worker = threads_per_worker or max(1, cpus // self.workers)
+        self.pin_cpus = pin_cpus
+        self._pool = None
+
+    def __getstate__(self):
+        raise TypeError("EmbeddingPool cannot be sent to another process")
+
+    def start(self) -> "EmbeddingPool":
+        if self._pool is None:
+            # spawn: workers must not inherit a half-initialized torch runtime
+            ctx = mp.get_context("spawn")
+            self._pool = ctx.Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.backend, self.threads_per_worker, self.pin_cpus),
+            )
+        return self
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        self.start()
+
+        # Small enough chunks that every worker gets a share
+        size = max(1, min(self.batch_size, -(-len(texts) // self.workers)))
+        chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+        parts = self._pool.map(_encode_chunk, chunks)
+
+        return np.concatenate(parts) if parts else np.zeros((0, 0), dtype=np.float32)
+
+
+def start_embedding_pool(
+    workers: Optional[int] = None,
+    backend: Optional[str] = None,
+    threads_per_worker: Optional[int] = None,
+) -> EmbeddingPool:
+    """
+    Starts a pool for `backend` (default: EMBEDDING_BACKEND) and installs it
+    in the registry, so get_backend(backend) now returns the pool.
+    """
+    pool = EmbeddingPool(backend, workers, threads_per_worker).start()
+    set_backend_instance(pool.name, pool)
+    return pool
@@ -0,0 +1,225 @@
+# pipeline/transform/embedding_store.py
+
+"""
+Compact embedding storage.
+
+Vectors are L2-normalized on insert and kept as float32, float16, or int8
+with one float32 scale per vector. Cosine similarity then reduces to a dot
+product computed directly on the stored form, so the same store serves as
+the text → embedding cache and as a searchable vector index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pipeline.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+STORAGE_DTYPES = ("float32", "float16", "int8")
+
+# Rows scored per block when dequantizing for a query
+_BLOCK_ROWS = 16384
+
+
+# -------------------------------------------------------------------
+# Quantization
+# -------------------------------------------------------------------
+def normalize(vectors) -> np.ndarray:
+    mat = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    return np.divide(mat, norms, out=np.zeros_like(mat), where=norms > 0)
+
+
+def quantize(vectors, dtype: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Returns (data, scales). `scales` is None except for int8, where each
+    row is stored as round(x / scale) with scale = max|x| / 127.
+    """
+    if dtype not in STORAGE_DTYPES:
+        raise ValueError(f"Unknown embedding dtype: {dtype}")
+
+    mat = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+
+    if dtype == "float32":
+        return mat, None
+    if dtype == "float16":
+        return mat.astype(np.float16), None
+
+    scales = np.abs(mat).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    data = np.rint(mat / scales[:, None]).astype(np.int8)
+    return data, scales.astype(np.float32)
+
+
+def dequantize(data: np.ndarray, scales: Optional[np.ndarray]) -> np.ndarray:
+    out = data.astype(np.float32)
+    if scales is not None:
+        out *= scales[:, None]
+    return out
+
+
+def dot_scores(query, data: np.ndarray, scales: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Dot product of one float query against every stored row, computed
+    block by block so int8/float16 stores are never fully expanded.
+    """
+    q = np.asarray(query, dtype=np.float32).ravel()
+    out = np.empty(len(data), dtype=np.float32)
+
+    for start in range(0, len(data), _BLOCK_ROWS):
+        block = data[start:start + _BLOCK_ROWS]
+        out[start:start + len(block)] = block.astype(np.float32) @ q
+
+    if scales is not None:
+        out *= scales
+    return out
+
+
+# -------------------------------------------------------------------
+# Store (cache + index)
+# -------------------------------------------------------------------
+class EmbeddingStore:
+    """
+    Keyed, append-only embedding store in a fixed storage dtype.
+
+    Used as a cache (keys are text hashes, see text_key) or as a vector
+    index (keys are ids such as movie_id).
+    """
+
+    def __init__(self, dtype: str = "float16", dim: Optional[int] = None):
+        if dtype not in STORAGE_DTYPES:
+            raise ValueError(f"Unknown embedding dtype: {dtype}")
+
+        self.dtype = dtype
+        self.dim = dim
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._chunks: List[Tuple[np.ndarray, Optional[np.ndarray]]] = []
+        self._data: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return str(key) in self._rows
+
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    @property
+    def nbytes(self) -> int:
+        data, scales = self._compact()
+        return data.nbytes + (scales.nbytes if scales is not None else 0)
+
+    # ---------------- write ----------------
+    def add(self, keys: Sequence, vectors):
+        """Adds (or ignores already present) keys with their vectors."""
+        mat = normalize(vectors)
+        if self.dim is None:
+            self.dim = mat.shape[1]
+        elif mat.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-d vectors, got {mat.shape[1]}")
+
+        fresh = []
+        for i, key in enumerate(map(str, keys)):
+            if key in self._rows:
+                continue
+            self._rows[key] = len(self._keys)
+            self._keys.append(key)
+            fresh.append(i)
+
+        if fresh:
+            self._chunks.append(quantize(mat[fresh], self.dtype))
+
+    def _compact(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        if self._chunks:
+            parts = ([(self._data, self._scales)] if self._data is not None else []) + self._chunks
+            self._data = np.concatenate([d for d, _ in parts])
+            if self.dtype == "int8":
+                self._scales = np.concatenate([s for _, s in parts])
+            self._chunks = []
+
+        if self._data is None:
+            shape = (0, self.dim or 0)
+            self._data = np.zeros(shape, dtype=np.int8 if self.dtype == "int8" else self.dtype)
+            if self.dtype == "int8":
+                self._scales = np.zeros(0, dtype=np.float32)
+
+        return self._data, self._scales
+
+    # ---------------- read ----------------
+    def get(self, key) -> Optional[np.ndarray]:
+        """Returns the (normalized) float32 vector for a key, or None."""
+        row = self._rows.get(str(key))
+        if row is None:
+            return None
+
+        # Look into pending chunks first, so add/get interleaving stays cheap
+        data, scales = self._data, self._scales
+        offset = len(data) if data is not None else 0
+        if row >= offset:
+            for data, scales in self._chunks:
+                if row < offset + len(data):
+                    break
+                offset += len(data)
+            row -= offset
+
+        return dequantize(data[row:row + 1], None if scales is None else scales[row:row + 1])[0]
+
+    def search(self, query, k: int = 10) -> List[Tuple[str, float]]:
+        """Top-k keys by cosine similarity to `query`."""
+        if not len(self):
+            return []
+
+        data, scales = self._compact()
+        scores = dot_scores(normalize(query)[0], data, scales)
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._keys[i], float(scores[i])) for i in top]
+
+    # ---------------- persistence ----------------
+    def save(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data, scales = self._compact()
+
+        arrays = {"keys": np.asarray(self._keys, dtype=str), "data": data}
+        if scales is not None:
+            arrays["scales"] = scales
+
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, dtype=np.asarray(self.dtype), **arrays)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "EmbeddingStore":
+        with np.load(path) as z:
+            store = cls(dtype=str(z["dtype"]), dim=z["data"].shape[1] or None)
+            store._keys = [str(k) for k in z["keys"]]
+            store._rows = {k: i for i, k in enumerate(store._keys)}
+            store._data = z["data"]
+            store._scales = z["scales"] if "scales" in z else None
+        return store
+
+    @classmethod
+    def open(cls, path: Path, dtype: str) -> "EmbeddingStore":
+        """Loads `path` if it exists with the same dtype, else starts empty."""
+        path = Path(path)
+        if path.exists():
+            store = cls.load(path)
+            if store.dtype == dtype:
+                return store
+        return cls(dtype=dtype)
+
+
+def text_key(model: str, text: str) -> str:
+    """Cache key for a text embedded by a given model."""
+    return hashlib.sha1(f"{model}\x00{text}".encode("utf-8")).hexdigest()
@@ -1,32 +1,63 @@
 # pipeline/transform/emotional_capsule_generator.py
 
-def generate_emotional_capsules(client, title, premise, axes):
-    axes_text = ", ".join(axes)
+from pipeline.transform.emotional_capsule_validator import capsules_hard_violation
+from pipeline.transform.prompt_registry import register
+from pipeline.transform.streaming import generate
+from pipeline.transform.structured_output import capsules_schema, json_format
 
-    prompt = f"""
-Write exactly 5 emotional capsules for the movie below.
+EMOTIONAL_CAPSULES_PROMPT = register(
+    "emotional_capsules",
+    prefix="""
+Write exactly 5 emotional capsules for the movie described at the end.
 
-STRICT FORMAT RULE (DO NOT BREAK):
-Each line must follow this format exactly:
-AXIS :: emotion :: short sentence
+Return JSON: {"capsules": [{"axis": ..., "emotion": ..., "text": ...}]}
 
 Rules:
-- AXIS must be one of: {axes_text}
-- One capsule per line
+- axis must be one of the movie's allowed axes
+- emotion is one word
+- text is one short sentence
 - No character names
 - No second-person language (no "you")
 - No plot or scene description
 - Use simple, everyday words
 - Each sentence under 18 words
 - Do not add explanations or headers
+""",
+    template="""
+Allowed axes: {axes}
 
 Movie premise:
 {premise}
-"""
+""",
+)
 
-    response = client.responses.create(
-        model="gpt-4o-mini",
-        input=prompt
-    )
+
+def emotional_capsules_request(premise, axes):
+    return {
+        "model": "gpt-4o-mini",
+        "instructions": EMOTIONAL_CAPSULES_PROMPT.prefix,
+        "input": EMOTIONAL_CAPSULES_PROMPT.render(axes=", ".join(axes), premise=premise),
+        "text": json_format("emotional_capsules", capsules_schema(axes)),
+    }
+
+
+def generate_emotional_capsules(client, title, premise, axes):
+    """
+    Returns the raw model output: {"capsules": [{axis, emotion, text}]}
+    JSON (schema-constrained); see parse_capsules in build_emotional_capsules.
+    """
+    response = client.responses.create(**emotional_capsules_request(premise, axes))
 
     return response.output_text.strip()
+
+
+def stream_emotional_capsules(client, title, premise, axes):
+    """
+    Streaming generate_emotional_capsules: returns Aborted once too many
+    finished capsules are invalid for the set to pass.
+    """
+    return generate(
+        client,
+        lambda partial: capsules_hard_violation(partial, axes),
+        **emotional_capsules_request(premise, axes),
+    )
@@ -2,25 +2,68 @@
 
 import re
 
+from pipeline.transform.structured_output import StructuredOutputError, items, parse_json
+
+# Light AI-language guard
+AI_LANGUAGE = re.compile(r"\b(masterfully|intricately|explores|delves)\b")
+
+MIN_CAPSULES = 4
+
+# Capsules the generator is asked for
+EXPECTED_CAPSULES = 5
+
+
+def capsule_problem(c, axes):
+    """Reason a single capsule is invalid, or None."""
+    if "axis" not in c or "emotion" not in c or "text" not in c:
+        return "invalid_structure"
+
+    if c["axis"] not in axes:
+        return "invalid_axis"
+
+    if len(c["text"].split()) > 20:
+        return "text_too_long"
+
+    if AI_LANGUAGE.search(c["text"].lower()):
+        return "ai_language"
+
+    return None
+
+
 def validate_emotional_capsules(capsules, axes):
     if not capsules:
         return False, "no_capsules"
 
-    if len(capsules) < 4:
+    if len(capsules) < MIN_CAPSULES:
         return False, "too_few_capsules"
 
     for c in capsules:
-        if "axis" not in c or "emotion" not in c or "text" not in c:
-            return False, "invalid_structure"
+        problem = capsule_problem(c, axes)
+        if problem:
+            return False, problem
+
+    return True, "pass"
 
-        if c["axis"] not in axes:
-            return False, "invalid_axis"
 
-        if len(c["text"].split()) > 20:
-            return False, "text_too_long"
+def drop_invalid_capsules(capsules, axes):
+    """Keeps only the valid capsules (enough may be left to pass)."""
+    return [c for c in capsules if capsule_problem(c, axes) is None]
 
-        # Light AI-language guard
-        if re.search(r"\b(masterfully|intricately|explores|delves)\b", c["text"].lower()):
-            return False, "ai_language"
 
-    return True, "pass"
+def capsules_hard_violation(partial, axes):
+    """
+    Partial-output check for streaming: once so many finished capsules
+    are invalid that dropping them cannot leave MIN_CAPSULES, the
+    generation is doomed. Returns the first such capsule's reason.
+    """
+    try:
+        data = parse_json(partial)
+    except StructuredOutputError:
+        return None
+
+    finished = [c for c in items(data, "capsules") if isinstance(c, dict)][:-1]
+    problems = [p for p in (capsule_problem(c, axes) for c in finished) if p]
+
+    if EXPECTED_CAPSULES - len(problems) < MIN_CAPSULES:
+        return problems[0]
+    return None
@@ -3,24 +3,38 @@ nlp_utils.py
 
 Provides:
 - Embedding generation (via LLM API or a local fallback)
+- Optional quantized embedding cache (float32 / float16 / int8)
 - Cosine similarity
 - Relevance scoring between review text and movie context
-- Lightweight sentiment analysis fallback
+- Sentiment (batch lexicon scorer, TextBlob, or a rule-based fallback)
+- Review text cleaning (re-exported from pipeline.transform.text_cleaning)
+
+numpy and TextBlob are imported on first use, so importing this module
+stays cheap for stages that only need clean_text.
 """
 
+from __future__ import annotations
+
 import os
 import math
-import numpy as np
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Dict, Optional
-from dotenv import load_dotenv
-import unicodedata
-import re
 
-load_dotenv()
-_re_html = re.compile(r"<[^>]+>")
-_re_whitespace = re.compile(r"\s+")
-# NEW: Regex to match ALL C0 and C1 control characters (non-printing/ambiguous)
-_re_control_chars = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+from pipeline.lazy import lazy_import
+from pipeline.llm_client import load_env
+from pipeline.transform.embedding_backends import (
+    EmbeddingBackend,
+    active_backends,
+    get_backend,
+)
+from pipeline.transform.embedding_store import EmbeddingStore, text_key
+from pipeline.transform.sentiment import lexicon_sentiment, load_lexicon
+from pipeline.transform.text_cleaning import clean_text, clean_texts  # noqa: F401 (re-exported)
+
+np = lazy_import("numpy")
+
+ROOT = Path(__file__).resolve().parents[2]
 
 # -------------------------------------------------------------------
 # Embedding Provider (LLM API)
@@ -28,94 +42,137 @@ _re_control_chars = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
 
 USE_REMOTE_EMBEDDING = False
 
-def clean_text(text: str) -> str:
-    if not text:
-        return ""
-    
-    # 1. Unicode Normalization: Converts complex characters into canonical forms.
-    # This addresses many ambiguous character issues immediately.
-    t = unicodedata.normalize('NFKD', text)
-
-    # 2. Control Character Stripping: Removes non-printing/ambiguous characters.
-    t = _re_control_chars.sub("", t)
-
-    # 3. HTML/Tag Stripping
-    t = _re_html.sub(" ", t)
-
-    # 4. Collapse all remaining whitespace (including newlines and multiple spaces)
-    t = _re_whitespace.sub(" ", t)
-    
-    return t.strip()
+REMOTE_EMBEDDING_BACKEND = "openai"
 
 
-def get_embedding_remote(text: str) -> Optional[List[float]]:
+def get_embedding_remote(text: str) -> Optional[np.ndarray]:
     """
     Calls the remote embedding model (OpenAI / compatible).
     Returns None if the request fails.
     """
     try:
-        from openai import OpenAI
-        client = OpenAI()
+        return get_backend(REMOTE_EMBEDDING_BACKEND).encode([text])[0]
 
-        text = text[:3500]  # safety truncation for remote models
-
-        resp = client.embeddings.create(
-            model="text-embedding-3-large",
-            input=text
-        )
-        return resp.data[0].embedding
-    
     except Exception as e:
         print(f"[Embedding Error] Remote call failed: {e}")
         return None
 
 
 # -------------------------------------------------------------------
-# Local embedding fallback (sentence transformers)
+# Local embedding fallback (backend from EMBEDDING_BACKEND)
 # -------------------------------------------------------------------
 
-_local_model = None
-
-def get_embedding_local(text: str) -> Optional[List[float]]:
+def get_embedding_local(text: str) -> Optional[np.ndarray]:
     """
-    Uses a lightweight local model (mpnet) for embeddings.
+    Uses the configured local backend (mpnet by default) for embeddings.
     Only loaded once.
     """
-    global _local_model
-
     try:
-        if _local_model is None:
-            from sentence_transformers import SentenceTransformer
-            _local_model = SentenceTransformer("all-mpnet-base-v2")
-
-        text = text[:3500]
-        emb = _local_model.encode(text)
-        return emb.tolist()
+        return get_backend().encode([text])[0]
 
     except Exception as e:
         print(f"[Embedding Error] Local model failed: {e}")
         return None
 
 
+# -------------------------------------------------------------------
+# Embedding cache (opt-in via EMBEDDING_CACHE_DTYPE)
+# -------------------------------------------------------------------
+
+EMBEDDING_CACHE_DIR = ROOT / "data" / "cache"
+
+_embedding_caches: Dict[str, EmbeddingStore] = {}
+
+
+def embedding_cache_dtype() -> Optional[str]:
+    """EMBEDDING_CACHE_DTYPE: float32 | float16 | int8 (unset disables the cache)."""
+    load_env()
+    return os.getenv("EMBEDDING_CACHE_DTYPE")
+
+
+def _cache_path(backend: str, dtype: str) -> Path:
+    return EMBEDDING_CACHE_DIR / f"embeddings_{backend}_{dtype}.npz"
+
+
+def get_embedding_cache(backend: str) -> Optional[EmbeddingStore]:
+    """Returns the process-wide cache for one backend, or None if disabled."""
+    dtype = embedding_cache_dtype()
+    if not dtype:
+        return None
+
+    if backend not in _embedding_caches:
+        _embedding_caches[backend] = EmbeddingStore.open(_cache_path(backend, dtype), dtype)
+    return _embedding_caches[backend]
+
+
+def save_embedding_cache():
+    for backend, cache in _embedding_caches.items():
+        cache.save(_cache_path(backend, cache.dtype))
+
+
 # -------------------------------------------------------------------
 # Unified Embedding API
 # -------------------------------------------------------------------
 
-def get_embedding(text: str) -> Optional[List[float]]:
+def _encode_cached(backend: EmbeddingBackend, texts: List[str]) -> List[np.ndarray]:
+    """Encodes texts with one backend call for all cache misses."""
+    cache = get_embedding_cache(backend.name)
+    if cache is None:
+        return list(backend.encode(texts))
+
+    keys = [text_key(backend.name, t) for t in texts]
+    out = [cache.get(k) for k in keys]
+
+    missing = [i for i, v in enumerate(out) if v is None]
+    if missing:
+        vectors = backend.encode([texts[i] for i in missing])
+        cache.add([keys[i] for i in missing], vectors)
+        for i, v in zip(missing, vectors):
+            out[i] = v
+
+    return out
+
+
+def get_embeddings(texts: List[str]) -> List[Optional[np.ndarray]]:
     """
-    Returns a vector embedding for a text.
+    Batch version of get_embedding(): one backend call per batch.
+    Empty texts, and texts whose batch failed on every backend, map to None.
+    """
+    out: List[Optional[np.ndarray]] = [None] * len(texts)
+    idx = [i for i, t in enumerate(texts) if t and t.strip()]
+    if not idx:
+        return out
+
+    batch = [texts[i] for i in idx]
+    backends = [REMOTE_EMBEDDING_BACKEND] if USE_REMOTE_EMBEDDING else []
+    backends.append(None)  # fallback to local
+
+    for name in backends:
+        try:
+            vectors = _encode_cached(get_backend(name), batch)
+        except Exception as e:
+            print(f"[Embedding Error] Backend '{name or 'local'}' failed: {e}")
+            continue
+
+        for i, v in zip(idx, vectors):
+            out[i] = v
+        break
+
+    return out
+
+
+def get_embedding(text: str) -> Optional[np.ndarray]:
+    """
+    Returns a float32 vector embedding for a text.
     Automatically chooses remote API or local model.
+    Cached vectors come back L2-normalized.
     """
-    if not text or not text.strip():
-        return None
+    return get_embeddings([text])[0]
 
-    if USE_REMOTE_EMBEDDING:
-        emb = get_embedding_remote(text)
-        if emb is not None:
-            return emb
 
-    # fallback to local
-    return get_embedding_local(text)
+def report_embedding_throughput():
+    for backend in active_backends():
+        backend.report()
 
 
 # -------------------------------------------------------------------
@@ -187,11 +244,14 @@ def is_relevant(
 # Improved Sentiment Fallback
 # -------------------------------------------------------------------
 
-try:
-    from textblob import TextBlob
-    _has_textblob = True
-except ImportError:
-    _has_textblob = False
+@lru_cache(maxsize=None)
+def _textblob():
+    """TextBlob class, or None if textblob isn't installed (imported on first use)."""
+    try:
+        from textblob import TextBlob
+        return TextBlob
+    except ImportError:
+        return None
 
 
 def sentiment_score(text: str) -> Dict[str, float]:
@@ -205,7 +265,8 @@ def sentiment_score(text: str) -> Dict[str, float]:
         return {"polarity": 0.0, "subjectivity": 0.0}
 
     # Try TextBlob first
-    if _has_textblob:
+    TextBlob = _textblob()
+    if TextBlob is not None:
         try:
             tb = TextBlob(text)
             return {"polarity": float(tb.sentiment.polarity),
@@ -242,3 +303,29 @@ def sentiment_score(text: str) -> Dict[str, float]:
     polarity = max(-1.0, min(1.0, score / max(len(words), 1)))
 
     return {"polarity": polarity, "subjectivity": 0.5}
+
+
+# -------------------------------------------------------------------
+# Batch sentiment (SENTIMENT_MODE: lexicon | textblob)
+# -------------------------------------------------------------------
+
+DEFAULT_SENTIMENT_MODE = "lexicon"
+
+
+def sentiment_mode() -> str:
+    load_env()
+    return os.getenv("SENTIMENT_MODE", DEFAULT_SENTIMENT_MODE)
+
+
+def sentiment_scores(texts: List[str]) -> List[Dict[str, float]]:
+    """
+    Sentiment for a batch of texts, in order.
+
+    "lexicon" scores the whole batch in one vectorized pass with TextBlob's
+    lexicon and rules (see pipeline.transform.sentiment); "textblob" (or a
+    missing lexicon) falls back to sentiment_score() per text.
+    """
+    if sentiment_mode() == "lexicon" and load_lexicon() is not None:
+        return lexicon_sentiment([t.strip() for t in texts])
+
+    return [sentiment_score(t) for t in texts]
@@ -1,14 +1,12 @@
 # pipeline/transform/premise_generator.py
 
-def generate_premise(client, title: str, overview: str) -> str:
-    """
-    Generates a one-sentence concrete movie premise.
-    The premise must describe WHAT the movie is about, literally.
-    """
+import re
+from typing import Dict, List
 
-    prompt = f"""
-You are generating a ONE-SENTENCE movie premise.
+from pipeline.transform.prompt_registry import register
+from pipeline.transform.structured_output import create_structured, keyed_items, packed_schema
 
+PREMISE_RULES = """
 Rules:
 - Describe the movie literally.
 - No metaphors.
@@ -17,18 +15,79 @@ Rules:
 - No abstract language.
 - Must be understandable by someone who has never seen the movie.
 - 10–15 words max.
+"""
 
+PREMISE_PROMPT = register(
+    "premise",
+    prefix=f"""
+You are generating a ONE-SENTENCE movie premise.
+{PREMISE_RULES}
+Write ONLY the premise sentence.
+""",
+    template="""
 Movie title: {title}
 
 Overview:
 {overview}
+""",
+)
+
+PACKED_PREMISE_PROMPT = register(
+    "premise_packed",
+    prefix=f"""
+You are generating a ONE-SENTENCE movie premise for EACH movie listed.
+{PREMISE_RULES}
+Return one item per movie, with its movie_id.
+""",
+    template="""
+{listing}
+""",
+)
+
+_LABEL = re.compile(r"^\s*(?:\*\*)?premise(?:\*\*)?\s*:\s*", re.IGNORECASE)
+
+
+def clean_premise(text: str) -> str:
+    """Strips a 'Premise:' label, wrapping quotes and extra whitespace."""
+    text = _LABEL.sub("", text or "")
+    text = text.strip().strip('"').strip("'").strip()
+    return re.sub(r"\s+", " ", text)
 
-Write ONLY the premise sentence.
-"""
+
+def generate_premise(client, title: str, overview: str) -> str:
+    """
+    Generates a one-sentence concrete movie premise.
+    The premise must describe WHAT the movie is about, literally.
+    """
 
     response = client.responses.create(
         model="gpt-4o-mini",
-        input=prompt
+        instructions=PREMISE_PROMPT.prefix,
+        input=PREMISE_PROMPT.render(title=title, overview=overview),
     )
 
     return response.output_text.strip()
+
+
+def generate_premises_packed(client, movies: List[Dict]) -> Dict[int, str]:
+    """
+    One request for several movies ({movie_id, title, overview}).
+    Returns {movie_id: premise} for the movies the response covered.
+    """
+    listing = "\n\n".join(
+        f"movie_id: {m['movie_id']}\nMovie title: {m['title']}\nOverview:\n{m.get('overview', '')}"
+        for m in movies
+    )
+
+    data, _ = create_structured(
+        client,
+        PACKED_PREMISE_PROMPT.render(listing=listing),
+        "movie_premises",
+        packed_schema({"premise": {"type": "string"}}),
+        instructions=PACKED_PREMISE_PROMPT.prefix,
+    )
+
+    return {
+        mid: str(item.get("premise") or "").strip()
+        for mid, item in keyed_items(data).items()
+    }
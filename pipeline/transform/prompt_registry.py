@@ -0,0 +1,121 @@
+# pipeline/transform/prompt_registry.py
+
+"""
+Prompt registry: every LLM prompt as a static prefix + per-movie suffix.
+
+Providers cache long identical prompt prefixes (OpenAI: from 1024 tokens,
+in 128-token steps), which cuts latency and input cost for every request
+after the first. That only works when nothing movie-specific appears
+before the shared part, so each prompt is registered as:
+
+- prefix:   instructions, rules and output format — identical for every
+            movie; sent first (system message / `instructions`)
+- template: the per-movie suffix (title, overview, reviews …), rendered
+            with str.format
+
+report() lists the cacheable prefix length per stage; check_stable()
+compares prefix fingerprints with the committed prompt_prefixes.json so a
+prefix edit (which resets the provider cache) is a deliberate change:
+
+    python -m pipeline prompts [--update]
+"""
+
+import hashlib
+import importlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+LOCK_FILE = Path(__file__).with_name("prompt_prefixes.json")
+
+# Shortest prefix the provider caches
+CACHE_MIN_TOKENS = 1024
+
+# Modules that register prompts on import
+PROMPT_MODULES = [
+    "pipeline.transform.axis_extractor",
+    "pipeline.transform.axis_generator",
+    "pipeline.transform.critic_extractor",
+    "pipeline.transform.critic_generator",
+    "pipeline.transform.emotional_capsule_generator",
+    "pipeline.transform.premise_generator",
+    "pipeline.transform.character_anchor_extractor",
+]
+
+
+def count_tokens(text: str) -> int:
+    """Token count with tiktoken if installed, else ~4 characters per token."""
+    try:
+        import tiktoken
+    except ImportError:
+        return (len(text) + 3) // 4
+    return len(tiktoken.get_encoding("o200k_base").encode(text))
+
+
+@dataclass(frozen=True)
+class Prompt:
+    stage: str
+    prefix: str
+    template: str
+
+    def render(self, **fields) -> str:
+        """The per-movie suffix."""
+        return self.template.format(**fields)
+
+    def messages(self, **fields) -> List[Dict[str, str]]:
+        """Chat Completions messages: static system prefix, per-movie user turn."""
+        return [
+            {"role": "system", "content": self.prefix},
+            {"role": "user", "content": self.render(**fields)},
+        ]
+
+    @property
+    def fingerprint(self) -> str:
+        return hashlib.sha256(self.prefix.encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def prefix_tokens(self) -> int:
+        return count_tokens(self.prefix)
+
+
+PROMPTS: Dict[str, Prompt] = {}
+
+
+def register(stage: str, prefix: str, template: str) -> Prompt:
+    prompt = Prompt(stage, prefix.strip() + "\n", template.strip() + "\n")
+    PROMPTS[stage] = prompt
+    return prompt
+
+
+def load_all() -> Dict[str, Prompt]:
+    for module in PROMPT_MODULES:
+        importlib.import_module(module)
+    return PROMPTS
+
+
+# ---------------------------------------------------------
+# Report / stability check
+# ---------------------------------------------------------
+def report():
+    prompts = load_all()
+    width = max(map(len, prompts))
+
+    print(f"  {'stage':<{width}}  {'prefix tokens':>13}  {'cached':>6}  fingerprint")
+    for p in sorted(prompts.values(), key=lambda p: p.stage):
+        cached = "yes" if p.prefix_tokens >= CACHE_MIN_TOKENS else "no"
+        print(f"  {p.stage:<{width}}  {p.prefix_tokens:>13}  {cached:>6}  {p.fingerprint}")
+
+
+def check_stable(lock_file: Path = LOCK_FILE) -> List[str]:
+    """Stages whose prefix changed (or is new) since the lock file was written."""
+    locked = json.loads(lock_file.read_text(encoding="utf-8")) if lock_file.exists() else {}
+    return [
+        stage for stage, p in sorted(load_all().items())
+        if locked.get(stage) != p.fingerprint
+    ]
+
+
+def write_lock(lock_file: Path = LOCK_FILE):
+    fingerprints = {stage: p.fingerprint for stage, p in sorted(load_all().items())}
+    lock_file.write_text(json.dumps(fingerprints, indent=2) + "\n", encoding="utf-8")
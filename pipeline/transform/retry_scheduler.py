@@ -0,0 +1,189 @@
+# pipeline/transform/retry_scheduler.py
+
+"""
+Validator-driven retry scheduling for the LLM generation jobs.
+
+The first pass over the catalog never waits on retries: an output that
+fails its validator first goes through cheap local repairs (cleanup
+functions, no LLM call); if it still fails, the item is queued and
+regenerated in a later round, after every item had its first attempt.
+
+Failures are counted per validator rule (the reason up to the first ":",
+e.g. "banned_word:delves" → "banned_word"). The scheduler adapts: once a
+rule has seen MIN_SAMPLES regenerations that fixed it less than
+MIN_FIX_RATE of the time, items failing that rule are not regenerated
+again — they keep their last output, flagged.
+
+A streaming generator may return Aborted instead of an output when a hard
+violation showed up mid-stream: the item skips validation and repairs and
+goes straight to the retry queue. An item that already has an output from
+an earlier attempt keeps it, with that attempt's reason; the partial text
+is only kept when there is nothing else.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Adaptive cut-off for rules that regeneration rarely fixes
+MIN_SAMPLES = 8
+MIN_FIX_RATE = 0.1
+
+Repair = Tuple[str, Callable[[Any, Any], Any]]
+
+
+def rule_of(reason: str) -> str:
+    return reason.split(":", 1)[0]
+
+
+@dataclass
+class Aborted:
+    """A generation cancelled mid-stream; `partial` is what arrived."""
+    reason: str
+    partial: Any = None
+
+
+@dataclass
+class Outcome:
+    output: Any = None
+    valid: bool = False
+    reason: str = "missing_output"
+    attempts: int = 0
+    repaired: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        return "pass" if self.valid else "flagged"
+
+    def validation(self) -> Dict[str, str]:
+        """The {status, reason} record the gold jobs write."""
+        reason = f"repaired:{self.repaired}" if self.valid and self.repaired else self.reason
+        return {"status": self.status, "reason": reason}
+
+
+@dataclass
+class RetryScheduler:
+    """
+    generate(item) → output, validate(item, output) → (valid, reason),
+    repairs: [(name, fn(item, output) → output)] tried in order before
+    any regeneration. max_attempts counts generations per item.
+    """
+    generate: Callable[[Any], Any]
+    validate: Callable[[Any, Any], Tuple[bool, str]]
+    repairs: Sequence[Repair] = ()
+    max_attempts: int = 2
+    key: Callable[[Any], Hashable] = lambda item: item["movie_id"]
+
+    outcomes: Dict[Hashable, Outcome] = field(default_factory=dict)
+    queue: List[Any] = field(default_factory=list)
+    failures: Counter = field(default_factory=Counter)
+    repaired: Counter = field(default_factory=Counter)
+    given_up: Counter = field(default_factory=Counter)
+    aborted: Counter = field(default_factory=Counter)
+    generations: int = 0
+    # rule → [regenerations, fixes]
+    rule_stats: Dict[str, List[int]] = field(default_factory=dict)
+
+    # ------------------------------------------------------------
+    # First pass
+    # ------------------------------------------------------------
+    def submit(self, item, output=None, generated: bool = True) -> Outcome:
+        """
+        Records an attempt for `item` (output=None: nothing came back, e.g.
+        an item missing from a packed response). Never blocks on retries.
+        """
+        outcome = self.outcomes.setdefault(self.key(item), Outcome())
+        if generated:
+            outcome.attempts += 1
+
+        if isinstance(output, Aborted):
+            # An earlier attempt's output (and its verdict) beats a partial;
+            # output and reason must always describe the same text
+            if outcome.output is None:
+                outcome.output = output.partial
+                outcome.valid, outcome.reason = False, output.reason
+            self.failures[rule_of(output.reason)] += 1
+            self.aborted[rule_of(output.reason)] += 1
+        elif output is not None:
+            outcome.output = output
+            outcome.valid, outcome.reason = self.validate(item, output)
+            if not outcome.valid:
+                self.failures[rule_of(outcome.reason)] += 1
+                self._repair(item, outcome)
+        else:
+            outcome.valid, outcome.reason = False, "missing_output"
+            self.failures["missing_output"] += 1
+
+        if not outcome.valid:
+            self.queue.append(item)
+        return outcome
+
+    def first_pass(self, items: Sequence):
+        for item in items:
+            self.generations += 1
+            self.submit(item, self.generate(item))
+
+    def _repair(self, item, outcome: Outcome):
+        for name, fix in self.repairs:
+            candidate = fix(item, outcome.output)
+            if candidate is None or candidate == outcome.output:
+                continue
+
+            valid, reason = self.validate(item, candidate)
+            if valid:
+                outcome.output, outcome.valid, outcome.reason = candidate, True, reason
+                outcome.repaired = name
+                self.repaired[name] += 1
+                return
+
+    # ------------------------------------------------------------
+    # Retry rounds
+    # ------------------------------------------------------------
+    def _worth_retrying(self, rule: str) -> bool:
+        tries, fixes = self.rule_stats.get(rule, (0, 0))
+        return tries < MIN_SAMPLES or fixes / tries >= MIN_FIX_RATE
+
+    def drain(self):
+        """Regenerates queued items round by round until they pass or run out of attempts."""
+        while self.queue:
+            queued, self.queue = self.queue, []
+
+            for item in queued:
+                outcome = self.outcomes[self.key(item)]
+                if outcome.attempts >= self.max_attempts:
+                    continue
+
+                rule = rule_of(outcome.reason)
+                if not self._worth_retrying(rule):
+                    self.given_up[rule] += 1
+                    continue
+
+                self.generations += 1
+                self.submit(item, self.generate(item))
+
+                stats = self.rule_stats.setdefault(rule, [0, 0])
+                stats[0] += 1
+                stats[1] += outcome.valid
+
+    def run(self, items: Sequence) -> Dict[Hashable, Outcome]:
+        self.first_pass(items)
+        self.drain()
+        return self.outcomes
+
+    # ------------------------------------------------------------
+    # Report
+    # ------------------------------------------------------------
+    def report(self, label: str):
+        flagged = sum(not o.valid for o in self.outcomes.values())
+        print(f"[+] {label}: {len(self.outcomes)} items, {self.generations} generations, {flagged} flagged")
+
+        if self.failures:
+            print("    failures by rule: " + ", ".join(f"{k}={v}" for k, v in self.failures.most_common()))
+        if self.aborted:
+            print("    aborted mid-stream: " + ", ".join(f"{k}={v}" for k, v in self.aborted.most_common()))
+        if self.repaired:
+            print("    fixed locally:    " + ", ".join(f"{k}={v}" for k, v in self.repaired.most_common()))
+        for rule, (tries, fixes) in sorted(self.rule_stats.items()):
+            print(f"    regenerated {rule}: {fixes}/{tries} fixed")
+        if self.given_up:
+            print("[!] Stopped regenerating: " + ", ".join(f"{k}={v}" for k, v in self.given_up.most_common()))
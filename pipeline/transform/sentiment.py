@@ -0,0 +1,232 @@
+# pipeline/transform/sentiment.py
+
+"""
+Vectorized lexicon sentiment.
+
+Scores a whole batch of texts in one Polars pass with the lexicon and rules
+of TextBlob's default (pattern) analyzer, without building a TextBlob per
+text:
+
+- known words score (polarity, subjectivity), averaged per part of speech
+- a known adverb modifies the next known word ("very good" = good × 1.3),
+  across words of up to two characters ("really is a good")
+- a negation before the chunk gives polarity × -0.5 ("not good"), across
+  one-character tokens ("not a good"); "-ly" adverbs absorb a following
+  negation ("really not good")
+- every "!" boosts the latest chunk's polarity × 1.25; "(!)" is irony
+- the text score is the mean over chunks, 0.0 when there are none
+
+Emoticons are not scored. Agreement with TextBlob is reported by
+benchmarks/bench_sentiment_calibration.py.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from pipeline.lazy import lazy_import
+
+pl = lazy_import("polars")
+
+NEGATIONS = ["no", "not", "never", "n't"]
+
+# Tokens as pattern's tokenizer splits them: words (with hyphens), "(!)",
+# "...", and single punctuation marks. "don't" becomes "don", "'", "t" —
+# like pattern, contractions don't count as negations.
+_TOKEN = r"[a-z0-9]+(?:[-*][a-z0-9]+)*|\(!\)|\.\.\.|[^\sa-z0-9]"
+
+
+# -------------------------------------------------------------------
+# Lexicon
+# -------------------------------------------------------------------
+def lexicon_path() -> Optional[Path]:
+    """en-sentiment.xml shipped with textblob (found without importing it)."""
+    spec = importlib.util.find_spec("textblob")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+
+    path = Path(list(spec.submodule_search_locations)[0]) / "en" / "en-sentiment.xml"
+    return path if path.exists() else None
+
+
+@lru_cache(maxsize=None)
+def load_lexicon() -> Optional[pl.DataFrame]:
+    """
+    One row per word form: mean polarity / subjectivity / intensity over
+    all senses, and whether the word can act as a modifier (adverb).
+    Returns None if no lexicon is available.
+    """
+    path = lexicon_path()
+    if path is None:
+        return None
+
+    # form -> pos -> [(polarity, subjectivity, intensity), ...]
+    senses = defaultdict(lambda: defaultdict(list))
+    for w in ET.parse(path).getroot().iter("word"):
+        form = w.get("form")
+        if not form:
+            continue
+        senses[form][w.get("pos")].append((
+            float(w.get("polarity", 0.0)),
+            float(w.get("subjectivity", 0.0)),
+            float(w.get("intensity", 1.0)),
+        ))
+
+    def mean(rows):
+        return tuple(sum(v) / len(v) for v in zip(*rows))
+
+    # Like pattern: average the senses per part of speech, then the tags
+    words = {}
+    for form, by_pos in senses.items():
+        by_pos = {pos: mean(v) for pos, v in by_pos.items()}
+        words[form] = (mean(by_pos.values()), "RB" in by_pos, by_pos.get("JJ"))
+
+    # ... and map adjectives to adverbs ("terrible" -> "terribly")
+    for form, (_, _, adjective) in list(words.items()):
+        if adjective is None:
+            continue
+        if form.endswith("y"):
+            form = form[:-1] + "i"
+        if form.endswith("le"):
+            form = form[:-2]
+        words[form + "ly"] = (adjective, True, words.get(form + "ly", (None, None, None))[2])
+
+    rows = [(form, *scores, modifier) for form, (scores, modifier, _) in words.items()]
+    return pl.DataFrame(
+        rows,
+        schema=["word", "polarity", "subjectivity", "intensity", "modifier"],
+        orient="row",
+    )
+
+
+# -------------------------------------------------------------------
+# Scoring
+# -------------------------------------------------------------------
+def _carry(flag: str, value: pl.Expr) -> pl.Expr:
+    """`value` at the last row before this one where `flag` is set."""
+    return pl.when(pl.col(flag)).then(value).forward_fill().shift(1)
+
+
+def score_frame(df: pl.DataFrame, text_col: str = "text") -> pl.DataFrame:
+    """
+    Adds `polarity` and `subjectivity` columns to `df`.
+    Requires a lexicon (see load_lexicon).
+    """
+    lexicon = load_lexicon()
+    if lexicon is None:
+        raise RuntimeError("No sentiment lexicon available (install textblob)")
+
+    tokens = (
+        df.select(pl.col(text_col).fill_null("").str.to_lowercase().str.extract_all(_TOKEN).alias("tok"))
+        .with_row_index("doc")
+        .explode("tok")
+        .drop_nulls("tok")
+        .join(lexicon, left_on="tok", right_on="word", how="left", maintain_order="left")
+        .with_row_index("idx")
+        .with_columns(
+            known=pl.col("polarity").is_not_null(),
+            irony=pl.col("tok") == "(!)",
+            negation=pl.col("tok").is_in(NEGATIONS),
+            intensity=pl.col("intensity").fill_null(1.0),
+            modifier=pl.col("modifier").fill_null(False),
+        )
+        .with_columns(
+            chunk=pl.col("known") | pl.col("irony"),
+            # unknown words longer than 2 chars end a pending modifier,
+            # longer than 1 char a pending negation ("not a good" = negated)
+            m_stop=pl.col("known") | (pl.col("tok").str.len_chars() > 2),
+            n_stop=pl.col("known") | pl.col("negation") | (pl.col("tok").str.strip_chars("'").str.len_chars() > 1),
+        )
+    )
+
+    same_doc = lambda flag: _carry(flag, pl.col("doc")) == pl.col("doc")
+
+    # A negation right after an "-ly" adverb negates the adverb's chunk and
+    # keeps it modifying ("really not good")
+    absorbed = (
+        pl.col("negation")
+        & same_doc("m_stop")
+        & _carry("m_stop", pl.col("known") & pl.col("modifier") & pl.col("tok").str.ends_with("ly"))
+    ).fill_null(False)
+    tokens = tokens.with_columns(
+        absorbed=absorbed,
+        adverb_idx=_carry("m_stop", pl.col("idx")),
+    ).with_columns(
+        negation=pl.col("negation") & ~pl.col("absorbed"),
+        m_stop=pl.col("m_stop") & ~pl.col("absorbed"),
+    )
+    late_negated = tokens.filter("absorbed")["adverb_idx"].implode()
+
+    tokens = tokens.with_columns(
+        # negation pending right before this token
+        negated=(same_doc("n_stop") & _carry("n_stop", pl.col("negation"))).fill_null(False),
+        # known adverb pending right before this token (it merges into this one)
+        modified=(same_doc("m_stop") & _carry("m_stop", pl.col("known") & pl.col("modifier"))).fill_null(False),
+        mod_idx=_carry("m_stop", pl.col("idx")),
+    ).with_columns(
+        mod_intensity=_carry("m_stop", pl.col("intensity")),
+        mod_negated=_carry("m_stop", pl.col("negated")),
+    )
+
+    # "!" boosts the latest known word, counted per known word
+    tokens = tokens.with_columns(last_chunk=pl.when(pl.col("chunk")).then(pl.col("idx")).forward_fill())
+    boosts = (
+        tokens.filter((pl.col("tok") == "!") & same_doc("chunk").fill_null(False))
+        .group_by("last_chunk")
+        .len("boosts")
+    )
+    merged = tokens.filter(pl.col("known") & pl.col("modified")).select(pl.col("mod_idx").alias("idx"))
+
+    intensity = (
+        pl.when(~pl.col("modified")).then(1.0)
+        .when(pl.col("mod_negated")).then(1.0 / pl.col("mod_intensity"))
+        .otherwise(pl.col("mod_intensity"))
+    )
+    chunk_negated = (
+        pl.col("negated")
+        | (pl.col("modified") & (pl.col("mod_negated") | pl.col("mod_idx").is_in(late_negated)))
+        | pl.col("idx").is_in(late_negated)
+    )
+
+    chunks = (
+        tokens.filter(pl.col("chunk"))
+        .join(merged, on="idx", how="anti")
+        .join(boosts, left_on="idx", right_on="last_chunk", how="left")
+        .with_columns(
+            p=(pl.col("polarity") * intensity).clip(-1.0, 1.0),
+            s=(pl.col("subjectivity") * intensity).clip(-1.0, 1.0),
+        )
+        .with_columns(
+            p=(pl.col("p") * 1.25 ** pl.col("boosts").fill_null(0)).clip(-1.0, 1.0),
+        )
+        .with_columns(
+            p=pl.when(pl.col("irony")).then(0.0)
+            .when(chunk_negated).then(pl.col("p") * -0.5)
+            .otherwise(pl.col("p")),
+            s=pl.when(pl.col("irony")).then(1.0).otherwise(pl.col("s")),
+        )
+        .group_by("doc")
+        .agg(polarity=pl.col("p").mean(), subjectivity=pl.col("s").mean())
+    )
+
+    scores = (
+        pl.DataFrame({"doc": pl.arange(0, df.height, eager=True, dtype=pl.UInt32)})
+        .join(chunks, on="doc", how="left")
+        .sort("doc")
+        .select(pl.col("polarity", "subjectivity").fill_null(0.0))
+    )
+    return df.with_columns(scores)
+
+
+def lexicon_sentiment(texts: Sequence[str]) -> List[Dict[str, float]]:
+    """Batch sentiment: [{polarity, subjectivity}] in input order."""
+    if not texts:
+        return []
+
+    scored = score_frame(pl.DataFrame({"text": list(texts)}, schema={"text": pl.Utf8}))
+    return scored.select("polarity", "subjectivity").to_dicts()
@@ -0,0 +1,106 @@
+# pipeline/transform/silver_io.py
+
+"""
+Columnar storage for the review-bearing silver layer.
+
+movies_silver_enriched / movies_silver_validated are written as Parquet with
+typed nested columns (genres and validated reviews as lists of structs), so
+readers can project only the columns a stage needs instead of parsing the
+whole pretty-printed JSON document.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from pipeline.lazy import lazy_import
+
+pl = lazy_import("polars")
+
+
+@lru_cache(maxsize=None)
+def silver_schema() -> Dict[str, pl.DataType]:
+    """Known silver column types (built on first use, so importing stays cheap)."""
+    genre = pl.Struct({"id": pl.Int64, "name": pl.Utf8})
+
+    sentiment = pl.Struct({"polarity": pl.Float64, "subjectivity": pl.Float64})
+
+    relevance = pl.Struct({
+        "score": pl.Float64,
+        "relevant": pl.Boolean,
+        "best_context_idx": pl.Int64,
+    })
+
+    validated_review = pl.Struct({
+        "content": pl.Utf8,
+        "length": pl.Int64,
+        "sentiment": sentiment,
+        "relevance": relevance,
+        "keep": pl.Boolean,
+        "reason": pl.Utf8,
+    })
+
+    return {
+        "movie_id": pl.Int64,
+        "imdb_id": pl.Utf8,
+        "title": pl.Utf8,
+        "overview": pl.Utf8,
+        "poster_path": pl.Utf8,
+        "vote_count": pl.Int64,
+        "vote_average": pl.Float64,
+        "popularity": pl.Float64,
+        "genres": pl.List(genre),
+        "source_categories": pl.List(pl.Utf8),
+        "reviews": pl.List(pl.Utf8),
+        "reviews_missing": pl.Boolean,
+        "validated_reviews": pl.List(validated_review),
+    }
+
+
+# ---------------------------------------------------------
+# Write
+# ---------------------------------------------------------
+def to_silver_frame(movies: List[Dict]) -> pl.DataFrame:
+    """Build a frame with the known silver columns typed explicitly."""
+    # Keys from every row: optional columns may be missing on the first ones
+    keys = {k for m in movies for k in m}
+    schema = silver_schema()
+    overrides = {k: dtype for k, dtype in schema.items() if k in keys}
+
+    return pl.DataFrame(
+        movies,
+        schema_overrides=overrides,
+        infer_schema_length=None,
+    )
+
+
+def write_silver(movies: List[Dict], path: Path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    to_silver_frame(movies).write_parquet(path, compression="zstd")
+
+
+# ---------------------------------------------------------
+# Read
+# ---------------------------------------------------------
+def scan_silver(path: Path, columns: Optional[Sequence[str]] = None) -> pl.LazyFrame:
+    """
+    Lazily scans a silver Parquet file.
+    Columns not present in the file are skipped, so optional fields
+    can be requested without checking the schema first.
+    """
+    if not Path(path).exists():
+        raise FileNotFoundError(f"Silver file not found: {path}")
+
+    lf = pl.scan_parquet(path)
+    if columns is not None:
+        available = set(lf.collect_schema().names())
+        lf = lf.select([c for c in columns if c in available])
+    return lf
+
+
+def read_silver(path: Path, columns: Optional[Sequence[str]] = None) -> List[Dict]:
+    """Reads silver rows as plain dicts (the shape the jobs already use)."""
+    return scan_silver(path, columns).collect().to_dicts()
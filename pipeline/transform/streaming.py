@@ -0,0 +1,90 @@
+# pipeline/transform/streaming.py
+
+"""
+Streaming generation with early validation abort.
+
+Validators normally see a completion only once it is finished, so an
+output that uses a banned word in its first sentence still costs the full
+completion. stream_text() runs a partial-output check as deltas arrive;
+on the first hard violation it closes the stream (no more output tokens
+are generated or billed) and returns Aborted, which the RetryScheduler
+queues for a retry right away.
+
+A partial check must only report violations that no continuation can
+fix (e.g. a banned substring already written). Soft rules such as a
+minimum length stay in the full validator.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+
+from pipeline.llm_client import load_env
+from pipeline.transform.retry_scheduler import Aborted
+
+PartialCheck = Callable[[str], Optional[str]]
+
+# Deltas that complete a word; checks run only then
+_BOUNDARY = re.compile(r"[\s.,;:!?\"')\]}]")
+
+
+@dataclass
+class StreamStats:
+    streams: int = 0
+    aborted: int = 0
+    # Output characters received before the aborts
+    aborted_chars: int = 0
+
+    def report(self, label: str):
+        if self.streams:
+            print(
+                f"[+] {label}: {self.streams} streamed, {self.aborted} aborted early "
+                f"({self.aborted_chars} chars received before abort)"
+            )
+
+
+STATS = StreamStats()
+
+
+def streaming_enabled() -> bool:
+    """LLM_STREAM=0 falls back to plain (non-streaming) requests."""
+    load_env()
+    return os.getenv("LLM_STREAM", "1") != "0"
+
+
+def stream_text(client, check: PartialCheck, **request) -> Union[str, Aborted]:
+    """
+    Responses API request streamed through `check`. Returns the full
+    output text, or Aborted(reason, partial_text) once `check` reports a
+    violation.
+    """
+    STATS.streams += 1
+    text = ""
+
+    stream = client.responses.create(stream=True, **request)
+    try:
+        for event in stream:
+            if event.type != "response.output_text.delta":
+                continue
+
+            text += event.delta
+            if not _BOUNDARY.search(event.delta):
+                continue
+
+            reason = check(text)
+            if reason:
+                STATS.aborted += 1
+                STATS.aborted_chars += len(text)
+                return Aborted(reason, text.strip())
+    finally:
+        stream.close()
+
+    return text.strip()
+
+
+def generate(client, check: PartialCheck, **request) -> Union[str, Aborted]:
+    """stream_text() when streaming is enabled, else a plain request's output text."""
+    if streaming_enabled():
+        return stream_text(client, check, **request)
+    return client.responses.create(**request).output_text.strip()
@@ -0,0 +1,316 @@
+# pipeline/transform/structured_output.py
+
+"""
+Structured (JSON) output for the LLM generators.
+
+- One JSON schema per generator, sent as the Responses API `text.format`
+  (strict json_schema), so the model returns JSON instead of free text.
+- parse_json(): tolerant parser for whatever comes back — code fences,
+  prose around the JSON, trailing commas, Python literals, and output cut
+  off mid-object are repaired instead of failing the whole call.
+- StreamingJSONParser: the same repair applied to a growing buffer, giving
+  the best-effort partial value while a response is still streaming.
+
+Only output that is still not JSON after repair (or fails validation)
+should cost a regeneration call.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+DEFAULT_MODEL = "gpt-4o-mini"
+
+_FENCE = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```|$)", re.S | re.I)
+_BARE_WORDS = {"True": "true", "False": "false", "None": "null"}
+_CLOSER = {"{": "}", "[": "]"}
+
+# Cut points tried (newest first) when the repaired text still fails
+_MAX_CUTS = 8
+
+
+class StructuredOutputError(ValueError):
+    """Raised when model output can't be repaired into JSON."""
+
+
+# -------------------------------------------------------------------
+# Schemas
+# -------------------------------------------------------------------
+def _enum_or_null(values: Sequence[str]) -> Dict:
+    return {"type": ["string", "null"], "enum": [*values, None]}
+
+
+def _object(properties: Dict[str, Dict]) -> Dict:
+    # strict mode: every property required, nothing else allowed
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def axes_schema(allowed: Sequence[str]) -> Dict:
+    """axis_generator: 2 primary + 1 secondary axis from the genre's list."""
+    return _object({
+        "primary": {"type": "array", "items": {"type": "string", "enum": list(allowed)}},
+        "secondary": _enum_or_null(allowed),
+    })
+
+
+def movie_axes_schema(candidates: Sequence[str]) -> Dict:
+    """axis_extractor: primary axes + optional secondary axis from the ontology."""
+    return _object({
+        "primary_axes": {"type": "array", "items": {"type": "string", "enum": list(candidates)}},
+        "secondary_axis": _enum_or_null(candidates),
+    })
+
+
+def capsules_schema(axes: Sequence[str]) -> Dict:
+    """emotional_capsule_generator: {axis, emotion, text} capsules."""
+    capsule = _object({
+        "axis": {"type": "string", "enum": list(axes)},
+        "emotion": {"type": "string"},
+        "text": {"type": "string"},
+    })
+    return _object({"capsules": {"type": "array", "items": capsule}})
+
+
+def anchor_list_schema(types: Sequence[str]) -> Dict:
+    anchor = _object({
+        "label": {"type": "string"},
+        "descriptor": {"type": "string"},
+        "type": {"type": "string", "enum": list(types)},
+    })
+    return {"type": "array", "items": anchor}
+
+
+def anchors_schema(types: Sequence[str]) -> Dict:
+    """character_anchor_extractor: 1–3 {label, descriptor, type} anchors."""
+    return _object({"anchors": anchor_list_schema(types)})
+
+
+def packed_schema(item: Dict[str, Dict]) -> Dict:
+    """Packed prompts: one {movie_id, ...item} object per movie."""
+    return _object({
+        "items": {"type": "array", "items": _object({"movie_id": {"type": "integer"}, **item})},
+    })
+
+
+def json_format(name: str, schema: Dict) -> Dict:
+    """`text=` argument of client.responses.create for a strict JSON schema."""
+    return {"format": {"type": "json_schema", "name": name, "schema": schema, "strict": True}}
+
+
+# -------------------------------------------------------------------
+# Tolerant parsing
+# -------------------------------------------------------------------
+def _scan(text: str) -> Tuple[str, List[str], bool, List[int]]:
+    """
+    One pass over (possibly truncated) JSON text. Returns the normalized
+    text (trailing commas dropped, Python literals mapped), the brackets
+    still open, whether it ends inside a string, and cut points (offsets
+    in the normalized text) where a shorter prefix is structurally sound.
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    cuts: List[int] = []
+    in_string = escape = False
+    i, n = 0, len(text)
+
+    while i < n:
+        ch = text[i]
+
+        if in_string:
+            out.append(ch)
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            i += 1
+            continue
+
+        if ch == '"':
+            in_string = True
+            out.append(ch)
+        elif ch in "{[":
+            stack.append(ch)
+            out.append(ch)
+            cuts.append(len(out))
+        elif ch in "}]":
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack and _CLOSER[stack[-1]] == ch:
+                stack.pop()
+            out.append(ch)
+        elif ch == ",":
+            cuts.append(len(out))
+            out.append(ch)
+        elif ch.isalpha():
+            j = i
+            while j < n and text[j].isalpha():
+                j += 1
+            word = text[i:j]
+            out.append(_BARE_WORDS.get(word, word))
+            i = j
+            continue
+        else:
+            out.append(ch)
+        i += 1
+
+    return "".join(out), stack, in_string, cuts
+
+
+def _close(text: str, stack: List[str], in_string: bool) -> str:
+    """Completes a truncated prefix: open string, dangling separator, brackets."""
+    if in_string:
+        text += '"'
+    text = text.rstrip()
+    if text.endswith(","):
+        text = text[:-1]
+    if text.endswith(":"):
+        text += " null"
+    return text + "".join(_CLOSER[c] for c in reversed(stack))
+
+
+def _json_start(text: str) -> int:
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        raise StructuredOutputError("no JSON object or array in output")
+    return min(starts)
+
+
+def _decode(text: str) -> Any:
+    # raw_decode ignores prose after the JSON value
+    return json.JSONDecoder().raw_decode(text)[0]
+
+
+def parse_json(text: str) -> Any:
+    """
+    Parses model output into a JSON value, repairing what it can.
+    Raises StructuredOutputError if nothing usable is left.
+    """
+    text = (text or "").strip()
+    fenced = _FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+
+    text = text[_json_start(text):]
+
+    try:
+        return _decode(text)
+    except ValueError:
+        pass
+
+    normalized, stack, in_string, cuts = _scan(text)
+    try:
+        return _decode(_close(normalized, stack, in_string))
+    except ValueError:
+        pass
+
+    # e.g. a dangling key ('{"a": 1, "b"'): fall back to the last sound prefix
+    for cut in reversed(cuts[-_MAX_CUTS:]):
+        prefix, stack, in_string, _ = _scan(normalized[:cut])
+        try:
+            return _decode(_close(prefix, stack, in_string))
+        except ValueError:
+            continue
+
+    raise StructuredOutputError(f"unrepairable JSON: {text[:80]!r}")
+
+
+class StreamingJSONParser:
+    """
+    Feed response deltas as they arrive; value() is the best-effort parse
+    of everything so far (None until something parses). Parsing happens
+    in value(), at most once per batch of new deltas.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._value: Any = None
+        self._stale = False
+
+    def feed(self, delta: str):
+        if delta:
+            self.text += delta
+            self._stale = True
+
+    def value(self) -> Any:
+        if self._stale:
+            try:
+                self._value = parse_json(self.text)
+            except StructuredOutputError:
+                pass
+            self._stale = False
+        return self._value
+
+    @property
+    def complete(self) -> bool:
+        """True once the top-level value has been closed."""
+        try:
+            start = _json_start(self.text)
+        except StructuredOutputError:
+            return False
+        _, stack, in_string, _ = _scan(self.text[start:])
+        return not stack and not in_string
+
+
+# -------------------------------------------------------------------
+# Request helper
+# -------------------------------------------------------------------
+def create_structured(
+    client: "OpenAI",
+    prompt: str,
+    name: str,
+    schema: Dict,
+    model: str = DEFAULT_MODEL,
+    instructions: Optional[str] = None,
+) -> Tuple[Optional[Any], str]:
+    """
+    One Responses API call constrained to `schema`; `instructions` is the
+    static prompt prefix, if the prompt is split (see prompt_registry).
+    Returns (parsed value or None if unrepairable, raw output text).
+    """
+    extra = {"instructions": instructions} if instructions else {}
+    resp = client.responses.create(
+        model=model,
+        input=prompt,
+        text=json_format(name, schema),
+        **extra,
+    )
+    raw = (resp.output_text or "").strip()
+
+    try:
+        return parse_json(raw), raw
+    except StructuredOutputError:
+        return None, raw
+
+
+def items(value: Any, key: str) -> List:
+    """The list under `key`, or the value itself when the model returned a bare list."""
+    if isinstance(value, dict):
+        value = value.get(key)
+    return value if isinstance(value, list) else []
+
+
+def keyed_items(value: Any, key: str = "items") -> Dict[int, Dict]:
+    """Packed response → {movie_id: item}; items without a usable id are dropped."""
+    keyed = {}
+    for item in items(value, key):
+        if not isinstance(item, dict):
+            continue
+        try:
+            keyed[int(item.get("movie_id"))] = item
+        except (TypeError, ValueError):
+            continue
+    return keyed
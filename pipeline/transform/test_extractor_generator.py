@@ -8,46 +8,29 @@ No writes. Console output only.
 """
 
 import os
-import json
+import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
 # -------------------------------------------------
 # Environment
 # -------------------------------------------------
 ROOT = Path(__file__).resolve().parents[2]
-load_dotenv(ROOT / ".env")
+sys.path.append(str(ROOT))
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    raise RuntimeError("OPENAI_API_KEY missing")
-
-from openai import OpenAI
-client = OpenAI(api_key=OPENAI_API_KEY)
+from pipeline.llm_client import get_client, load_env
+from pipeline.transform.axis_ontology import ONTOLOGY
+from pipeline.transform.silver_io import scan_silver
 
 MODEL = "gpt-4o-mini"
-SILVER = ROOT / "data" / "silver" / "movies_silver_validated.json"
+SILVER = ROOT / "data" / "silver" / "movies_silver_validated.parquet"
 
 TEST_MOVIE_COUNT = 5
 
 # -------------------------------------------------
-# Human-defined ontology
+# Human-defined ontology (pipeline.transform.axis_ontology)
 # -------------------------------------------------
 
-EMOTIONAL_AXES = [
-    "Belonging ↔ Isolation",
-    "Agency ↔ Powerlessness",
-    "Order ↔ Chaos",
-    "Identity ↔ Mask",
-    "Hope ↔ Despair",
-    "Innocence ↔ Corruption",
-    "Loyalty ↔ Betrayal",
-    "Control ↔ Surrender",
-    "Love ↔ Loss",
-    "Truth ↔ Illusion",
-    "Safety ↔ Threat",
-    "Purpose ↔ Emptiness"
-]
+EMOTIONAL_AXES = list(ONTOLOGY.names)
 
 EMOTIONAL_TEXTURE = [
     "tender", "volatile", "wistful", "exhilarating", "oppressive",
@@ -127,7 +110,7 @@ Text:
 # -------------------------------------------------
 
 def generate(prompt):
-    resp = client.responses.create(
+    resp = get_client().responses.create(
         model=MODEL,
         input=prompt
     )
@@ -138,8 +121,11 @@ def generate(prompt):
 # -------------------------------------------------
 
 def run_test():
-    with open(SILVER, "r", encoding="utf-8") as f:
-        movies = json.load(f)
+    load_env()
+    if not os.getenv("OPENAI_API_KEY"):
+        raise RuntimeError("OPENAI_API_KEY missing")
+
+    movies = scan_silver(SILVER).head(TEST_MOVIE_COUNT).collect().to_dicts()
 
     print(f"\n[TEST] Ontology-driven generation for {TEST_MOVIE_COUNT} movies\n")
 
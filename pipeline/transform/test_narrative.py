@@ -17,27 +17,22 @@ Rules enforced:
 """
 
 import os
-import json
+import sys
 import re
 from pathlib import Path
-from dotenv import load_dotenv
 
 # -------------------------------------------------
 # Load environment
 # -------------------------------------------------
 ROOT = Path(__file__).resolve().parents[2]
-load_dotenv(ROOT / ".env")
+sys.path.append(str(ROOT))
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    raise RuntimeError("OPENAI_API_KEY missing")
-
-from openai import OpenAI
-client = OpenAI(api_key=OPENAI_API_KEY)
+from pipeline.llm_client import get_client, load_env
+from pipeline.transform.silver_io import scan_silver
 
 MODEL = "gpt-4o-mini"
 
-SILVER = ROOT / "data" / "silver" / "movies_silver_validated.json"
+SILVER = ROOT / "data" / "silver" / "movies_silver_validated.parquet"
 TEST_MOVIE_COUNT = 5
 
 # -------------------------------------------------
@@ -106,7 +101,7 @@ def is_valid_premise(text):
 # -------------------------------------------------
 
 def generate_premise(title, overview):
-    resp = client.responses.create(
+    resp = get_client().responses.create(
         model=MODEL,
         input=premise_prompt(title, overview)
     )
@@ -117,8 +112,11 @@ def generate_premise(title, overview):
 # -------------------------------------------------
 
 def run_test():
-    with open(SILVER, "r", encoding="utf-8") as f:
-        movies = json.load(f)
+    load_env()
+    if not os.getenv("OPENAI_API_KEY"):
+        raise RuntimeError("OPENAI_API_KEY missing")
+
+    movies = scan_silver(SILVER).head(TEST_MOVIE_COUNT).collect().to_dicts()
 
     print(f"\n[TEST] Literal Premise Extraction — {TEST_MOVIE_COUNT} movies\n")
 
@@ -0,0 +1,149 @@
+# pipeline/transform/text_cleaning.py
+
+"""
+Text normalization, one string at a time or a whole column at once.
+
+Two cleaners:
+- review text (clean_text / clean_texts): NFKD, drop control characters,
+  strip HTML tags, collapse whitespace
+- display text such as titles and overviews (clean_printable /
+  clean_printable_texts): NFKC, drop everything str.isprintable() rejects
+
+The bulk versions clean all texts they haven't seen before in one Polars
+pass and memoize results by input text, so the same review cleaned by
+several stages (or repeated across movies) is processed once.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Callable, Dict, List, Optional, Sequence
+
+from pipeline.lazy import lazy_import
+
+pl = lazy_import("polars")
+
+_re_html = re.compile(r"<[^>]+>")
+_re_whitespace = re.compile(r"\s+")
+# Regex to match ALL C0 and C1 control characters (non-printing/ambiguous)
+_re_control_chars = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+
+# Everything str.isprintable() rejects: categories C* and Z* except the ASCII space
+_NON_PRINTABLE = r"[[\p{C}\p{Z}]&&[^\x20]]"
+
+# Below this many new texts a Polars pass costs more than the Python loop
+MIN_BATCH = 64
+# Memoized texts per cleaner before the memo is reset
+MEMO_SIZE = 200_000
+
+
+class _PrintableTable(dict):
+    """str.translate table dropping non-printables, filled per code point on first use."""
+
+    def __missing__(self, code: int) -> Optional[int]:
+        self[code] = code if chr(code).isprintable() else None
+        return self[code]
+
+
+_PRINTABLE = _PrintableTable()
+
+
+# -------------------------------------------------------------------
+# Single text
+# -------------------------------------------------------------------
+def clean_text(text: str) -> str:
+    if not text:
+        return ""
+
+    # 1. Unicode Normalization: Converts complex characters into canonical forms.
+    # This addresses many ambiguous character issues immediately.
+    t = unicodedata.normalize('NFKD', text)
+
+    # 2. Control Character Stripping: Removes non-printing/ambiguous characters.
+    t = _re_control_chars.sub("", t)
+
+    # 3. HTML/Tag Stripping
+    t = _re_html.sub(" ", t)
+
+    # 4. Collapse all remaining whitespace (including newlines and multiple spaces)
+    t = _re_whitespace.sub(" ", t)
+
+    return t.strip()
+
+
+def clean_printable(text: str) -> str:
+    """NFKC, drop non-printables (control / zero-width chars), strip."""
+    if not text:
+        return text
+
+    return unicodedata.normalize("NFKC", text).translate(_PRINTABLE).strip()
+
+
+# -------------------------------------------------------------------
+# Column expressions
+# -------------------------------------------------------------------
+def clean_text_expr(expr: pl.Expr) -> pl.Expr:
+    """clean_text() as a column expression."""
+    return (
+        expr.str.normalize("NFKD")
+        .str.replace_all(_re_control_chars.pattern, "")
+        .str.replace_all(_re_html.pattern, " ")
+        .str.replace_all(_re_whitespace.pattern, " ")
+        .str.strip_chars()
+        .fill_null("")
+    )
+
+
+def clean_printable_expr(expr: pl.Expr) -> pl.Expr:
+    """clean_printable() as a column expression."""
+    return (
+        expr.str.normalize("NFKC")
+        .str.replace_all(_NON_PRINTABLE, "")
+        .str.strip_chars()
+    )
+
+
+# -------------------------------------------------------------------
+# Bulk (memoized)
+# -------------------------------------------------------------------
+_memos: Dict[str, Dict[str, str]] = {"text": {}, "printable": {}}
+
+
+def _clean_bulk(
+    texts: Sequence[str],
+    memo: Dict[str, str],
+    expr: Callable[[pl.Expr], pl.Expr],
+    one: Callable[[str], str],
+) -> List[str]:
+    new = list(dict.fromkeys(t for t in texts if t and t not in memo))
+
+    if len(new) >= MIN_BATCH:
+        cleaned = (
+            pl.DataFrame({"t": new}, schema={"t": pl.Utf8})
+            .select(expr(pl.col("t")))["t"]
+            .to_list()
+        )
+    else:
+        cleaned = [one(t) for t in new]
+
+    fresh = dict(zip(new, cleaned))
+    out = [
+        one(t) if not t else fresh[t] if t in fresh else memo[t]
+        for t in texts
+    ]
+
+    if len(memo) + len(fresh) > MEMO_SIZE:
+        memo.clear()
+    memo.update(fresh)
+    return out
+
+
+def clean_texts(texts: Sequence[str]) -> List[str]:
+    """clean_text() for a whole column of texts, in order."""
+    return _clean_bulk(texts, _memos["text"], clean_text_expr, clean_text)
+
+
+def clean_printable_texts(texts: Sequence[str]) -> List[str]:
+    """clean_printable() for a whole column of texts, in order."""
+    return _clean_bulk(texts, _memos["printable"], clean_printable_expr, clean_printable)
@@ -7,6 +7,7 @@ Validates:
 - category counts
 - referential integrity
 - missing or orphaned entries
+- genre bitmasks vs movie_genres
 """
 
 import duckdb
@@ -16,6 +17,22 @@ ROOT = Path(__file__).resolve().parents[1]
 DB_PATH = ROOT / "cheerbox.db"
 
 
+def check_genre_bitmasks(con):
+    mask_mismatch = con.execute("""
+        SELECT b.movie_id, b.genre_mask, coalesce(x.mask, 0) AS expected
+        FROM movie_bitsets b
+        LEFT JOIN (
+            SELECT mg.movie_id, bit_or(1::BIGINT << d.bit) AS mask
+            FROM movie_genres mg
+            JOIN bit_dimensions d ON d.kind = 'genre' AND d.key = CAST(mg.genre_id AS TEXT)
+            GROUP BY mg.movie_id
+        ) x ON x.movie_id = b.movie_id
+        WHERE b.genre_mask <> coalesce(x.mask, 0);
+    """).fetchdf()
+
+    print(mask_mismatch if not mask_mismatch.empty else "✓ genre_mask matches movie_genres", "\n")
+
+
 def run():
     print(f"[*] Connecting to DuckDB at: {DB_PATH}\n")
     con = duckdb.connect(DB_PATH)
@@ -97,6 +114,16 @@ def run():
 
     print(missing_categories if not missing_categories.empty else "✓ All movies have source categories", "\n")
 
+    # ----------------------------
+    # Bitmasks agree with the link tables
+    # ----------------------------
+    print("=== GENRE BITMASKS ===")
+    tables = {r[0] for r in con.execute("SELECT table_name FROM duckdb_tables();").fetchall()}
+    if not {"movie_bitsets", "bit_dimensions"} <= tables:
+        print("[!] Skipped: no movie_bitsets / bit_dimensions (rebuild with db_setup after gold-bitsets)", "\n")
+    else:
+        check_genre_bitmasks(con)
+
     # ----------------------------
     # Sample rows preview
     # ----------------------------